@@ -3,6 +3,7 @@ from core.worker import Worker
 from core.board import Board
 from core.tile import Tile
 from actions.action_result import ActionResult
+from actions.undo_record import UndoRecord
 
 
 class Action(ABC):
@@ -17,15 +18,32 @@ class Action(ABC):
         Execute the action and return what should happen next.
         Empty ActionResult = continue normally.
         ActionResult with additional_actions = insert those actions.
+        The result's undo_record can be passed to undo() to reverse the action.
         """
         pass
 
+    @abstractmethod
+    def undo(self, worker: Worker, board: Board, record: UndoRecord) -> None:
+        """Restore the exact state before execute() from its undo record."""
+        pass
+
     def validate(self, worker: Worker, board: Board, tile: Tile) -> bool:
         """
         Return True if this action *can* be applied to (worker,board,tile).
         Default = always valid; subclasses override.
         """
         return True
+
+    def get_valid_mask(self, worker: Worker, board: Board) -> int:
+        """
+        Return the bitboard mask of tiles this action can be applied to.
+        Default = every tile that passes validate(); subclasses override with bitboard queries.
+        """
+        mask = 0
+        for index in range(board.state.size):
+            if self.validate(worker, board, board.get_tile_at_index(index)):
+                mask |= 1 << index
+        return mask
     
     @property
     def optional(self) -> bool:
@@ -1,21 +1,28 @@
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from actions.action import Action
+    from actions.undo_record import UndoRecord
 
 
 
 class ActionResult:
     """Result of action execution. Empty = continue normally, with actions = add them."""
     
-    def __init__(self, additional_actions: List['Action'] = None):
+    def __init__(self, additional_actions: List['Action'] = None, undo_record: Optional['UndoRecord'] = None):
         self._additional_actions: List['Action'] = additional_actions or []
+        self._undo_record = undo_record
 
     @property
     def additional_actions(self) -> List['Action']:
         """Get the additional actions."""
         return self._additional_actions
     
+    @property
+    def undo_record(self) -> Optional['UndoRecord']:
+        """Get the record needed to undo the executed action."""
+        return self._undo_record
+    
     def has_additional_actions(self) -> bool:
         """Check if this result contains additional actions to add."""
         return len(self.additional_actions) > 0
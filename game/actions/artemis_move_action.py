@@ -6,6 +6,14 @@ from core.board import Board
 
 class ArtemisMoveAction(MoveAction):
     """Represents the action of moving a worker to a new tile with Artemis's special ability."""
+    def get_valid_mask(self, worker: Worker, board: Board) -> int:
+        """Return the mask of valid moves, excluding the tile the worker just left."""
+        mask = super().get_valid_mask(worker, board)
+        forbidden = worker.previous_position
+        if forbidden is not None and board.in_bounds(forbidden):
+            mask &= ~(1 << board.state.index(forbidden.x, forbidden.y))
+        return mask
+
     def validate(self, worker: Worker, board: Board, tile: Tile) -> bool:
         """Override the validate method to include Artemis's special ability constraint."""
         
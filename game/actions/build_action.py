@@ -5,11 +5,14 @@ from buildings.block  import Block
 from utils.validator import Validator
 from core.tile import Tile
 from actions.action_result import ActionResult
+from actions.undo_record import UndoRecord
 
 class BuildAction(Action):
     """Represents the action of building on a tile."""
     def execute(self, worker: Worker, board: Board, tile: Tile) -> ActionResult:
         """Execute the build action on the given tile."""
+        marker = board.state.set_built_at(tile.index)
+        record = UndoRecord(worker, tile, building=tile.building, previous_build_pos=worker.previous_build_pos, marker=marker)
 
         # Check if the tile is empty and has no building
         if tile.building is None:
@@ -25,9 +28,19 @@ class BuildAction(Action):
         worker.previous_build_pos = tile.position
         
         # Standard build - no additional actions
-        return ActionResult()
+        return ActionResult(undo_record=record)
+
+    def undo(self, worker: Worker, board: Board, record: UndoRecord) -> None:
+        """Restore the replaced building and the worker's previous build position."""
+        record.target.building = record.building
+        worker.previous_build_pos = record.previous_build_pos
+        board.state.set_built_at(record.marker)
 
         
+    def get_valid_mask(self, worker: Worker, board: Board) -> int:
+        """Return the mask of tiles the worker can build on."""
+        return Validator.get_valid_build_mask(worker, board)
+
     def validate(self, worker: Worker, board: Board, tile: Tile) -> bool:
         """Validate the build action."""
-        return tile in Validator.get_valid_build_tiles(worker, board)
+        return (Validator.get_valid_build_mask(worker, board) >> tile.index) & 1 == 1
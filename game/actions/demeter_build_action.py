@@ -7,6 +7,14 @@ from core.board import Board
 
 class DemeterBuildAction(BuildAction):
     """Represents the action of building on a tile with Demeter's special ability."""
+    def get_valid_mask(self, worker: Worker, board: Board) -> int:
+        """Return the mask of valid builds, excluding the tile the worker just built on."""
+        mask = super().get_valid_mask(worker, board)
+        forbidden = worker.previous_build_pos
+        if forbidden is not None and board.in_bounds(forbidden):
+            mask &= ~(1 << board.state.index(forbidden.x, forbidden.y))
+        return mask
+
     def validate(self, worker: Worker, board: Board, tile: Tile) -> bool:
         """Override the validate method to include Demeter's special ability constraint."""
         
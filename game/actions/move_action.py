@@ -4,6 +4,7 @@ from core.board    import Board
 from utils.validator import Validator
 from core.tile import Tile
 from actions.action_result import ActionResult
+from actions.undo_record import UndoRecord
 
 class MoveAction(Action):
     """Represents the action of moving a worker to a new tile."""
@@ -15,6 +16,8 @@ class MoveAction(Action):
 
         # 1) Remove the worker from its old tile
         old_tile = board.get_tile(worker.position)
+        marker = board.state.set_moved_from(old_tile.index)
+        record = UndoRecord(worker, new_tile, source=old_tile, previous_position=worker.previous_position, marker=marker)
         old_tile.worker = None
 
         # 2) Move the worker to the new tile
@@ -24,8 +27,19 @@ class MoveAction(Action):
         worker.position = tile.position
         
         # Standard move - no additional actions
-        return ActionResult()
+        return ActionResult(undo_record=record)
+
+    def undo(self, worker: Worker, board: Board, record: UndoRecord) -> None:
+        """Move the worker back to the tile it left and restore its previous position."""
+        record.target.worker = None
+        record.source.worker = worker
+        worker.restore_position(record.source.position, record.previous_position)
+        board.state.set_moved_from(record.marker)
+
+    def get_valid_mask(self, worker: Worker, board: Board) -> int:
+        """Return the mask of tiles the worker can move to."""
+        return Validator.get_valid_move_mask(worker, board)
 
     def validate(self, worker: Worker, board: Board, tile: Tile) -> bool:
         """Validate the move action."""
-        return tile in Validator.get_valid_move_tiles(worker, board)
\ No newline at end of file
+        return (Validator.get_valid_move_mask(worker, board) >> tile.index) & 1 == 1
\ No newline at end of file
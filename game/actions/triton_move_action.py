@@ -17,16 +17,16 @@ class TritonMoveAction(MoveAction):
     def execute(self, worker: Worker, board: Board, tile: Tile) -> ActionResult:
         """Execute the move and check if we should add another optional move."""
         # First, perform the standard move using parent class
-        super().execute(worker, board, tile)
+        result = super().execute(worker, board, tile)
         
         # Then check if destination is perimeter space for chaining
         if self._is_perimeter_space(tile.position, board):
             # Add another optional TritonMoveAction for chaining
             next_move = TritonMoveAction(optional=True)
-            return ActionResult([next_move])
+            return ActionResult([next_move], result.undo_record)
         else:
             # Normal move completion - no chaining
-            return ActionResult()
+            return result
     
     def _is_perimeter_space(self, position: Position, board: Board) -> bool:
         """Check if the position is on the perimeter of the board."""
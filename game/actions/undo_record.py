@@ -0,0 +1,68 @@
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from buildings.building import Building
+    from core.position import Position
+    from core.tile import Tile
+    from core.worker import Worker
+
+
+
+class UndoRecord:
+    """
+    Compact record of the state an action changed, so the action can be undone.
+
+    A move records the tile the worker left and its previous position;
+    a build records the building that was replaced and the worker's
+    previous build position. Both record the bitboard's previous per-turn
+    marker so the Zobrist hash is restored too.
+    """
+
+    __slots__ = ("_worker", "_target", "_source", "_previous_position", "_building", "_previous_build_pos", "_marker")
+
+    def __init__(self, worker: 'Worker', target: 'Tile', source: Optional['Tile'] = None,
+                 previous_position: Optional['Position'] = None, building: Optional['Building'] = None,
+                 previous_build_pos: Optional['Position'] = None, marker: Optional[int] = None) -> None:
+        """Initialize the record with the worker, the target tile and the replaced state."""
+        self._worker = worker
+        self._target = target
+        self._source = source
+        self._previous_position = previous_position
+        self._building = building
+        self._previous_build_pos = previous_build_pos
+        self._marker = marker
+
+    @property
+    def worker(self) -> 'Worker':
+        """Returns the worker that performed the action."""
+        return self._worker
+
+    @property
+    def target(self) -> 'Tile':
+        """Returns the tile the action was applied to."""
+        return self._target
+
+    @property
+    def source(self) -> Optional['Tile']:
+        """Returns the tile a moving worker left (None for builds)."""
+        return self._source
+
+    @property
+    def previous_position(self) -> Optional['Position']:
+        """Returns the worker's previous position before a move."""
+        return self._previous_position
+
+    @property
+    def building(self) -> Optional['Building']:
+        """Returns the building on the target tile before a build."""
+        return self._building
+
+    @property
+    def previous_build_pos(self) -> Optional['Position']:
+        """Returns the worker's previous build position before a build."""
+        return self._previous_build_pos
+
+    @property
+    def marker(self) -> Optional[int]:
+        """Returns the bitboard's per-turn marker (moved-from or built-at index) before the action."""
+        return self._marker
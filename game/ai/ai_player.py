@@ -0,0 +1,187 @@
+import multiprocessing
+import os
+import random
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import List, Optional
+
+from ai.alpha_beta_search import AlphaBetaSearch, SearchResult
+from ai.mcts_search import MCTSResult, MCTSSearch
+from ai.ponderer import Ponderer
+from colors.color import Color
+from core.board import Board
+from core.player import Player
+from game_management.turn import Turn
+
+
+# Copy of the player's configured search in its background move worker, kept warm between turns
+_worker_search: Optional[AlphaBetaSearch | MCTSSearch] = None
+_worker_cancel: Optional[multiprocessing.Value] = None
+
+
+def _init_move_worker(cancel_flag: multiprocessing.Value, search: AlphaBetaSearch | MCTSSearch) -> None:
+    """Executor initializer: keep the player's search and cancel flag, and yield the CPU to the user interface."""
+    global _worker_cancel, _worker_search
+    _worker_cancel = cancel_flag
+    _worker_search = search
+    if hasattr(os, "nice"):
+        os.nice(5)
+
+
+def _search_in_worker(players: List[Player], side: int, board: Board,
+                      time_limit: float, seed: Optional[int] = None) -> SearchResult | MCTSResult:
+    """Run a move search in the background worker process."""
+    search = _worker_search
+    if seed is not None:
+        search.seed(seed)
+    return search.search(players, side, board, time_limit=time_limit, cancel=lambda: _worker_cancel.value != 0)
+
+
+class AIPlayer(Player):
+    """
+    A player whose turns are chosen by search.
+
+    Alpha-beta search is used by default; an MCTSSearch can be passed in
+    instead. The thinking time per turn is a share of the time left on the
+    player's clock (capped at *think_time*); without a timer *think_time*
+    is used. The search object is kept between turns.
+
+    With pondering on, a background Ponderer prepares answers to the
+    opponent's likely turns while they think, and a prepared answer of at
+    least MIN_PONDER_DEPTH is played at once.
+
+    choose_turn() searches in the calling process; request_turn() runs the
+    search in a worker process instead and returns a Future, so a UI can
+    keep drawing frames while the computer thinks.
+
+    Once seeded, an MCTS player reseeds its search before every turn from
+    its own generator, in whichever process the search runs.
+    """
+
+    __slots__ = ("_search", "_think_time", "_last_result", "_ponderer", "_executor", "_cancel_flag", "_rng")
+
+    EXPECTED_TURNS_LEFT = 20
+    MIN_THINK_TIME = 0.05
+    MIN_PONDER_DEPTH = 2
+
+    def __init__(self, name: str, age: int, color: Color, god_card=None, timer_seconds: float = 300,
+                 think_time: float = 2.0, search: Optional[AlphaBetaSearch | MCTSSearch] = None,
+                 ponder: bool = False) -> None:
+        """Initializes a computer player with its search, thinking time and pondering."""
+        super().__init__(name, age, color, god_card=god_card, timer_seconds=timer_seconds)
+        self._search = search or AlphaBetaSearch()
+        self._think_time = think_time
+        self._last_result: Optional[SearchResult | MCTSResult] = None
+        self._ponderer: Optional[Ponderer] = Ponderer() if ponder else None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._cancel_flag: Optional[multiprocessing.Value] = None
+        self._rng: Optional[random.Random] = None
+
+    def __getstate__(self) -> tuple:
+        """Pickle without the search and ponderer, which stay in this process."""
+        slots = {name: getattr(self, name) for cls in type(self).__mro__
+                 for name in getattr(cls, "__slots__", ()) if hasattr(self, name)}
+        slots.update(_search=None, _last_result=None, _ponderer=None, _executor=None, _cancel_flag=None)
+        return None, slots
+
+    @property
+    def is_computer(self) -> bool:
+        """Returns True: the computer chooses this player's turns."""
+        return True
+
+    @property
+    def last_result(self) -> Optional[SearchResult | MCTSResult]:
+        """Returns the result of the most recent search (None before the first turn)."""
+        return self._last_result
+
+    def seed(self, seed: int) -> None:
+        """Seed the player's searches (only MCTS makes random choices)."""
+        self._rng = random.Random(seed)
+
+    def time_budget(self) -> float:
+        """Returns the number of seconds to spend on the next turn."""
+        remaining = self.get_remaining_time()
+        if remaining is None:
+            return self._think_time
+        return max(self.MIN_THINK_TIME, min(self._think_time, remaining / self.EXPECTED_TURNS_LEFT))
+
+    def choose_turn(self, players: List[Player], board: Board) -> Optional[Turn]:
+        """Search the position and return the turn to play (None if there is no legal turn)."""
+        pondered = self._pondered_result(board)
+        if pondered is not None:
+            self._last_result = pondered
+            return pondered.turn
+
+        seed = self._next_search_seed()
+        if seed is not None:
+            self._search.seed(seed)
+        self._last_result = self._search.search(players, players.index(self), board, time_limit=self.time_budget())
+        return self._last_result.turn
+
+    def request_turn(self, players: List[Player], board: Board) -> Future:
+        """
+        Start choosing a turn without blocking.
+
+        Returns a Future for the search result (its turn is None if there is
+        no legal turn). A pondered answer completes it immediately; otherwise
+        the search runs in the player's own worker process. The worker is
+        given a copy of the player's search (with its evaluator, table and
+        other settings) when it starts and keeps it warm for later turns.
+        """
+        pondered = self._pondered_result(board)
+        if pondered is not None:
+            future = Future()
+            future.set_result(pondered)
+            self._last_result = pondered
+            return future
+
+        if self._executor is None:
+            self._cancel_flag = multiprocessing.Value("i", 0)
+            self._executor = ProcessPoolExecutor(max_workers=1, initializer=_init_move_worker,
+                                                 initargs=(self._cancel_flag, self._search))
+        self._cancel_flag.value = 0
+        future = self._executor.submit(_search_in_worker, players, players.index(self),
+                                       board, self.time_budget(), self._next_search_seed())
+        future.add_done_callback(self._store_result)
+        return future
+
+    def cancel_turn_request(self) -> None:
+        """Stop a search started by request_turn()."""
+        if self._cancel_flag is not None:
+            self._cancel_flag.value = 1
+
+    def handle_turn_end(self, current_player: Player, players: List[Player], board: Board) -> None:
+        """Cancel stale pondering, and start pondering when the opponent is to move."""
+        if self._ponderer is None:
+            return
+        self._ponderer.cancel()
+        if current_player is not self:
+            self._ponderer.start(players, players.index(self), board)
+
+    def close(self) -> None:
+        """Stop background pondering and any background move search."""
+        if self._ponderer is not None:
+            self._ponderer.close()
+        if self._executor is not None:
+            self.cancel_turn_request()
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _next_search_seed(self) -> Optional[int]:
+        """Returns the seed for the next search, or None if the player is unseeded or its search is not random."""
+        if self._rng is None or not isinstance(self._search, MCTSSearch):
+            return None
+        return self._rng.getrandbits(64)
+
+    def _pondered_result(self, board: Board) -> Optional[SearchResult]:
+        """Returns a pondered answer for the position deep enough to play, or None."""
+        if self._ponderer is None:
+            return None
+        pondered = self._ponderer.lookup(board.state.position_hash)
+        if pondered is not None and pondered.depth >= self.MIN_PONDER_DEPTH:
+            return pondered
+        return None
+
+    def _store_result(self, future: Future) -> None:
+        """Keep the result of a finished background search."""
+        if not future.cancelled() and future.exception() is None:
+            self._last_result = future.result()
@@ -0,0 +1,346 @@
+import time
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional
+
+from ai.evaluator import Evaluator
+from ai.move_ordering import MoveOrdering
+from ai.transposition_table import TranspositionTable
+from core.board import Board
+from core.player import Player
+from game_management.turn import Turn
+from game_management.turn_generator import TurnGenerator
+
+if TYPE_CHECKING:
+    from ai.batch_evaluator import BatchEvaluator, PositionBatch
+
+
+class SearchResult:
+    """Outcome of one search: the chosen turn plus search statistics."""
+
+    __slots__ = ("_turn", "_score", "_depth", "_nodes", "_elapsed")
+
+    def __init__(self, turn: Optional[Turn], score: int, depth: int, nodes: int, elapsed: float) -> None:
+        """Initialize the result of a search."""
+        self._turn = turn
+        self._score = score
+        self._depth = depth
+        self._nodes = nodes
+        self._elapsed = elapsed
+
+    @property
+    def turn(self) -> Optional[Turn]:
+        """Returns the best turn found (None if the player has no legal turn)."""
+        return self._turn
+
+    @property
+    def score(self) -> int:
+        """Returns the score of the best turn for the player to move."""
+        return self._score
+
+    @property
+    def depth(self) -> int:
+        """Returns the deepest fully completed iteration (in turns)."""
+        return self._depth
+
+    @property
+    def nodes(self) -> int:
+        """Returns the number of positions visited."""
+        return self._nodes
+
+    @property
+    def elapsed(self) -> float:
+        """Returns the search time in seconds."""
+        return self._elapsed
+
+    @property
+    def nodes_per_second(self) -> float:
+        """Returns the search speed."""
+        return self._nodes / self._elapsed if self._elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        """Returns a readable summary of the result."""
+        return (f"SearchResult({self._turn}, score={self._score}, depth={self._depth}, "
+                f"nodes={self._nodes}, nps={self.nodes_per_second:,.0f})")
+
+
+class AlphaBetaSearch:
+    """
+    Negamax alpha-beta search over complete turns.
+
+    Turns come from the TurnGenerator and are searched in place: the
+    generator leaves the board in each turn's final state while yielding
+    it, so a child is reached by handing the move to the opponent and
+    undoing that again. Iterative deepening runs until the time budget is
+    spent, and the transposition table (which outlives a single search)
+    supplies cut-offs and the best turn of earlier iterations, which is
+    searched first. Above the last turn before the horizon, the remaining
+    turns come from the generator's ordered mode, refined by the killer
+    and history tables of a MoveOrdering (order_moves=False searches them
+    in plain generation order).
+
+    The bitboard's threat index settles two cases without searching: a
+    player to move with a threat wins on the spot, so a turn that leaves
+    the opponent a threat is a loss (the must-block rule of the standard
+    win condition).
+
+    With a BatchEvaluator, nodes one turn above the horizon generate all
+    their turns and score the resulting positions in a single vectorized
+    call instead of one evaluation per child.
+    """
+
+    WIN_SCORE = 1_000_000
+    INFINITY = WIN_SCORE + 1
+    MAX_DEPTH = 64
+    CLOCK_CHECK_INTERVAL = 256
+    MIN_ORDERING_DEPTH = 2
+
+    def __init__(self, evaluator: Optional[Evaluator] = None, table: Optional[TranspositionTable] = None,
+                 generator: Optional[TurnGenerator] = None,
+                 batch_evaluator: Optional['BatchEvaluator'] = None,
+                 order_moves: bool = True) -> None:
+        """
+        Initialize the search with its evaluator, transposition table and turn generator.
+
+        Any table with the TranspositionTable probe()/store() interface can be
+        used, e.g. a SharedTranspositionTable for a parallel search.
+        """
+        self._evaluator = evaluator or Evaluator()
+        self._batch_evaluator = batch_evaluator
+        self._frontier_batch: Optional['PositionBatch'] = None
+        self._ordering = MoveOrdering() if order_moves else None
+        self._table = table or TranspositionTable()
+        self._generator = generator or TurnGenerator()
+        self._players: List[Player] = []
+        self._board: Optional[Board] = None
+        self._deadline = 0.0
+        self._cancel: Optional[Callable[[], bool]] = None
+        self._nodes = 0
+        self._stopped = False
+
+    @property
+    def table(self) -> TranspositionTable:
+        """Returns the transposition table."""
+        return self._table
+
+    def search(self, players: List[Player], side: int, board: Board, time_limit: Optional[float] = None,
+               max_depth: Optional[int] = None, start_depth: int = 1,
+               cancel: Optional[Callable[[], bool]] = None) -> SearchResult:
+        """
+        Find the best turn for players[side] on *board*.
+
+        Deepens one turn at a time from *start_depth* until *time_limit*
+        seconds have passed, *max_depth* is reached or *cancel* returns True
+        (it is polled with the clock); at least one full iteration is needed
+        to return a turn chosen by search. The board is left unchanged.
+        """
+        if time_limit is None and max_depth is None:
+            raise ValueError("A search needs a time limit or a maximum depth.")
+
+        self._cancel = cancel
+        if self._ordering is not None:
+            self._ordering.new_search()
+        if self._batch_evaluator is not None:
+            self._frontier_batch = self._batch_evaluator.new_batch(board.width, board.height)
+        self._players = players
+        self._board = board
+        self._nodes = 0
+        self._stopped = False
+        start = time.perf_counter()
+        self._deadline = start + time_limit if time_limit is not None else float("inf")
+
+        best_turn: Optional[Turn] = None
+        best_score = 0
+        completed = 0
+        for depth in range(start_depth, (max_depth or self.MAX_DEPTH) + 1):
+            turn, score = self._search_root(side, depth)
+            if self._stopped:
+                # Keep the last complete iteration unless nothing finished
+                if best_turn is None:
+                    best_turn, best_score = turn, score
+                break
+            best_turn, best_score, completed = turn, score, depth
+            if turn is None or abs(score) >= self.WIN_SCORE - self.MAX_DEPTH:
+                break
+
+        return SearchResult(best_turn, best_score, completed, self._nodes, time.perf_counter() - start)
+
+    def _search_root(self, side: int, depth: int) -> tuple:
+        """Search the root position to *depth*; returns (best turn, score)."""
+        key = self._board.state.position_hash
+        entry = self._table.probe(key)
+        hint = entry[4] if entry is not None else None
+
+        alpha, beta = -self.INFINITY, self.INFINITY
+        best_turn: Optional[Turn] = None
+        children = self._children(self._players[side], hint, depth, 0)
+        try:
+            for turn in children:
+                score = self._child_score(turn, side, depth, alpha, beta, 0)
+                if self._stopped:
+                    break
+                if best_turn is None or score > alpha:
+                    best_turn, alpha = turn, score
+        finally:
+            children.close()
+
+        if best_turn is None:
+            return None, -self.WIN_SCORE
+        if not self._stopped:
+            self._table.store(key, depth, alpha, TranspositionTable.EXACT, best_turn)
+        return best_turn, alpha
+
+    def _negamax(self, side: int, depth: int, alpha: int, beta: int, ply: int) -> int:
+        """Score the position for players[side], who is to move."""
+        self._nodes += 1
+        if self._nodes % self.CLOCK_CHECK_INTERVAL == 0 and (
+                time.perf_counter() > self._deadline or (self._cancel is not None and self._cancel())):
+            self._stopped = True
+            return 0
+
+        state = self._board.state
+        player = self._players[side]
+        if state.threat_mask(player.player_color):
+            return self.WIN_SCORE - ply - 1
+        if depth == 0:
+            opponent = self._players[1 - side]
+            return self._evaluator.evaluate(state, player.player_color, opponent.player_color)
+
+        key = state.position_hash
+        entry = self._table.probe(key)
+        hint = None
+        if entry is not None:
+            _, entry_depth, entry_score, flag, hint = entry
+            if entry_depth >= depth:
+                entry_score = self._score_from_table(entry_score, ply)
+                if flag == TranspositionTable.EXACT:
+                    return entry_score
+                if flag == TranspositionTable.LOWER_BOUND:
+                    alpha = max(alpha, entry_score)
+                else:
+                    beta = min(beta, entry_score)
+                if alpha >= beta:
+                    return entry_score
+
+        if depth == 1 and self._batch_evaluator is not None:
+            return self._evaluate_frontier(side, key, ply)
+
+        original_alpha = alpha
+        best_score = -self.INFINITY
+        best_turn: Optional[Turn] = None
+        children = self._children(player, hint, depth, ply)
+        try:
+            for turn in children:
+                score = self._child_score(turn, side, depth, alpha, beta, ply)
+                if self._stopped:
+                    return 0
+                if score > best_score:
+                    best_score, best_turn = score, turn
+                if score > alpha:
+                    alpha = score
+                if alpha >= beta:
+                    if self._ordering is not None and not turn.is_win:
+                        self._ordering.record_cutoff(turn, depth, ply)
+                    break
+        finally:
+            children.close()
+
+        # A player who cannot complete a turn loses
+        if best_turn is None:
+            return -(self.WIN_SCORE - ply)
+
+        if best_score <= original_alpha:
+            flag = TranspositionTable.UPPER_BOUND
+        elif best_score >= beta:
+            flag = TranspositionTable.LOWER_BOUND
+        else:
+            flag = TranspositionTable.EXACT
+        self._table.store(key, depth, self._score_to_table(best_score, ply), flag, best_turn)
+        return best_score
+
+    def _evaluate_frontier(self, side: int, key: int, ply: int) -> int:
+        """Score a node one turn above the horizon by evaluating all of its children in one batch."""
+        state = self._board.state
+        player, opponent = self._players[side], self._players[1 - side]
+        batch = self._frontier_batch
+        batch.clear()
+        turns: List[Turn] = []
+        unblocked: List[int] = []
+        best_turn: Optional[Turn] = None
+        children = self._generator.generate(player, self._board)
+        try:
+            for turn in children:
+                self._nodes += 1
+                if turn.is_win:
+                    best_score, best_turn = self.WIN_SCORE - ply - 1, turn
+                    break
+                if state.threat_mask(opponent.player_color):
+                    unblocked.append(len(turns))
+                batch.add(state, player.player_color, opponent.player_color)
+                turns.append(turn)
+        finally:
+            children.close()
+
+        if best_turn is None:
+            # A player who cannot complete a turn loses
+            if not turns:
+                return -(self.WIN_SCORE - ply)
+            scores = self._batch_evaluator.evaluate_batch(batch)
+            # The opponent wins at once after a turn that leaves a threat
+            scores[unblocked] = -(self.WIN_SCORE - ply - 2)
+            best = int(scores.argmax())
+            best_score, best_turn = int(scores[best]), turns[best]
+
+        self._table.store(key, 1, self._score_to_table(best_score, ply), TranspositionTable.EXACT, best_turn)
+        return best_score
+
+    def _child_score(self, turn: Turn, side: int, depth: int, alpha: int, beta: int, ply: int) -> int:
+        """Score a turn whose final state is on the board, for the player who played it."""
+        if turn.is_win:
+            return self.WIN_SCORE - ply - 1
+        state = self._board.state
+        markers = state.end_turn()
+        try:
+            return -self._negamax(1 - side, depth - 1, -beta, -alpha, ply + 1)
+        finally:
+            state.undo_end_turn(markers)
+
+    def _children(self, player: Player, hint: Optional[Turn], depth: int, ply: int) -> Iterator[Turn]:
+        """
+        Yield the player's turns with the board in each turn's final state.
+
+        The transposition table's best turn goes first; it is played with
+        apply_turn() and taken back before the remaining turns are generated,
+        in order when the search has a MoveOrdering.
+        """
+        if hint is not None:
+            history = self._generator.apply_turn(hint, player, self._board)
+            try:
+                yield hint
+            finally:
+                self._generator.undo_turn(history, self._board)
+
+        if self._ordering is not None and depth >= self.MIN_ORDERING_DEPTH:
+            turns = self._generator.generate_ordered(player, self._board, self._ordering.ranker(ply))
+        else:
+            turns = self._generator.generate(player, self._board)
+        try:
+            for turn in turns:
+                if turn != hint:
+                    yield turn
+        finally:
+            turns.close()
+
+    def _score_to_table(self, score: int, ply: int) -> int:
+        """Make a win/loss score relative to the stored position."""
+        if score >= self.WIN_SCORE - self.MAX_DEPTH * 2:
+            return score + ply
+        if score <= -(self.WIN_SCORE - self.MAX_DEPTH * 2):
+            return score - ply
+        return score
+
+    def _score_from_table(self, score: int, ply: int) -> int:
+        """Make a stored win/loss score relative to the root again."""
+        if score >= self.WIN_SCORE - self.MAX_DEPTH * 2:
+            return score - ply
+        if score <= -(self.WIN_SCORE - self.MAX_DEPTH * 2):
+            return score + ply
+        return score
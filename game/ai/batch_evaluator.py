@@ -0,0 +1,144 @@
+from typing import Dict, Tuple
+
+import numpy as np
+
+from ai.evaluator import Evaluator
+from colors.color import Color
+from core.adjacency import Adjacency
+from core.bit_board import BitBoard
+
+
+# Set bits per byte value, for NumPy before 2.0, which has no np.bitwise_count
+_BYTE_POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+
+def _popcount(masks: np.ndarray) -> np.ndarray:
+    """Returns the number of set bits of each uint64 mask, as int64."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(masks).astype(np.int64)
+    masks = np.ascontiguousarray(masks, dtype=np.uint64)
+    return _BYTE_POPCOUNT[masks.view(np.uint8)].reshape(masks.shape + (8,)).sum(axis=-1, dtype=np.int64)
+
+
+class PositionBatch:
+    """
+    A batch of positions waiting for one vectorized evaluation.
+
+    Each position is stored as six bitboard masks (levels 1-3, domes, the
+    scoring player's workers, the opponent's workers), so adding one costs
+    a few integer copies and no per-tile work.
+    """
+
+    COLUMNS = 6
+
+    def __init__(self, width: int, height: int, capacity: int = 64) -> None:
+        """Create an empty batch for boards of the given size."""
+        self._width = width
+        self._height = height
+        self._masks = np.zeros((capacity, self.COLUMNS), dtype=np.uint64)
+        self._count = 0
+
+    @property
+    def width(self) -> int:
+        """Returns the board width of the positions."""
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """Returns the board height of the positions."""
+        return self._height
+
+    @property
+    def masks(self) -> np.ndarray:
+        """Returns the (positions, 6) mask array of the added positions."""
+        return self._masks[:self._count]
+
+    def __len__(self) -> int:
+        """Returns the number of positions in the batch."""
+        return self._count
+
+    def add(self, state: BitBoard, color: Color, opponent: Color) -> int:
+        """Add the position on *state*, to be scored for *color*; returns its row in the batch."""
+        if self._count == len(self._masks):
+            self._masks = np.concatenate([self._masks, np.zeros_like(self._masks)])
+        self._masks[self._count] = (state.level_mask(1), state.level_mask(2), state.level_mask(3),
+                                    state.domes, state.worker_mask(color), state.worker_mask(opponent))
+        self._count += 1
+        return self._count - 1
+
+    def clear(self) -> None:
+        """Remove every position (the storage is kept)."""
+        self._count = 0
+
+
+class BatchEvaluator:
+    """
+    Vectorized static evaluation of many positions at once with NumPy.
+
+    The workers of the whole batch are unpacked from their worker planes
+    into one flat array of (position, tile, side) entries; height,
+    mobility and climb threats are then computed for all of them together
+    with bitwise operations on the position masks and the tiles' adjacency
+    masks, so the number of NumPy calls does not depend on the batch size.
+    The score uses the same height, mobility and climb threat terms as
+    Evaluator, plus dome control: domes next to the opponent's workers
+    count for the player, domes next to the player's own workers against.
+    Scores are from the point of view of the player each position was
+    added for.
+    """
+
+    DOME_CONTROL_WEIGHT = 3
+
+    _adjacency_cache: Dict[Tuple[int, int], np.ndarray] = {}
+
+    def evaluate_batch(self, batch: PositionBatch) -> np.ndarray:
+        """Returns the score of every position in the batch as an int64 array."""
+        masks = batch.masks
+        scores = np.zeros(len(masks), dtype=np.int64)
+        if len(masks) == 0:
+            return scores
+        size = batch.width * batch.height
+        adjacency = self._adjacency(batch.width, batch.height)
+        level_1, level_2, level_3, domes, own, opponent = masks.T
+
+        # One entry per worker: its position's row, its tile and whose it is
+        shifts = np.arange(size, dtype=np.uint64)
+        planes = ((masks[:, 4:6, None] >> shifts) & np.uint64(1)).astype(bool)
+        rows, sides, tiles = np.nonzero(planes)
+        bits = np.uint64(1) << tiles.astype(np.uint64)
+        heights = ((level_1[rows] & bits) != 0) * 1 + ((level_2[rows] & bits) != 0) * 2 \
+            + ((level_3[rows] & bits) != 0) * 3
+
+        # Tiles each worker can step onto: free, and at most one level up
+        free = ~(own | opponent | domes)
+        climbable = np.stack([free & ~(level_2 | level_3), free & ~level_3, free, free])
+        neighbours = adjacency[tiles]
+        moves = neighbours & climbable[heights, rows]
+        threats = (heights == 2) & ((moves & level_3[rows]) != 0)
+
+        height_weights = np.array(Evaluator.HEIGHT_WEIGHTS, dtype=np.int64)
+        worker_scores = (height_weights[heights] + Evaluator.MOBILITY_WEIGHT * _popcount(moves)
+                         + Evaluator.THREAT_WEIGHT * threats
+                         - self.DOME_CONTROL_WEIGHT * _popcount(neighbours & domes[rows]))
+        np.add.at(scores, rows, np.where(sides == 0, worker_scores, -worker_scores))
+        return scores
+
+    def new_batch(self, width: int, height: int, capacity: int = 64) -> PositionBatch:
+        """Returns an empty batch for boards of the given size."""
+        return PositionBatch(width, height, capacity)
+
+    def evaluate(self, state: BitBoard, color: Color, opponent: Color) -> int:
+        """Score a single position for *color* (a batch of one)."""
+        batch = PositionBatch(state.width, state.height, capacity=1)
+        batch.add(state, color, opponent)
+        return int(self.evaluate_batch(batch)[0])
+
+    @classmethod
+    def _adjacency(cls, width: int, height: int) -> np.ndarray:
+        """Returns the adjacency mask of every tile as a uint64 array."""
+        key = (width, height)
+        masks = cls._adjacency_cache.get(key)
+        if masks is None:
+            masks = np.array(Adjacency.for_size(width, height).masks, dtype=np.uint64)
+            cls._adjacency_cache[key] = masks
+        return masks
@@ -0,0 +1,305 @@
+import time
+from typing import Callable, Dict, Iterator, List, Optional
+
+from actions.move_action import MoveAction
+from core.board import Board
+from core.player import Player
+from game_management.turn import Turn
+from game_management.turn_generator import TurnGenerator
+
+
+class SolveResult:
+    """Outcome of one solver run: whether a forced win was proven, and its line."""
+
+    __slots__ = ("_line", "_complete", "_nodes", "_elapsed")
+
+    def __init__(self, line: List[Turn], complete: bool, nodes: int, elapsed: float) -> None:
+        """Initialize the result of a solver run."""
+        self._line = line
+        self._complete = complete
+        self._nodes = nodes
+        self._elapsed = elapsed
+
+    @property
+    def is_win(self) -> bool:
+        """Returns True if the side to move has a proven forced win."""
+        return bool(self._line)
+
+    @property
+    def line(self) -> List[Turn]:
+        """Returns the proving line: the winner's turns and one defence in between (empty if none)."""
+        return self._line
+
+    @property
+    def plies(self) -> int:
+        """Returns the number of turns in the proving line (0 if there is no proven win)."""
+        return len(self._line)
+
+    @property
+    def complete(self) -> bool:
+        """Returns False if the time limit or cancel stopped the solver before the answer was proven."""
+        return self._complete
+
+    @property
+    def nodes(self) -> int:
+        """Returns the number of positions visited."""
+        return self._nodes
+
+    @property
+    def elapsed(self) -> float:
+        """Returns the solving time in seconds."""
+        return self._elapsed
+
+    def __repr__(self) -> str:
+        """Returns a readable summary of the result."""
+        outcome = f"win in {self.plies}" if self.is_win else ("no win" if self._complete else "unknown")
+        return f"SolveResult({outcome}, nodes={self._nodes}, elapsed={self._elapsed:.2f}s)"
+
+
+class _Stopped(Exception):
+    """Raised inside the solver when the time limit or cancel stops it."""
+
+
+class EndgameSolver:
+    """
+    Exact solver for "can the side to move force a win within N turns?".
+
+    A depth-first AND/OR search: at the attacker's nodes one winning turn
+    is enough, at the defender's nodes every reply must lose. Turns are
+    played in place with the generator's make/unmake and, away from the
+    horizon, tried best-first (wins, blocks, climbs). The bitboard's
+    threat index decides most nodes next to the horizon without
+    generating turns: an attacker with a threat wins at once, a defender
+    reply that leaves one loses, and a card with a single plain move
+    cannot win a turn without one.
+
+    Results are memoized by Zobrist position hash as proven bounds - the
+    fewest turns a win was proven in and the most turns it was refuted
+    in - so transpositions and the iterative deepening from one turn up
+    to N reuse all earlier work. The deepening also makes the proven win
+    the shortest one. Turns are counted for both sides, so a win on the
+    attacker's k-th turn takes 2k - 1.
+    """
+
+    CLOCK_CHECK_INTERVAL = 1024
+    ORDERING_HORIZON = 3
+
+    def __init__(self, generator: Optional[TurnGenerator] = None) -> None:
+        """Initialize the solver with the turn generator it plays turns with."""
+        self._generator = generator or TurnGenerator()
+        self._players: List[Player] = []
+        self._board: Optional[Board] = None
+        self._proven: Dict[int, int] = {}
+        self._refuted: Dict[int, int] = {}
+        self._best: Dict[int, Turn] = {}
+        self._moves_once: List[bool] = []
+        self._nodes = 0
+        self._deadline = 0.0
+        self._cancel: Optional[Callable[[], bool]] = None
+
+    def solve(self, players: List[Player], side: int, board: Board, max_plies: int,
+              time_limit: Optional[float] = None, cancel: Optional[Callable[[], bool]] = None) -> SolveResult:
+        """
+        Prove or refute a forced win for players[side] within *max_plies* turns.
+
+        Stops early, with an incomplete result, once *time_limit* seconds
+        have passed or *cancel* returns True. The board is left unchanged.
+        """
+        self._players = players
+        self._board = board
+        self._moves_once = [self._single_move(player) for player in players]
+        self._proven.clear()
+        self._refuted.clear()
+        self._best.clear()
+        self._nodes = 0
+        self._cancel = cancel
+        start = time.perf_counter()
+        self._deadline = start + time_limit if time_limit is not None else float("inf")
+
+        line: List[Turn] = []
+        complete = True
+        proven = 0
+        try:
+            for plies in range(1, max_plies + 1, 2):
+                if self._attack(side, plies):
+                    proven = plies
+                    break
+        except _Stopped:
+            complete = False
+        if proven:
+            # The win is proven; rebuilding its line may re-prove transpositions, which the clock must not cut short
+            self._deadline = float("inf")
+            self._cancel = None
+            line = self._principal_line(side, proven)
+        return SolveResult(line, complete, self._nodes, time.perf_counter() - start)
+
+    def _attack(self, side: int, plies: int) -> bool:
+        """Returns True if players[side], to move, wins within *plies* turns."""
+        state = self._board.state
+        key = state.position_hash
+        if self._proven.get(key, plies + 1) <= plies:
+            return True
+        if self._refuted.get(key, -1) >= plies:
+            return False
+        self._visit()
+
+        player = self._players[side]
+        if state.threat_mask(player.player_color):
+            # Wins with its next move; the turn is looked up when the line is built
+            self._proven[key] = 1
+            return True
+
+        # Without a threat a single-move card cannot win this turn, but e.g. Artemis can
+        won = False
+        if plies >= 3 or not self._moves_once[side]:
+            turns = self._turns(player, plies)
+            try:
+                for turn in turns:
+                    if turn.is_win:
+                        won = True
+                    elif plies >= 3 and not state.threats_against(player.player_color):
+                        markers = state.end_turn()
+                        try:
+                            won = self._defend(side, plies - 1)
+                        finally:
+                            state.undo_end_turn(markers)
+                    if won:
+                        self._best[key] = turn
+                        break
+            finally:
+                turns.close()
+
+        if won:
+            self._proven[key] = plies
+        else:
+            self._refuted[key] = plies
+        return won
+
+    def _defend(self, side: int, plies: int) -> bool:
+        """Returns True if every turn of the opponent of players[side], to move, loses within *plies*."""
+        state = self._board.state
+        key = state.position_hash
+        if self._proven.get(key, plies + 1) <= plies:
+            return True
+        if self._refuted.get(key, -1) >= plies:
+            return False
+        self._visit()
+
+        defender = self._players[1 - side]
+        if state.threat_mask(defender.player_color):
+            self._refuted[key] = plies
+            return False
+
+        lost = True
+        turns = self._turns(defender, plies)
+        try:
+            for turn in turns:
+                if turn.is_win:
+                    lost = False
+                else:
+                    markers = state.end_turn()
+                    try:
+                        lost = self._attack(side, plies - 1)
+                    finally:
+                        state.undo_end_turn(markers)
+                if not lost:
+                    break
+        finally:
+            turns.close()
+
+        # A defender without a legal turn loses as well
+        if lost:
+            self._proven[key] = plies
+        else:
+            self._refuted[key] = plies
+        return lost
+
+    @staticmethod
+    def _single_move(player: Player) -> bool:
+        """Returns True if the player's turn has exactly one plain move, so only a threat can win it."""
+        moves = [action for action in player.god_card.get_action_sequence() if isinstance(action, MoveAction)]
+        return len(moves) == 1 and type(moves[0]) is MoveAction
+
+    def _turns(self, player: Player, plies: int) -> Iterator[Turn]:
+        """
+        Yield the player's turns in place, best-first far from the horizon.
+
+        Close to the horizon most nodes are decided by the first turn or two
+        and the threat index, so generating and sorting every turn first
+        costs more than it saves there.
+        """
+        if plies > self.ORDERING_HORIZON:
+            return self._generator.generate_ordered(player, self._board)
+        return self._generator.generate(player, self._board)
+
+    def _winning_turn(self, player: Player) -> Turn:
+        """Returns the first turn that wins for *player* at once."""
+        turns = self._generator.generate_ordered(player, self._board)
+        try:
+            return next(turn for turn in turns if turn.is_win)
+        finally:
+            turns.close()
+
+    def _principal_line(self, side: int, plies: int) -> List[Turn]:
+        """
+        Rebuild the proven win by replaying the stored winning turns.
+
+        Between them the defender plays the reply the attacker needs the
+        most turns to beat, so the line shows the strongest defence.
+        """
+        board = self._board
+        state = board.state
+        line: List[Turn] = []
+        undo: list = []
+        try:
+            while True:
+                turn = self._best.get(state.position_hash)
+                if turn is None or state.threat_mask(self._players[side].player_color):
+                    turn = self._winning_turn(self._players[side])
+                line.append(turn)
+                history = self._generator.apply_turn(turn, self._players[side], board)
+                undo.append((history, state.end_turn()))
+                if turn.is_win:
+                    return line
+
+                reply = self._strongest_reply(side, plies - 2)
+                if reply is None:
+                    return line
+                line.append(reply)
+                history = self._generator.apply_turn(reply, self._players[1 - side], board)
+                undo.append((history, state.end_turn()))
+                plies -= 2
+        finally:
+            for history, markers in reversed(undo):
+                state.undo_end_turn(markers)
+                self._generator.undo_turn(history, board)
+
+    def _strongest_reply(self, side: int, plies: int) -> Optional[Turn]:
+        """Returns the defender reply whose refutation was proven in the most turns (None if stuck)."""
+        state = self._board.state
+        best: Optional[Turn] = None
+        best_plies = -1
+        turns = self._generator.generate(self._players[1 - side], self._board)
+        try:
+            for turn in turns:
+                markers = state.end_turn()
+                try:
+                    key = state.position_hash
+                    if key not in self._proven:
+                        # Not reached by the proof (e.g. a transposition); prove it again
+                        self._attack(side, plies)
+                    needed = self._proven.get(key, plies)
+                finally:
+                    state.undo_end_turn(markers)
+                if needed > best_plies:
+                    best, best_plies = turn, needed
+        finally:
+            turns.close()
+        return best
+
+    def _visit(self) -> None:
+        """Count a node and stop the solver when its budget is spent."""
+        self._nodes += 1
+        if self._nodes % self.CLOCK_CHECK_INTERVAL == 0 and (
+                time.perf_counter() > self._deadline or (self._cancel is not None and self._cancel())):
+            raise _Stopped()
@@ -0,0 +1,33 @@
+from colors.color import Color
+from core.bit_board import BitBoard
+
+
+class Evaluator:
+    """
+    Static evaluation of a position for alpha-beta leaf nodes.
+
+    Works directly on the bitboard and scores the position from the point
+    of view of *color*: worker height, mobility and climb threats (a worker
+    on level 2 next to a reachable level 3) count for the player and
+    against the opponent.
+    """
+
+    HEIGHT_WEIGHTS = (0, 10, 30, 60)
+    MOBILITY_WEIGHT = 2
+    THREAT_WEIGHT = 50
+
+    def evaluate(self, state: BitBoard, color: Color, opponent: Color) -> int:
+        """Returns the score of the position for *color* (positive = better for color)."""
+        return self._side_score(state, color) - self._side_score(state, opponent)
+
+    def _side_score(self, state: BitBoard, color: Color) -> int:
+        """Score the workers of one color."""
+        score = 0
+        level_3 = state.level_mask(3)
+        for index in BitBoard.iter_indices(state.worker_mask(color)):
+            level = state.level(index)
+            moves = state.move_mask(index)
+            score += self.HEIGHT_WEIGHTS[level] + self.MOBILITY_WEIGHT * moves.bit_count()
+            if level == 2 and moves & level_3:
+                score += self.THREAT_WEIGHT
+        return score
@@ -0,0 +1,90 @@
+import multiprocessing
+import time
+from typing import List, Optional
+
+from ai.alpha_beta_search import AlphaBetaSearch, SearchResult
+from ai.shared_transposition_table import SharedTranspositionTable
+from core.board import Board
+from core.player import Player
+
+
+# Alpha-beta search on the shared table, created once per pool worker
+_worker_search: Optional[AlphaBetaSearch] = None
+
+
+def _init_worker(table_name: str, size_bits: int, board_height: int) -> None:
+    """Pool initializer: attach to the shared transposition table."""
+    global _worker_search
+    table = SharedTranspositionTable(size_bits, board_height, name=table_name)
+    _worker_search = AlphaBetaSearch(table=table)
+
+
+def _run_search(task: tuple) -> SearchResult:
+    """Run one worker's iterative deepening search on the shared table."""
+    board, players, side, time_limit, max_depth, start_depth = task
+    return _worker_search.search(players, side, board, time_limit, max_depth, start_depth)
+
+
+class LazySMPSearch:
+    """
+    Lazy-SMP parallel alpha-beta search.
+
+    Every process of a multiprocessing pool runs the same iterative
+    deepening AlphaBetaSearch on the same root; they cooperate only through
+    a SharedTranspositionTable, whose cut-offs and best turns let each
+    process skip work another one has already done. Every other process
+    starts one turn deeper so the processes spread over the tree. The
+    answer comes from the process that completed the deepest iteration.
+    Call close() (or use it as a context manager) to stop the pool.
+    """
+
+    def __init__(self, processes: Optional[int] = None, table_bits: int = 20, board_height: int = 5) -> None:
+        """Start a pool of *processes* workers (default: one per CPU) sharing one table."""
+        self._processes = processes or multiprocessing.cpu_count()
+        self._table = SharedTranspositionTable(table_bits, board_height)
+        self._pool = multiprocessing.Pool(self._processes, initializer=_init_worker,
+                                          initargs=(self._table.name, table_bits, board_height))
+
+    @property
+    def processes(self) -> int:
+        """Returns the number of worker processes."""
+        return self._processes
+
+    @property
+    def table(self) -> SharedTranspositionTable:
+        """Returns the shared transposition table."""
+        return self._table
+
+    def search(self, players: List[Player], side: int, board: Board,
+               time_limit: Optional[float] = None, max_depth: Optional[int] = None) -> SearchResult:
+        """
+        Find the best turn for players[side] on *board*.
+
+        Takes the same arguments as AlphaBetaSearch.search(); the node count
+        of the result is the total over all processes.
+        """
+        if time_limit is None and max_depth is None:
+            raise ValueError("A search needs a time limit or a maximum depth.")
+
+        start = time.perf_counter()
+        tasks = [(board, players, side, time_limit, max_depth, 1 + worker % 2) for worker in range(self._processes)]
+        results = self._pool.map(_run_search, tasks)
+
+        # Prefer the deepest completed iteration; the first process breaks ties
+        best = max(results, key=lambda result: (result.depth, result.turn is not None))
+        nodes = sum(result.nodes for result in results)
+        return SearchResult(best.turn, best.score, best.depth, nodes, time.perf_counter() - start)
+
+    def close(self) -> None:
+        """Stop the worker pool and free the shared table."""
+        self._pool.close()
+        self._pool.join()
+        self._table.close()
+
+    def __enter__(self) -> 'LazySMPSearch':
+        """Use the search as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the pool when leaving the context."""
+        self.close()
@@ -0,0 +1,277 @@
+import math
+import random
+import time
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
+
+from actions.action import Action
+from actions.undo_record import UndoRecord
+from ai.random_playout import RandomPlayout
+from core.board import Board
+from core.player import Player
+from game_management.turn import Turn
+from game_management.turn_generator import TurnGenerator
+
+if TYPE_CHECKING:
+    from ai.batch_evaluator import BatchEvaluator
+
+
+class MCTSNode:
+    """
+    A node of the Monte Carlo search tree.
+
+    Wins are counted for the player who played the node's turn, so a parent
+    picks the child that is best for the player choosing between them.
+    """
+
+    __slots__ = ("parent", "turn", "side", "key", "children", "untried", "visits", "wins", "terminal_winner")
+
+    def __init__(self, parent: Optional['MCTSNode'], turn: Optional[Turn], side: int) -> None:
+        """Create a node for the position reached by *turn*, with players[side] to move."""
+        self.parent = parent
+        self.turn = turn
+        self.side = side
+        self.key: Optional[int] = None
+        self.children: List['MCTSNode'] = []
+        self.untried: Optional[List[Turn]] = None
+        self.visits = 0
+        self.wins = 0.0
+        self.terminal_winner: Optional[int] = None
+
+    def select_child(self, exploration: float) -> 'MCTSNode':
+        """Returns the child with the highest UCT value."""
+        log_visits = math.log(self.visits)
+        return max(self.children, key=lambda child: child.wins / child.visits
+                   + exploration * math.sqrt(log_visits / child.visits))
+
+
+class MCTSResult:
+    """Outcome of one Monte Carlo search: the chosen turn plus search statistics."""
+
+    __slots__ = ("_turn", "_visits", "_win_rate", "_playouts", "_elapsed")
+
+    def __init__(self, turn: Optional[Turn], visits: int, win_rate: float, playouts: int, elapsed: float) -> None:
+        """Initialize the result of a search."""
+        self._turn = turn
+        self._visits = visits
+        self._win_rate = win_rate
+        self._playouts = playouts
+        self._elapsed = elapsed
+
+    @property
+    def turn(self) -> Optional[Turn]:
+        """Returns the most visited turn (None if the player has no legal turn)."""
+        return self._turn
+
+    @property
+    def visits(self) -> int:
+        """Returns the number of visits of the chosen turn."""
+        return self._visits
+
+    @property
+    def win_rate(self) -> float:
+        """Returns the estimated win rate of the chosen turn."""
+        return self._win_rate
+
+    @property
+    def playouts(self) -> int:
+        """Returns the number of search iterations (one playout each)."""
+        return self._playouts
+
+    @property
+    def elapsed(self) -> float:
+        """Returns the search time in seconds."""
+        return self._elapsed
+
+    @property
+    def playouts_per_second(self) -> float:
+        """Returns the search speed."""
+        return self._playouts / self._elapsed if self._elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        """Returns a readable summary of the result."""
+        return (f"MCTSResult({self._turn}, visits={self._visits}, win_rate={self._win_rate:.3f}, "
+                f"playouts={self._playouts}, playouts/s={self.playouts_per_second:,.0f})")
+
+
+class MCTSSearch:
+    """
+    Monte Carlo tree search (UCT) over complete turns.
+
+    The tree is expanded with the TurnGenerator, so it follows the full god
+    card rules; each iteration walks down the tree by applying turns to the
+    board in place, runs one RandomPlayout from the new leaf and undoes the
+    walk again. The board is never copied and is unchanged afterwards.
+
+    With a BatchEvaluator, playouts are replaced by static evaluation:
+    each round selects up to *batch_size* leaves (a visit counted on the
+    way down acts as a virtual loss and spreads the round over the tree),
+    scores them in one vectorized call and backs up the squashed scores as
+    win probabilities.
+    """
+
+    EXPLORATION = math.sqrt(2)
+    BATCH_SIZE = 64
+    VALUE_SCALE = 100.0
+
+    def __init__(self, exploration: float = EXPLORATION, playout: Optional[RandomPlayout] = None,
+                 generator: Optional[TurnGenerator] = None, seed: Optional[int] = None,
+                 batch_evaluator: Optional['BatchEvaluator'] = None, batch_size: int = BATCH_SIZE) -> None:
+        """Initialize the search with its exploration constant, leaf evaluation and turn generator."""
+        self._exploration = exploration
+        self._playout = playout or RandomPlayout(random.Random(seed))
+        self._generator = generator or TurnGenerator()
+        self._batch_evaluator = batch_evaluator
+        self._batch_size = batch_size
+        self._started = 0.0
+
+    def seed(self, seed: int) -> None:
+        """Reseed the playouts, so a search with a playout budget can be repeated exactly."""
+        self._playout.seed(seed)
+
+    def search(self, players: List[Player], side: int, board: Board, time_limit: Optional[float] = None,
+               playouts: Optional[int] = None, cancel: Optional[Callable[[], bool]] = None) -> MCTSResult:
+        """
+        Find the best turn for players[side] on *board*.
+
+        Runs until *time_limit* seconds have passed, *playouts* iterations
+        are done or *cancel* returns True, whichever comes first.
+        """
+        root = self.build_tree(players, side, board, time_limit, playouts, cancel)
+        best = max(root.children, key=lambda child: child.visits, default=None)
+        elapsed = time.perf_counter() - self._started
+        if best is None:
+            return MCTSResult(None, 0, 0.0, root.visits, elapsed)
+        return MCTSResult(best.turn, best.visits, best.wins / best.visits, root.visits, elapsed)
+
+    def build_tree(self, players: List[Player], side: int, board: Board, time_limit: Optional[float] = None,
+                   playouts: Optional[int] = None, cancel: Optional[Callable[[], bool]] = None) -> MCTSNode:
+        """Run the search and return the root of the tree (its visits count the playouts)."""
+        if time_limit is None and playouts is None:
+            raise ValueError("A search needs a time limit or a playout budget.")
+
+        self._started = time.perf_counter()
+        deadline = self._started + time_limit if time_limit is not None else float("inf")
+        budget = playouts if playouts is not None else -1
+        colors = [player.player_color for player in players]
+        root = MCTSNode(None, None, side)
+        root.key = board.state.position_hash
+
+        while (budget < 0 or root.visits < budget) and time.perf_counter() < deadline:
+            if self._batch_evaluator is None:
+                self._iterate(root, players, colors, board)
+            else:
+                count = self._batch_size if budget < 0 else min(self._batch_size, budget - root.visits)
+                self._iterate_batch(root, players, board, count)
+            # A root without turns is decided after one iteration
+            if root.untried == [] and not root.children:
+                break
+            if cancel is not None and cancel():
+                break
+        return root
+
+    def _iterate(self, root: MCTSNode, players: List[Player], colors: List, board: Board) -> None:
+        """Select, expand, play out and back up once, leaving the board unchanged."""
+        state = board.state
+        path: List[Tuple[List[Tuple[Action, UndoRecord]], tuple]] = []
+        try:
+            node = self._descend(root, players, board, path)
+
+            # Simulation
+            winner = node.terminal_winner
+            if winner is None:
+                winner = self._playout.run(state, colors, node.side)
+        finally:
+            self._undo(path, board)
+
+        self._backpropagate(node, winner)
+
+    def _iterate_batch(self, root: MCTSNode, players: List[Player], board: Board, count: int) -> None:
+        """Select and expand up to *count* leaves, evaluate them in one batch and back up the values."""
+        state = board.state
+        batch = self._batch_evaluator.new_batch(board.width, board.height, count)
+        leaves: List[Tuple[MCTSNode, Optional[int]]] = []
+        for _ in range(count):
+            path: List[Tuple[List[Tuple[Action, UndoRecord]], tuple]] = []
+            try:
+                node = self._descend(root, players, board, path)
+                row = None
+                if node.terminal_winner is None:
+                    row = batch.add(state, players[node.side].player_color, players[1 - node.side].player_color)
+            finally:
+                self._undo(path, board)
+
+            # Virtual loss: the visit is counted now, the result once the batch is scored
+            visited = node
+            while visited is not None:
+                visited.visits += 1
+                visited = visited.parent
+            leaves.append((node, row))
+            if node is root:
+                break
+
+        scores = self._batch_evaluator.evaluate_batch(batch)
+        for node, row in leaves:
+            if row is None:
+                value = 1.0 if node.terminal_winner == node.side else 0.0
+            else:
+                value = 1.0 / (1.0 + math.exp(-float(scores[row]) / self.VALUE_SCALE))
+            self._backpropagate_value(node, value)
+
+    def _descend(self, root: MCTSNode, players: List[Player], board: Board, path: list) -> MCTSNode:
+        """Select a leaf and expand it by one child; returns the new node with its position on the board."""
+        node = root
+        # Selection: descend through fully expanded nodes
+        while node.terminal_winner is None and node.untried == [] and node.children:
+            node = self._select_child(node)
+            self._play(node, players, board, path)
+
+        # Expansion: list the turns of a new node, then add one child
+        if node.terminal_winner is None and node.untried is None:
+            node.untried = list(self._generator.generate(players[node.side], board))
+            node.untried.reverse()
+            if not node.untried:
+                node.terminal_winner = 1 - node.side
+
+        if node.terminal_winner is None:
+            child = MCTSNode(node, node.untried.pop(), 1 - node.side)
+            if child.turn.is_win:
+                child.terminal_winner = node.side
+            node.children.append(child)
+            node = child
+            self._play(node, players, board, path)
+        return node
+
+    def _undo(self, path: list, board: Board) -> None:
+        """Take back the turns played on the way down."""
+        state = board.state
+        for history, markers in reversed(path):
+            state.undo_end_turn(markers)
+            self._generator.undo_turn(history, board)
+
+    def _select_child(self, node: MCTSNode) -> MCTSNode:
+        """Returns the child to descend into from a fully expanded node."""
+        return node.select_child(self._exploration)
+
+    def _backpropagate(self, node: MCTSNode, winner: Optional[int]) -> None:
+        """Credit a playout result to each node on the path, for the player who moved into it."""
+        while node is not None:
+            node.visits += 1
+            if winner is None:
+                node.wins += 0.5
+            elif node.parent is not None and winner == node.parent.side:
+                node.wins += 1.0
+            node = node.parent
+
+    def _backpropagate_value(self, node: MCTSNode, value: float) -> None:
+        """Credit an evaluated leaf, where *value* is the win chance of the player to move at it."""
+        side = node.side
+        while node.parent is not None:
+            node.wins += value if node.parent.side == side else 1.0 - value
+            node = node.parent
+
+    def _play(self, node: MCTSNode, players: List[Player], board: Board, path: list) -> None:
+        """Apply the node's turn to the board and hand the move to the next player."""
+        history = self._generator.apply_turn(node.turn, players[node.parent.side], board)
+        path.append((history, board.state.end_turn()))
+        if node.key is None:
+            node.key = board.state.position_hash
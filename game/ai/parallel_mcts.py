@@ -0,0 +1,147 @@
+import multiprocessing
+import time
+from typing import Dict, List, Optional, Tuple
+
+from ai.mcts_search import MCTSResult, MCTSSearch
+from ai.shared_statistics import SharedStatistics
+from ai.shared_tree_search import SharedTreeSearch
+from core.board import Board
+from core.player import Player
+from game_management.turn import Turn
+
+
+# Shared statistics table attached once per pool worker (tree-parallel mode)
+_worker_statistics: Optional[SharedStatistics] = None
+
+
+def _init_worker(table_name: Optional[str], size_bits: int) -> None:
+    """Pool initializer: attach to the shared statistics table, if there is one."""
+    global _worker_statistics
+    if table_name is not None:
+        _worker_statistics = SharedStatistics(size_bits, name=table_name)
+
+
+def _run_root_search(task: tuple) -> Tuple[List[Tuple[Turn, int, float]], int]:
+    """Search an independent tree; returns the root children as (turn, visits, wins) and the playouts run."""
+    board, players, side, time_limit, playouts, seed = task
+    root = MCTSSearch(seed=seed).build_tree(players, side, board, time_limit, playouts)
+    return [(child.turn, child.visits, child.wins) for child in root.children], root.visits
+
+
+def _run_shared_search(task: tuple) -> Tuple[List[Tuple[Turn, int]], int]:
+    """Search into the shared table; returns the root children as (turn, position hash) and the playouts run."""
+    board, players, side, time_limit, playouts, seed = task
+    root = SharedTreeSearch(_worker_statistics, seed=seed).build_tree(players, side, board, time_limit, playouts)
+    return [(child.turn, child.key) for child in root.children], root.visits
+
+
+class ParallelMCTS:
+    """
+    MCTS spread over a multiprocessing pool.
+
+    ROOT mode runs an independent tree in every process and merges the
+    visit counts of the root's turns. SHARED_TREE mode lets every process
+    search one tree whose statistics sit in a SharedStatistics table, which
+    pays off for larger budgets. The position is sent to each worker, so
+    the caller's board is never touched. Call close() (or use it as a
+    context manager) to stop the pool.
+    """
+
+    ROOT = "root"
+    SHARED_TREE = "shared_tree"
+
+    def __init__(self, processes: Optional[int] = None, mode: str = ROOT,
+                 table_bits: int = 20, seed: Optional[int] = None) -> None:
+        """Start a pool of *processes* workers (default: one per CPU) for the given mode."""
+        if mode not in (self.ROOT, self.SHARED_TREE):
+            raise ValueError(f"Unknown parallel MCTS mode: {mode}")
+        self._processes = processes or multiprocessing.cpu_count()
+        self._mode = mode
+        self._seed = seed
+        self._searches = 0
+        self._statistics = SharedStatistics(table_bits) if mode == self.SHARED_TREE else None
+        table_name = self._statistics.name if self._statistics else None
+        self._pool = multiprocessing.Pool(self._processes, initializer=_init_worker,
+                                          initargs=(table_name, table_bits))
+
+    @property
+    def processes(self) -> int:
+        """Returns the number of worker processes."""
+        return self._processes
+
+    @property
+    def mode(self) -> str:
+        """Returns the parallel mode (ROOT or SHARED_TREE)."""
+        return self._mode
+
+    def search(self, players: List[Player], side: int, board: Board,
+               time_limit: Optional[float] = None, playouts: Optional[int] = None) -> MCTSResult:
+        """
+        Find the best turn for players[side] on *board*.
+
+        Every worker searches for *time_limit* seconds; a *playouts* budget
+        is split evenly between the workers.
+        """
+        if time_limit is None and playouts is None:
+            raise ValueError("A search needs a time limit or a playout budget.")
+
+        start = time.perf_counter()
+        if self._statistics is not None:
+            self._statistics.clear()
+        tasks = []
+        for worker in range(self._processes):
+            budget = None
+            if playouts is not None:
+                budget = playouts // self._processes + (1 if worker < playouts % self._processes else 0)
+            seed = None if self._seed is None else self._seed + self._searches * self._processes + worker
+            tasks.append((board, players, side, time_limit, budget, seed))
+        self._searches += 1
+
+        if self._mode == self.ROOT:
+            results = self._pool.map(_run_root_search, tasks)
+            turn_stats = self._merge_root_results(results)
+        else:
+            results = self._pool.map(_run_shared_search, tasks)
+            turn_stats = self._read_shared_results(results)
+
+        total_playouts = sum(count for _, count in results)
+        elapsed = time.perf_counter() - start
+        if not turn_stats:
+            return MCTSResult(None, 0, 0.0, total_playouts, elapsed)
+        turn, (visits, wins) = max(turn_stats.items(), key=lambda item: item[1][0])
+        return MCTSResult(turn, int(visits), wins / visits if visits else 0.0, total_playouts, elapsed)
+
+    def _merge_root_results(self, results: list) -> Dict[Turn, List[float]]:
+        """Sum the visits and wins of each root turn over the workers' trees."""
+        merged: Dict[Turn, List[float]] = {}
+        for children, _ in results:
+            for turn, visits, wins in children:
+                stats = merged.setdefault(turn, [0.0, 0.0])
+                stats[0] += visits
+                stats[1] += wins
+        return merged
+
+    def _read_shared_results(self, results: list) -> Dict[Turn, List[float]]:
+        """Look up each root turn's statistics in the shared table."""
+        stats: Dict[Turn, List[float]] = {}
+        for children, _ in results:
+            for turn, key in children:
+                if turn not in stats:
+                    stats[turn] = list(self._statistics.get(key))
+        return stats
+
+    def close(self) -> None:
+        """Stop the worker pool and free the shared table."""
+        self._pool.close()
+        self._pool.join()
+        if self._statistics is not None:
+            self._statistics.close()
+            self._statistics = None
+
+    def __enter__(self) -> 'ParallelMCTS':
+        """Use the search as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the pool when leaving the context."""
+        self.close()
@@ -0,0 +1,173 @@
+import multiprocessing
+import os
+import pickle
+import queue
+from typing import Dict, List, Optional
+
+from ai.alpha_beta_search import AlphaBetaSearch, SearchResult
+from ai.evaluator import Evaluator
+from core.board import Board
+from core.player import Player
+from game_management.turn import Turn
+from game_management.turn_generator import TurnGenerator
+
+
+def _predict_replies(players: List[Player], side: int, board: Board, generator: TurnGenerator,
+                     evaluator: Evaluator, count: int) -> List[Turn]:
+    """Returns the opponent's *count* most likely turns, best for the opponent first."""
+    opponent = players[1 - side]
+    scored = []
+    for turn in generator.generate(opponent, board):
+        if turn.is_win:
+            continue
+        score = evaluator.evaluate(board.state, opponent.player_color, players[side].player_color)
+        scored.append((score, len(scored), turn))
+    scored.sort(key=lambda item: (-item[0], item[1]))
+    return [turn for _, _, turn in scored[:count]]
+
+
+def _ponder_worker(tasks: multiprocessing.Queue, results: multiprocessing.Queue,
+                   generation: multiprocessing.Value, replies: int) -> None:
+    """
+    Background process: ponder each position sent on *tasks* until it goes stale.
+
+    A task is (generation, snapshot) where the snapshot is the pickled
+    (board, players, side) with the opponent of players[side] to move. The worker searches its reply to each likely
+    opponent turn one depth at a time, round-robin, and posts
+    (generation, position hash, SearchResult) after every completed depth.
+    The task is stale once the shared generation counter moves on. The
+    transposition table stays warm between tasks.
+    """
+    # Pondering must never compete with the user interface for the CPU
+    if hasattr(os, "nice"):
+        os.nice(10)
+
+    search = AlphaBetaSearch()
+    generator = TurnGenerator()
+    evaluator = Evaluator()
+    while True:
+        task = tasks.get()
+        if task is None:
+            return
+        task_generation, snapshot = task
+        board, players, side = pickle.loads(snapshot)
+
+        def is_stale() -> bool:
+            return generation.value != task_generation
+
+        predicted = _predict_replies(players, side, board, generator, evaluator, replies)
+        finished = set()
+        depth = 1
+        while not is_stale() and len(finished) < len(predicted) and depth <= AlphaBetaSearch.MAX_DEPTH:
+            for reply in predicted:
+                if is_stale():
+                    break
+                if reply in finished:
+                    continue
+                history = generator.apply_turn(reply, players[1 - side], board)
+                markers = board.state.end_turn()
+                key = board.state.position_hash
+                result = search.search(players, side, board, max_depth=depth, start_depth=depth, cancel=is_stale)
+                board.state.undo_end_turn(markers)
+                generator.undo_turn(history, board)
+
+                if result.depth == depth:
+                    results.put((task_generation, key, result))
+                    if result.turn is None or abs(result.score) >= AlphaBetaSearch.WIN_SCORE - AlphaBetaSearch.MAX_DEPTH:
+                        finished.add(reply)
+            depth += 1
+
+
+class Ponderer:
+    """
+    Thinks ahead in a background process while the opponent is to move.
+
+    start() hands the position to the worker, which predicts the opponent's
+    likely replies and searches the answer to each; cancel() stops that
+    search once the opponent has moved and collects what it found, and
+    lookup() returns the prepared answer when the actual position matches
+    one of the predictions. The worker runs at low priority, so pondering
+    does not slow down the user interface.
+    """
+
+    PREDICTED_REPLIES = 3
+
+    def __init__(self, replies: int = PREDICTED_REPLIES) -> None:
+        """Initialize the ponderer; its process starts on first use."""
+        self._replies = replies
+        self._tasks: Optional[multiprocessing.Queue] = None
+        self._results: Optional[multiprocessing.Queue] = None
+        self._generation: Optional[multiprocessing.Value] = None
+        self._process: Optional[multiprocessing.Process] = None
+        self._task_generation = 0
+        self._pondering = False
+        self._answers: Dict[int, SearchResult] = {}
+
+    @property
+    def is_pondering(self) -> bool:
+        """Returns True while a background search is running."""
+        return self._pondering
+
+    def start(self, players: List[Player], side: int, board: Board) -> None:
+        """Start pondering for players[side] while their opponent is to move on *board*."""
+        self.cancel()
+        if self._process is None:
+            self._start_process()
+        with self._generation.get_lock():
+            self._generation.value += 1
+            self._task_generation = self._generation.value
+        self._pondering = True
+        self._answers.clear()
+        # The queue pickles on a feeder thread, so take the snapshot now, before the board changes again
+        snapshot = pickle.dumps((board, players, side), pickle.HIGHEST_PROTOCOL)
+        self._tasks.put((self._task_generation, snapshot))
+
+    def cancel(self) -> None:
+        """Stop the running background search and keep the answers it prepared."""
+        if not self._pondering:
+            return
+        with self._generation.get_lock():
+            self._generation.value += 1
+        self._collect()
+        self._pondering = False
+
+    def lookup(self, key: int) -> Optional[SearchResult]:
+        """Returns the pondered answer for the position with this hash, or None on a miss."""
+        self._collect()
+        return self._answers.get(key)
+
+    def close(self) -> None:
+        """Stop the background process."""
+        if self._process is None:
+            return
+        self.cancel()
+        self._tasks.put(None)
+        self._process.join(timeout=1.0)
+        if self._process.is_alive():
+            self._process.terminate()
+        self._process = None
+
+    def _start_process(self) -> None:
+        """Create the queues and the worker process."""
+        self._tasks = multiprocessing.Queue()
+        self._results = multiprocessing.Queue()
+        self._generation = multiprocessing.Value("i", 0)
+        self._process = multiprocessing.Process(
+            target=_ponder_worker, args=(self._tasks, self._results, self._generation, self._replies), daemon=True
+        )
+        self._process.start()
+
+    def _collect(self) -> None:
+        """Move finished results of the current task into the answer table (deepest wins)."""
+        if self._results is None:
+            return
+        while True:
+            try:
+                task_generation, key, result = self._results.get_nowait()
+            except queue.Empty:
+                return
+            if task_generation != self._task_generation:
+                continue
+            known = self._answers.get(key)
+            if known is None or result.depth >= known.depth:
+                self._answers[key] = result
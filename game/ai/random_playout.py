@@ -0,0 +1,93 @@
+import random
+from typing import Dict, Optional, Sequence, Tuple
+
+from colors.color import Color
+from core.adjacency import Adjacency
+from core.bit_board import BitBoard
+
+
+class RandomPlayout:
+    """
+    Light random playouts for Monte Carlo search.
+
+    A playout reads the position once from the bitboard and then plays
+    random standard turns (move, then build) on plain integers: no Board,
+    Tile, Sequence or ActionResult objects are touched and the bitboard is
+    left unchanged. God powers are not modelled during playouts; the search
+    tree above them uses the full rules. A move onto level 3 is always
+    taken, as is the rule that a player who cannot move loses.
+    """
+
+    MAX_TURNS = 200
+
+    _index_cache: Dict[int, Tuple[int, ...]] = {}
+
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
+        """Initialize the playout policy with its random number generator."""
+        self._rng = rng or random.Random()
+
+    def seed(self, seed: int) -> None:
+        """Restart the random number generator from *seed*."""
+        self._rng.seed(seed)
+
+    def run(self, state: BitBoard, colors: Sequence[Color], side: int) -> Optional[int]:
+        """
+        Play random turns from the position with colors[side] to move.
+
+        Returns the index of the winning side, or None if the playout was cut
+        off after MAX_TURNS turns.
+        """
+        random_float = self._rng.random
+        cache = self._index_cache
+        neighbours = Adjacency.for_size(state.width, state.height).masks
+        levels = [state.level_mask(level) for level in range(BitBoard.MAX_LEVEL + 1)]
+        heights = [state.level(index) for index in range(state.size)]
+        domes = state.domes
+        workers = [state.worker_mask(color) for color in colors]
+
+        for _ in range(self.MAX_TURNS):
+            free = ~(workers[0] | workers[1] | domes)
+            climbable = (levels[0] | levels[1], levels[0] | levels[1] | levels[2],
+                         levels[0] | levels[1] | levels[2] | levels[3])
+
+            # Collect every (from, to) move; a climb to level 3 wins outright
+            moves = []
+            for source in cache.get(workers[side]) or self._indices_of(workers[side]):
+                height = heights[source]
+                targets = neighbours[source] & free & climbable[2 if height > 2 else height]
+                if height == 2 and targets & levels[3]:
+                    return side
+                for target in cache.get(targets) or self._indices_of(targets):
+                    moves.append((source, target))
+
+            # A player who cannot move loses
+            if not moves:
+                return 1 - side
+
+            source, target = moves[int(random_float() * len(moves))]
+            workers[side] ^= (1 << source) | (1 << target)
+
+            # Build on a random tile next to the moved worker (its old tile is always free)
+            builds = neighbours[target] & ~(workers[0] | workers[1] | domes)
+            builds = cache.get(builds) or self._indices_of(builds)
+            build = builds[int(random_float() * len(builds))]
+            build_bit = 1 << build
+            height = heights[build]
+            if height == BitBoard.MAX_LEVEL:
+                domes |= build_bit
+            else:
+                levels[height] ^= build_bit
+                levels[height + 1] |= build_bit
+                heights[build] = height + 1
+
+            side = 1 - side
+        return None
+
+    @classmethod
+    def _indices_of(cls, mask: int) -> Tuple[int, ...]:
+        """Returns the bit indices set in *mask*; cached, as playouts only ask about neighbourhoods."""
+        indices = cls._index_cache.get(mask)
+        if indices is None:
+            indices = tuple(BitBoard.iter_indices(mask))
+            cls._index_cache[mask] = indices
+        return indices
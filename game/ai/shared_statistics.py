@@ -0,0 +1,81 @@
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+
+
+class SharedStatistics:
+    """
+    MCTS visit and win counts in shared memory, keyed by Zobrist hash.
+
+    Every process of a tree-parallel search attaches to the same block, so
+    a position's statistics are shared no matter which process reached it.
+    The table has a fixed number of slots (a power of two) chosen by the
+    low bits of the hash; a different position landing on a slot takes it
+    over. Updates are not locked: concurrent writers can lose an update,
+    which only makes the statistics slightly noisier.
+    """
+
+    ENTRY_BYTES = 24
+
+    def __init__(self, size_bits: int = 20, name: Optional[str] = None) -> None:
+        """Create a new zeroed table with 2**size_bits slots, or attach to the table called *name*."""
+        slots = 1 << size_bits
+        if name is None:
+            self._memory = shared_memory.SharedMemory(create=True, size=slots * self.ENTRY_BYTES)
+            self._owner = True
+        else:
+            self._memory = shared_memory.SharedMemory(name=name)
+            self._owner = False
+        self._size_bits = size_bits
+        self._mask = slots - 1
+
+        buffer = self._memory.buf
+        self._keys = buffer[:slots * 8].cast("Q")
+        self._visits = buffer[slots * 8:slots * 16].cast("d")
+        self._wins = buffer[slots * 16:slots * 24].cast("d")
+        if self._owner:
+            self.clear()
+
+    @property
+    def name(self) -> str:
+        """Returns the name other processes attach with."""
+        return self._memory.name
+
+    @property
+    def size_bits(self) -> int:
+        """Returns log2 of the number of slots."""
+        return self._size_bits
+
+    def get(self, key: int) -> Tuple[float, float]:
+        """Returns the (visits, wins) recorded for a position, (0, 0) if unknown."""
+        slot = key & self._mask
+        if self._keys[slot] != key:
+            return 0.0, 0.0
+        return self._visits[slot], self._wins[slot]
+
+    def visits(self, key: int) -> float:
+        """Returns the visits recorded for a position."""
+        slot = key & self._mask
+        return self._visits[slot] if self._keys[slot] == key else 0.0
+
+    def add(self, key: int, visits: float, wins: float) -> None:
+        """Add visits and wins to a position's statistics."""
+        slot = key & self._mask
+        if self._keys[slot] != key:
+            self._keys[slot] = key
+            self._visits[slot] = 0.0
+            self._wins[slot] = 0.0
+        self._visits[slot] += visits
+        self._wins[slot] += wins
+
+    def clear(self) -> None:
+        """Reset every slot."""
+        self._memory.buf[:] = bytes(len(self._memory.buf))
+
+    def close(self) -> None:
+        """Detach from the table; the creating process also frees it."""
+        self._keys.release()
+        self._visits.release()
+        self._wins.release()
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
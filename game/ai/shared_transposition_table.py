@@ -0,0 +1,127 @@
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+
+import numpy as np
+
+from core.position import Position
+from game_management.turn import Turn
+
+
+class SharedTranspositionTable:
+    """
+    Transposition table in shared memory for parallel alpha-beta search.
+
+    Drop-in replacement for TranspositionTable: the slots are a NumPy
+    structured array inside a multiprocessing.shared_memory block, so every
+    process of a Lazy-SMP search reads and writes the same table. Entries
+    are lock-free: each slot stores its data words plus a check word
+    (key XOR data), and a slot torn by a concurrent write fails the check
+    and reads as a miss.
+
+    The best turn is packed into a 64-bit word of 6-bit tile indices, so
+    boards of up to 63 tiles and turns of up to MAX_STEPS actions keep
+    their best turn; longer turns are stored without one.
+    """
+
+    EXACT = 0
+    LOWER_BOUND = 1
+    UPPER_BOUND = 2
+
+    MAX_STEPS = 10
+    SKIPPED_STEP = 63
+    NO_TURN = 15
+    SCORE_OFFSET = 1 << 31
+
+    ENTRY_DTYPE = np.dtype([("check", np.uint64), ("meta", np.uint64), ("steps", np.uint64)])
+
+    def __init__(self, size_bits: int = 18, board_height: int = 5, name: Optional[str] = None) -> None:
+        """Create a new empty table with 2**size_bits slots, or attach to the table called *name*."""
+        slots = 1 << size_bits
+        if name is None:
+            self._memory = shared_memory.SharedMemory(create=True, size=slots * self.ENTRY_DTYPE.itemsize)
+            self._owner = True
+        else:
+            self._memory = shared_memory.SharedMemory(name=name)
+            self._owner = False
+        self._entries = np.ndarray((slots,), dtype=self.ENTRY_DTYPE, buffer=self._memory.buf)
+        self._size_bits = size_bits
+        self._mask = slots - 1
+        self._board_height = board_height
+        if self._owner:
+            self.clear()
+
+    @property
+    def name(self) -> str:
+        """Returns the name other processes attach with."""
+        return self._memory.name
+
+    @property
+    def size_bits(self) -> int:
+        """Returns log2 of the number of slots."""
+        return self._size_bits
+
+    @property
+    def capacity(self) -> int:
+        """Returns the number of slots in the table."""
+        return len(self._entries)
+
+    def probe(self, key: int) -> Optional[Tuple[int, int, int, int, Optional[Turn]]]:
+        """Returns the (key, depth, score, flag, best turn) entry for a position, or None."""
+        check, meta, steps = self._entries[key & self._mask].item()
+        if check ^ meta ^ steps != key or meta == 0:
+            return None
+        depth = meta & 0xFF
+        flag = (meta >> 8) & 0x3
+        score = ((meta >> 10) & 0xFFFFFFFF) - self.SCORE_OFFSET
+        return key, depth, score, flag, self._unpack_turn(meta >> 42, steps)
+
+    def store(self, key: int, depth: int, score: int, flag: int, best_turn: Optional[Turn]) -> None:
+        """Store the result of searching a position to *depth*."""
+        slot = key & self._mask
+        check, meta, steps = self._entries[slot].item()
+        if meta and check ^ meta ^ steps == key and (meta & 0xFF) > depth:
+            return
+        turn_meta, steps = self._pack_turn(best_turn)
+        meta = depth | (flag << 8) | ((score + self.SCORE_OFFSET) << 10) | (turn_meta << 42)
+        self._entries[slot] = (key ^ meta ^ steps, meta, steps)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.fill(0)
+
+    def close(self) -> None:
+        """Detach from the table; the creating process also frees it."""
+        del self._entries
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+
+    def _pack_turn(self, turn: Optional[Turn]) -> Tuple[int, int]:
+        """Pack a turn into (worker index | step count << 6 | is_win << 10, step indices)."""
+        if turn is None or len(turn.steps) > self.MAX_STEPS:
+            return self.NO_TURN << 6, 0
+        steps = 0
+        for i, target in enumerate(turn.steps):
+            index = self.SKIPPED_STEP if target is None else self._index(target)
+            steps |= index << (6 * i)
+        worker = self._index(turn.worker_position)
+        return worker | (len(turn.steps) << 6) | (int(turn.is_win) << 10), steps
+
+    def _unpack_turn(self, turn_meta: int, steps: int) -> Optional[Turn]:
+        """Rebuild a turn packed by _pack_turn()."""
+        count = (turn_meta >> 6) & 0xF
+        if count == self.NO_TURN:
+            return None
+        targets = []
+        for i in range(count):
+            index = (steps >> (6 * i)) & 0x3F
+            targets.append(None if index == self.SKIPPED_STEP else self._position(index))
+        return Turn(self._position(turn_meta & 0x3F), tuple(targets), is_win=bool(turn_meta & 0x400))
+
+    def _index(self, position: Position) -> int:
+        """Returns the bitboard index of a position."""
+        return position.x * self._board_height + position.y
+
+    def _position(self, index: int) -> Position:
+        """Returns the position of a bitboard index."""
+        return Position(index // self._board_height, index % self._board_height)
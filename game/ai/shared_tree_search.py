@@ -0,0 +1,65 @@
+import math
+from typing import List, Optional
+
+from ai.mcts_search import MCTSNode, MCTSSearch
+from ai.random_playout import RandomPlayout
+from ai.shared_statistics import SharedStatistics
+from core.board import Board
+from core.player import Player
+from game_management.turn_generator import TurnGenerator
+
+
+class SharedTreeSearch(MCTSSearch):
+    """
+    MCTS whose node statistics live in a SharedStatistics table.
+
+    Each process keeps its own tree shape but reads and writes visits and
+    wins by position hash, so processes searching the same position build
+    one shared tree between them. A visit is counted on the way down (a
+    virtual loss) so other processes are steered to different branches
+    while a playout is still running.
+    """
+
+    def __init__(self, statistics: SharedStatistics, exploration: float = MCTSSearch.EXPLORATION,
+                 playout: Optional[RandomPlayout] = None, generator: Optional[TurnGenerator] = None,
+                 seed: Optional[int] = None) -> None:
+        """Initialize the search on a shared statistics table."""
+        super().__init__(exploration, playout, generator, seed)
+        self._statistics = statistics
+
+    def _iterate(self, root: MCTSNode, players: List[Player], colors: List, board: Board) -> None:
+        """Count the root visit up front, then run one iteration."""
+        self._statistics.add(root.key, 1.0, 0.0)
+        super()._iterate(root, players, colors, board)
+
+    def _play(self, node: MCTSNode, players: List[Player], board: Board, path: list) -> None:
+        """Apply the node's turn and count the visit in the shared table."""
+        super()._play(node, players, board, path)
+        self._statistics.add(node.key, 1.0, 0.0)
+
+    def _select_child(self, node: MCTSNode) -> MCTSNode:
+        """Returns the child with the highest UCT value from the shared statistics."""
+        statistics = self._statistics
+        log_visits = math.log(max(statistics.visits(node.key), 1.0))
+        best, best_value = node.children[0], -math.inf
+        for child in node.children:
+            visits, wins = statistics.get(child.key)
+            if visits == 0:
+                return child
+            value = wins / visits + self._exploration * math.sqrt(log_visits / visits)
+            if value > best_value:
+                best, best_value = child, value
+        return best
+
+    def _backpropagate(self, node: MCTSNode, winner: Optional[int]) -> None:
+        """Add the playout result to the shared table (visits were counted on the way down)."""
+        statistics = self._statistics
+        current = node
+        while current.parent is not None:
+            if winner is None:
+                statistics.add(current.key, 0.0, 0.5)
+            elif winner == current.parent.side:
+                statistics.add(current.key, 0.0, 1.0)
+            current = current.parent
+        # Keep this process's own counts too (they drive the playout budget)
+        super()._backpropagate(node, winner)
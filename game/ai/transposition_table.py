@@ -0,0 +1,47 @@
+from typing import List, Optional, Tuple
+
+from game_management.turn import Turn
+
+
+class TranspositionTable:
+    """
+    Bounded transposition table keyed by Zobrist hash.
+
+    The table has a fixed number of slots (a power of two); a position's
+    slot is chosen by the low bits of its hash. A new entry replaces the
+    existing one unless the existing entry is for the same position and
+    was searched deeper.
+    """
+
+    EXACT = 0
+    LOWER_BOUND = 1
+    UPPER_BOUND = 2
+
+    def __init__(self, size_bits: int = 18) -> None:
+        """Initialize an empty table with 2**size_bits slots."""
+        self._mask = (1 << size_bits) - 1
+        self._slots: List[Optional[Tuple[int, int, int, int, Optional[Turn]]]] = [None] * (1 << size_bits)
+
+    @property
+    def capacity(self) -> int:
+        """Returns the number of slots in the table."""
+        return len(self._slots)
+
+    def probe(self, key: int) -> Optional[Tuple[int, int, int, int, Optional[Turn]]]:
+        """Returns the (key, depth, score, flag, best turn) entry for a position, or None."""
+        entry = self._slots[key & self._mask]
+        if entry is not None and entry[0] == key:
+            return entry
+        return None
+
+    def store(self, key: int, depth: int, score: int, flag: int, best_turn: Optional[Turn]) -> None:
+        """Store the result of searching a position to *depth*."""
+        index = key & self._mask
+        entry = self._slots[index]
+        if entry is not None and entry[0] == key and entry[1] > depth:
+            return
+        self._slots[index] = (key, depth, score, flag, best_turn)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._slots = [None] * len(self._slots)
@@ -89,6 +89,7 @@ class SantoriniPygameApp:
         self.player2_name = ""
         self.player1_color = None
         self.player2_color = None
+        self.player2_computer = False
         
         # Tutorial state
         self.tutorial_adapter = TutorialUIAdapter(self)
@@ -217,6 +218,15 @@ class SantoriniPygameApp:
         elif player_num == 2:
             self.player2_color = color
     
+    def is_player_computer(self, player_num: int) -> bool:
+        """Check if a player (only player 2 can be) is controlled by the computer."""
+        return player_num == 2 and self.player2_computer
+    
+    def set_player_computer(self, player_num: int, is_computer: bool) -> None:
+        """Set whether a player is controlled by the computer."""
+        if player_num == 2:
+            self.player2_computer = is_computer
+    
     def show_message(self, message: str) -> None:
         """Show a message to the user"""
         print(f"MESSAGE: {message}")  # print to console
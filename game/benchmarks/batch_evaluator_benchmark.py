@@ -0,0 +1,52 @@
+import argparse
+import time
+
+from ai.batch_evaluator import BatchEvaluator
+from ai.evaluator import Evaluator
+from benchmarks.benchmark_positions import position_suite
+
+
+def benchmark_scalar(suite: list, repeats: int) -> float:
+    """Score every position one by one with Evaluator; returns positions per second."""
+    evaluator = Evaluator()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for board, players, side in suite:
+            evaluator.evaluate(board.state, players[side].player_color, players[1 - side].player_color)
+    return len(suite) * repeats / (time.perf_counter() - start)
+
+
+def benchmark_batches(suite: list, batch_size: int, total: int) -> float:
+    """Score *total* positions from the suite in batches of *batch_size*; returns positions per second."""
+    evaluator = BatchEvaluator()
+    board = suite[0][0]
+    batch = evaluator.new_batch(board.width, board.height, batch_size)
+    scored = 0
+    start = time.perf_counter()
+    while scored < total:
+        batch.clear()
+        for i in range(batch_size):
+            board, players, side = suite[(scored + i) % len(suite)]
+            batch.add(board.state, players[side].player_color, players[1 - side].player_color)
+        evaluator.evaluate_batch(batch)
+        scored += batch_size
+    return scored / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Entry point for the batch evaluator benchmark."""
+    parser = argparse.ArgumentParser(description="Measure vectorized position evaluation speed by batch size.")
+    parser.add_argument("--positions", type=int, default=50, help="positions in the suite")
+    parser.add_argument("--total", type=int, default=20000, help="positions scored per batch size")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the position set")
+    args = parser.parse_args()
+
+    suite = position_suite("standard", args.positions, args.seed)
+    print(f"{'Evaluator':>16}: {benchmark_scalar(suite, max(1, args.total // len(suite))):12,.0f} positions/s")
+    for batch_size in (1, 64, 4096):
+        rate = benchmark_batches(suite, batch_size, args.total)
+        print(f"{'batch of ' + str(batch_size):>16}: {rate:12,.0f} positions/s")
+
+
+if __name__ == "__main__":
+    main()
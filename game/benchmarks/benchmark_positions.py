@@ -0,0 +1,80 @@
+import random
+from typing import List, Tuple
+
+from colors.color import Color
+from core.board import Board
+from core.player import Player
+from core.worker import Worker
+from game_management.turn_generator import TurnGenerator
+from game_modes.standard_game_mode import StandardGameMode
+from god_cards.god_card_factory import GodCardFactory
+from god_cards.standard_god_card import StandardGodCard
+
+
+def create_position(card_name: str, rng: random.Random, plies: int) -> Tuple[Board, List[Player]]:
+    """Create a board where both players hold *card_name*, after up to *plies* random turns."""
+    board = Board(5, 5)
+    players = []
+    for name, color in (("Player 1", Color.RED), ("Player 2", Color.BLUE)):
+        card = StandardGodCard() if card_name == "standard" else GodCardFactory.create_card(card_name)
+        players.append(Player(name, 20, color, god_card=card))
+
+    cells = rng.sample(range(board.state.size), 4)
+    for i, player in enumerate(players):
+        for index in cells[2 * i:2 * i + 2]:
+            tile = board.get_tile_at_index(index)
+            worker = Worker(tile.position, player.player_color)
+            player.add_worker(worker)
+            tile.worker = worker
+
+    generator = TurnGenerator()
+    for ply in range(plies):
+        player = players[ply % 2]
+        turns = list(generator.generate(player, board))
+        if not turns:
+            break
+        turn = rng.choice(turns)
+        if turn.is_win:
+            break
+        generator.apply_turn(turn, player, board)
+        board.state.end_turn()
+    return board, players
+
+
+def position_suite(card_name: str, count: int, seed: int) -> List[Tuple[Board, List[Player], int]]:
+    """
+    Returns a fixed set of (board, players, side to move) positions for *card_name*.
+
+    The same card, count and seed always give the same positions, so results
+    can be compared between runs.
+    """
+    rng = random.Random(f"{seed}:{card_name}")
+    suite = []
+    for _ in range(count):
+        plies = rng.randrange(0, 12)
+        board, players = create_position(card_name, rng, plies)
+        suite.append((board, players, plies % 2))
+    return suite
+
+
+def starting_positions(count: int, seed: int) -> List[Tuple[Board, List[Player], int]]:
+    """Returns *count* standard-card game starts placed by StandardGameMode, with player 1 to move."""
+    suite = []
+    for i in range(count):
+        board = Board(5, 5)
+        players = [Player(name, 20, color, god_card=StandardGodCard())
+                   for name, color in (("Player 1", Color.RED), ("Player 2", Color.BLUE))]
+        StandardGameMode().initialize_game(players, board, random.Random(f"{seed}:{i}"))
+        suite.append((board, players, 0))
+    return suite
+
+
+def endgame_positions(card_name: str, count: int, seed: int) -> List[Tuple[Board, List[Player], int]]:
+    """Returns a fixed set of late-game positions for *card_name* (16 to 31 random turns in)."""
+    rng = random.Random(f"{seed}:endgame:{card_name}")
+    suite = []
+    for _ in range(count):
+        plies = rng.randrange(16, 32)
+        board, players = create_position(card_name, rng, plies)
+        suite.append((board, players, plies % 2))
+    return suite
@@ -0,0 +1,34 @@
+import argparse
+
+from ai.endgame_solver import EndgameSolver
+from benchmarks.benchmark_positions import endgame_positions
+
+
+def main() -> None:
+    """Entry point for the endgame solver benchmark."""
+    parser = argparse.ArgumentParser(description="Solve late-game positions for forced wins of growing length.")
+    parser.add_argument("--card", default="standard", help="god card both players hold")
+    parser.add_argument("--positions", type=int, default=20, help="positions in the endgame suite")
+    parser.add_argument("--plies", type=int, default=7, help="longest forced win to look for, in turns of both sides")
+    parser.add_argument("--time", type=float, default=20.0, help="time limit per position in seconds")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the position set")
+    args = parser.parse_args()
+
+    suite = endgame_positions(args.card, args.positions, args.seed)
+    solver = EndgameSolver()
+    for plies in range(1, args.plies + 1, 2):
+        wins = unknown = nodes = 0
+        seconds = slowest = 0.0
+        for board, players, side in suite:
+            result = solver.solve(players, side, board, plies, time_limit=args.time)
+            wins += result.is_win
+            unknown += not result.complete
+            nodes += result.nodes
+            seconds += result.elapsed
+            slowest = max(slowest, result.elapsed)
+        print(f"within {plies} turns: {wins:3d} wins, {unknown:3d} unresolved, {nodes:8d} nodes in {seconds:6.2f}s "
+              f"(slowest {slowest:5.2f}s, {nodes / seconds:,.0f} nodes/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import argparse
+import os
+import random
+import subprocess
+import sys
+import time
+
+from engine.santorini_engine import SantoriniEngine
+
+
+IMPORT_PROBE = (
+    "import sys, time; start = time.perf_counter(); "
+    "import engine.santorini_engine; "
+    "print(time.perf_counter() - start, 'pygame' in sys.modules)"
+)
+
+
+def measure_import() -> tuple[float, bool]:
+    """Import the engine in a fresh interpreter; returns (seconds, whether pygame was loaded)."""
+    game_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.check_output([sys.executable, "-c", IMPORT_PROBE], cwd=game_dir, text=True)
+    seconds, pygame_loaded = output.split()
+    return float(seconds), pygame_loaded == "True"
+
+
+def play_random_game(rng: random.Random) -> int:
+    """Play one game with uniformly random turns; returns the number of turns played."""
+    engine = SantoriniEngine()
+    while not engine.is_over():
+        engine.apply_turn(rng.choice(engine.legal_turns()))
+    return engine.turn_count
+
+
+def main() -> None:
+    """Entry point for the headless engine benchmark."""
+    parser = argparse.ArgumentParser(description="Measure headless engine import cost and game throughput.")
+    parser.add_argument("--games", type=int, default=100, help="number of random games to play")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the random players")
+    args = parser.parse_args()
+
+    seconds, pygame_loaded = measure_import()
+    print(f"Engine import: {seconds * 1000:.1f} ms (pygame imported: {pygame_loaded})")
+
+    rng = random.Random(args.seed)
+    start = time.perf_counter()
+    turns = sum(play_random_game(rng) for _ in range(args.games))
+    elapsed = time.perf_counter() - start
+    print(f"Random games: {args.games} in {elapsed:.2f}s "
+          f"({args.games / elapsed * 60:,.0f} games/min, {turns / args.games:.1f} turns/game)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import argparse
+import multiprocessing
+
+from ai.alpha_beta_search import AlphaBetaSearch
+from ai.lazy_smp_search import LazySMPSearch
+from benchmarks.benchmark_positions import position_suite
+
+
+def mean_depth(search_factory, suite, seconds: float) -> tuple[float, int]:
+    """Search every position for *seconds*; returns (mean depth reached, total nodes)."""
+    depths = []
+    nodes = 0
+    for board, players, side in suite:
+        # A fresh search (and table) per position keeps the runs independent
+        search = search_factory()
+        try:
+            result = search.search(players, side, board, time_limit=seconds)
+        finally:
+            if isinstance(search, LazySMPSearch):
+                search.close()
+        depths.append(result.depth)
+        nodes += result.nodes
+    return sum(depths) / len(depths), nodes
+
+
+def main() -> None:
+    """Entry point for the Lazy-SMP benchmark."""
+    parser = argparse.ArgumentParser(description="Measure depth reached in a fixed time against the number of processes.")
+    parser.add_argument("--positions", type=int, default=6, help="positions per run")
+    parser.add_argument("--time", type=float, default=2.0, help="seconds per search")
+    parser.add_argument("--card", default="standard", help="god card held by both players")
+    parser.add_argument("--max-processes", type=int, default=multiprocessing.cpu_count(), help="largest pool size")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the position set")
+    args = parser.parse_args()
+
+    suite = position_suite(args.card, args.positions, args.seed)
+    depth, nodes = mean_depth(AlphaBetaSearch, suite, args.time)
+    print(f"    serial: mean depth {depth:.2f}, {nodes / (args.time * len(suite)):,.0f} nodes/s")
+
+    counts = sorted({1, 2, 4, 8, 16, args.max_processes} & set(range(1, args.max_processes + 1)))
+    for processes in counts:
+        depth, nodes = mean_depth(lambda: LazySMPSearch(processes), suite, args.time)
+        print(f"{processes:3d} procs: mean depth {depth:.2f}, {nodes / (args.time * len(suite)):,.0f} nodes/s")
+
+
+if __name__ == "__main__":
+    main()
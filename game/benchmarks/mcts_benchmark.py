@@ -0,0 +1,44 @@
+import argparse
+import random
+import time
+
+from ai.mcts_search import MCTSSearch
+from ai.random_playout import RandomPlayout
+from benchmarks.benchmark_positions import position_suite
+from god_cards.god_card_factory import GodCardFactory
+
+
+def benchmark_playouts(positions: int, rounds: int, seed: int) -> float:
+    """Run bare random playouts from the standard position set; returns playouts per second."""
+    suite = position_suite("standard", positions, seed)
+    playout = RandomPlayout(random.Random(seed))
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for board, players, side in suite:
+            playout.run(board.state, [player.player_color for player in players], side)
+    return positions * rounds / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Entry point for the MCTS benchmark."""
+    parser = argparse.ArgumentParser(description="Measure random playout and MCTS speed on a fixed position set.")
+    parser.add_argument("--positions", type=int, default=10, help="positions per god card")
+    parser.add_argument("--time", type=float, default=1.0, help="seconds per search")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the position set and playouts")
+    args = parser.parse_args()
+
+    print(f"Random playouts: {benchmark_playouts(args.positions, 100, args.seed):,.0f} playouts/s")
+
+    card_names = ["standard"] + GodCardFactory.get_available_card_names()
+    for card_name in card_names:
+        playouts = 0
+        seconds = 0.0
+        for board, players, side in position_suite(card_name, args.positions, args.seed):
+            result = MCTSSearch(seed=args.seed).search(players, side, board, time_limit=args.time)
+            playouts += result.playouts
+            seconds += result.elapsed
+        print(f"{card_name:>10}: {playouts:8d} playouts in {seconds:6.2f}s ({playouts / seconds:,.0f} playouts/s with tree)")
+
+
+if __name__ == "__main__":
+    main()
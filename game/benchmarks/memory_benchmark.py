@@ -0,0 +1,53 @@
+import argparse
+import tracemalloc
+from typing import List
+
+from colors.color import Color
+from core.game import Game
+from core.player import Player
+from win_conditions.standard_win_condition import StandardWinCondition
+
+
+def create_game() -> Game:
+    """Create a fresh standard two-player game."""
+    players = [
+        Player("Player 1", 20, Color.RED),
+        Player("Player 2", 21, Color.BLUE),
+    ]
+    return Game(players, win_condition=StandardWinCondition())
+
+
+def measure_bytes_per_game(game_count: int) -> float:
+    """
+    Measure the memory held by *game_count* live games, in bytes per game.
+
+    One game is created before measuring so that shared, one-off state
+    (interned positions, adjacency tables, god card registry) is not
+    attributed to the measured games.
+    """
+    create_game()
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    games: List[Game] = [create_game() for _ in range(game_count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Keep the games alive until after the measurement.
+    assert len(games) == game_count
+    return (after - before) / game_count
+
+
+def main() -> None:
+    """Entry point for the memory benchmark."""
+    parser = argparse.ArgumentParser(description="Measure memory used per Santorini game.")
+    parser.add_argument("--games", type=int, default=1000, help="number of live games to measure")
+    args = parser.parse_args()
+
+    bytes_per_game = measure_bytes_per_game(args.games)
+    print(f"Games measured: {args.games}")
+    print(f"Bytes per game: {bytes_per_game:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
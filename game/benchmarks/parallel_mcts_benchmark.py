@@ -0,0 +1,39 @@
+import argparse
+import multiprocessing
+
+from ai.mcts_search import MCTSSearch
+from ai.parallel_mcts import ParallelMCTS
+from benchmarks.benchmark_positions import starting_positions
+
+
+def run_fixed_budget(search, suite, playouts: int) -> float:
+    """Search every position with a fixed playout budget; returns the total seconds."""
+    seconds = 0.0
+    for board, players, side in suite:
+        seconds += search.search(players, side, board, playouts=playouts).elapsed
+    return seconds
+
+
+def main() -> None:
+    """Entry point for the parallel MCTS scaling benchmark."""
+    parser = argparse.ArgumentParser(description="Measure parallel MCTS speedup against the number of processes.")
+    parser.add_argument("--positions", type=int, default=4, help="number of starting positions")
+    parser.add_argument("--playouts", type=int, default=4000, help="playout budget per search")
+    parser.add_argument("--max-processes", type=int, default=multiprocessing.cpu_count(), help="largest pool size")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the positions and playouts")
+    args = parser.parse_args()
+
+    suite = starting_positions(args.positions, args.seed)
+    baseline = run_fixed_budget(MCTSSearch(seed=args.seed), suite, args.playouts)
+    print(f"{'serial':>12}: {baseline:6.2f}s")
+
+    counts = sorted({1, 2, 4, 8, 16, args.max_processes} & set(range(1, args.max_processes + 1)))
+    for mode in (ParallelMCTS.ROOT, ParallelMCTS.SHARED_TREE):
+        for processes in counts:
+            with ParallelMCTS(processes, mode, seed=args.seed) as search:
+                seconds = run_fixed_budget(search, suite, args.playouts)
+            print(f"{mode:>12}: {processes:3d} processes {seconds:6.2f}s (speedup {baseline / seconds:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
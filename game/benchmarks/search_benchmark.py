@@ -0,0 +1,37 @@
+import argparse
+
+from ai.alpha_beta_search import AlphaBetaSearch
+from benchmarks.benchmark_positions import position_suite
+from god_cards.god_card_factory import GodCardFactory
+
+
+def main() -> None:
+    """Entry point for the alpha-beta search benchmark."""
+    parser = argparse.ArgumentParser(description="Measure alpha-beta search speed on a fixed position set.")
+    parser.add_argument("--positions", type=int, default=10, help="positions per god card")
+    parser.add_argument("--time", type=float, default=1.0, help="seconds per search")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the position set")
+    args = parser.parse_args()
+
+    card_names = ["standard"] + GodCardFactory.get_available_card_names()
+    total_nodes = 0
+    total_seconds = 0.0
+    for card_name in card_names:
+        nodes = 0
+        seconds = 0.0
+        depths = []
+        for board, players, side in position_suite(card_name, args.positions, args.seed):
+            # A fresh table per position keeps the runs independent
+            result = AlphaBetaSearch().search(players, side, board, time_limit=args.time)
+            nodes += result.nodes
+            seconds += result.elapsed
+            depths.append(result.depth)
+        total_nodes += nodes
+        total_seconds += seconds
+        print(f"{card_name:>10}: {nodes:8d} nodes in {seconds:6.2f}s ({nodes / seconds:,.0f} nodes/s, "
+              f"mean depth {sum(depths) / len(depths):.1f}, max depth {max(depths)})")
+    print(f"{'total':>10}: {total_nodes:8d} nodes in {total_seconds:6.2f}s ({total_nodes / total_seconds:,.0f} nodes/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import argparse
+import random
+import time
+from typing import Tuple
+
+from benchmarks.benchmark_positions import create_position
+from game_management.turn_generator import TurnGenerator
+from god_cards.god_card_factory import GodCardFactory
+
+
+def benchmark_card(card_name: str, positions: int, seed: int) -> Tuple[int, float]:
+    """Enumerate every turn from a set of positions; returns (turns generated, seconds)."""
+    rng = random.Random(seed)
+    generator = TurnGenerator()
+    setups = [create_position(card_name, rng, rng.randrange(0, 12)) for _ in range(positions)]
+
+    turn_count = 0
+    start = time.perf_counter()
+    for board, players in setups:
+        for player in players:
+            for _ in generator.generate(player, board):
+                turn_count += 1
+    return turn_count, time.perf_counter() - start
+
+
+def main() -> None:
+    """Entry point for the turn generator benchmark."""
+    parser = argparse.ArgumentParser(description="Measure full-turn generation speed per god card.")
+    parser.add_argument("--positions", type=int, default=200, help="positions per god card")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the position set")
+    args = parser.parse_args()
+
+    card_names = ["standard"] + GodCardFactory.get_available_card_names()
+    for card_name in card_names:
+        turns, seconds = benchmark_card(card_name, args.positions, args.seed)
+        print(f"{card_name:>10}: {turns:7d} turns in {seconds:6.3f}s "
+              f"({turns / seconds:,.0f} turns/s, {turns / (2 * args.positions):.1f} turns/position)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,52 @@
+from typing import Dict
+
 from buildings.building import Building
 from buildings.dome import Dome
 
 
 
 class Block(Building):
-    """A Block is a building that can be at level 1, 2, or 3."""
+    """
+    A Block is a building that can be at level 1, 2, or 3.
+
+    Blocks are immutable flyweights: there is exactly one shared instance
+    per level, so building never allocates.
+    """
+
+    __slots__ = ("_level",)
+
+    _instances: Dict[int, 'Block'] = {}
 
-    def __init__(self, level: int = 1) -> None:
+    def __new__(cls, level: int = 1) -> 'Block':
         """ 
-        Initialise a Block at level 1, 2, or 3.
+        Return the shared Block at level 1, 2, or 3.
         
         If level is not in this range, raise ValueError.
         """
-        if not (1 <= level <= 3):
-            raise ValueError("Block level must be 1–3")
-        self._level = level
+        block = cls._instances.get(level)
+        if block is None:
+            if not (1 <= level <= 3):
+                raise ValueError("Block level must be 1–3")
+            block = super().__new__(cls)
+            object.__setattr__(block, "_level", level)
+            cls._instances[level] = block
+        return block
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Blocks are shared between tiles, so they cannot be changed."""
+        raise AttributeError("Block is immutable")
+
+    def __reduce__(self) -> tuple:
+        """Return the shared instance again when unpickled."""
+        return (Block, (self._level,))
+
+    def __copy__(self) -> 'Block':
+        """Blocks are immutable, so a copy is the same instance."""
+        return self
+
+    def __deepcopy__(self, memo: dict) -> 'Block':
+        """Blocks are immutable, so a deep copy is the same instance."""
+        return self
 
     def has_dome(self) -> bool:
         """Returns False, as a Block cannot have a dome."""
@@ -26,7 +58,7 @@ class Block(Building):
         return self._level
 
     def increase_level(self) -> Building:
-        """Increase the level of the Block by one."""
+        """Return the shared building one level higher than this Block."""
         if self._level < 3: # Block can be increased to level 3 at most
             return Block(self._level + 1)
         
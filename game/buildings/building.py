@@ -5,6 +5,8 @@ from abc import ABC, abstractmethod
 class Building(ABC):
     """Abstract base for any kind of building that sits on a Tile."""
 
+    __slots__ = ()
+
     @abstractmethod
     def has_dome(self) -> bool:
         """Returns True if the building is a Dome."""
@@ -21,6 +23,6 @@ class Building(ABC):
         """ 
         Attempt to raise the building by one level.
         
-        Returns a new Building (self or Dome) to replace the old one.
+        Returns the shared Building (next Block, Dome or self) to replace the old one.
         """
         raise NotImplementedError()
\ No newline at end of file
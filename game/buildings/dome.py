@@ -1,16 +1,44 @@
+from typing import Dict
+
 from buildings.building import Building
 
 
 
 class Dome(Building):
-    """Dome can now exist at any level — default = 4."""
-
-    def __init__(self, level: int = 4) -> None:
-        """Initialise a Dome"""
-        if level < 0 or level > 3: # If level is given, it must be 0, 1, 2, or 3
-            self._level = level
-        else: # Dome is always at level 4
-            self._level = level
+    """
+    Dome can now exist at any level — default = 4.
+
+    Domes are immutable flyweights: there is one shared instance per level.
+    """
+
+    __slots__ = ("_level",)
+
+    _instances: Dict[int, 'Dome'] = {}
+
+    def __new__(cls, level: int = 4) -> 'Dome':
+        """Return the shared Dome at the given level."""
+        dome = cls._instances.get(level)
+        if dome is None:
+            dome = super().__new__(cls)
+            object.__setattr__(dome, "_level", level)
+            cls._instances[level] = dome
+        return dome
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Domes are shared between tiles, so they cannot be changed."""
+        raise AttributeError("Dome is immutable")
+
+    def __reduce__(self) -> tuple:
+        """Return the shared instance again when unpickled."""
+        return (Dome, (self._level,))
+
+    def __copy__(self) -> 'Dome':
+        """Domes are immutable, so a copy is the same instance."""
+        return self
+
+    def __deepcopy__(self, memo: dict) -> 'Dome':
+        """Domes are immutable, so a deep copy is the same instance."""
+        return self
 
     def has_dome(self) -> bool:
         """Returns True, as a Dome is a dome."""
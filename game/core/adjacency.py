@@ -0,0 +1,57 @@
+from typing import Dict, Tuple
+
+
+class Adjacency:
+    """
+    Precomputed neighbour index for one board size.
+
+    Tiles are addressed by their bitboard index (index = x * height + y).
+    Tables are built once per (width, height) and shared by every board of
+    that size, so creating or copying a board never recomputes them.
+    """
+
+    _cache: Dict[Tuple[int, int], 'Adjacency'] = {}
+
+    def __init__(self, width: int, height: int) -> None:
+        """Build the neighbour tables for a board of the given size."""
+        self._width = width
+        self._height = height
+
+        indices = []
+        masks = []
+        for x in range(width):
+            for y in range(height):
+                neighbours = tuple(
+                    nx * height + ny
+                    for nx in (x - 1, x, x + 1)
+                    for ny in (y - 1, y, y + 1)
+                    if (nx != x or ny != y) and 0 <= nx < width and 0 <= ny < height
+                )
+                indices.append(neighbours)
+                mask = 0
+                for index in neighbours:
+                    mask |= 1 << index
+                masks.append(mask)
+
+        self._indices: Tuple[Tuple[int, ...], ...] = tuple(indices)
+        self._masks: Tuple[int, ...] = tuple(masks)
+
+    @classmethod
+    def for_size(cls, width: int, height: int) -> 'Adjacency':
+        """Returns the shared neighbour index for a board size, building it on first use."""
+        key = (width, height)
+        adjacency = cls._cache.get(key)
+        if adjacency is None:
+            adjacency = cls(width, height)
+            cls._cache[key] = adjacency
+        return adjacency
+
+    @property
+    def indices(self) -> Tuple[Tuple[int, ...], ...]:
+        """Returns, for every tile index, the indices of its (up to 8) neighbours."""
+        return self._indices
+
+    @property
+    def masks(self) -> Tuple[int, ...]:
+        """Returns, for every tile index, the bitboard mask of its neighbours."""
+        return self._masks
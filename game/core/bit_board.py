@@ -0,0 +1,302 @@
+from typing import Dict, Iterator, List, Optional
+
+from colors.color import Color
+from core.adjacency import Adjacency
+from core.zobrist_keys import ZobristKeys
+
+
+class BitBoard:
+    """
+    Bitboard representation of the Santorini board state.
+
+    Every tile is mapped to a bit index (column-major: index = x * height + y),
+    so iterating the set bits of a mask visits tiles in the same order as
+    iterating x then y over a Board.
+
+    State is stored as integer masks:
+        - one mask per building level (0-3), exactly one of which holds each tile
+        - one mask for domes
+        - one mask per player color for workers, plus a combined occupancy mask
+
+    A 64-bit Zobrist hash of the state is maintained incrementally. It covers
+    building levels, domes, workers per color, the side to move and the
+    per-turn markers god cards depend on (where the last move started and
+    where the last build happened this turn).
+
+    A threat index is kept up to date with the pieces: for each color, the
+    mask of open level 3 tiles next to one of its workers on level 2,
+    i.e. the tiles it can win on with its next move. Only changes next to
+    a worker on level 2 can alter it, so most updates skip the refresh.
+    """
+
+    MAX_LEVEL = 3
+
+    def __init__(self, width: int, height: int) -> None:
+        """Initialize an empty bitboard with the given width and height."""
+        self._width = width
+        self._height = height
+        self._size = width * height
+        self._full = (1 << self._size) - 1
+
+        self._levels: List[int] = [self._full, 0, 0, 0]
+        self._heights: List[int] = [0] * self._size
+        self._domes = 0
+        self._occupied = 0
+        self._workers: Dict[Color, int] = {}
+        self._threats: Dict[Color, int] = {}
+        self._adjacency = Adjacency.for_size(width, height)
+        self._neighbours = self._adjacency.masks
+
+        self._keys = ZobristKeys.for_size(width, height)
+        self._hash = 0
+        self._marker_hash = 0
+        self._moved_from: Optional[int] = None
+        self._built_at: Optional[int] = None
+
+    @property
+    def width(self) -> int:
+        """Returns the number of columns."""
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """Returns the number of rows."""
+        return self._height
+
+    @property
+    def size(self) -> int:
+        """Returns the number of tiles on the board."""
+        return self._size
+
+    @property
+    def domes(self) -> int:
+        """Returns the mask of tiles holding a dome."""
+        return self._domes
+
+    @property
+    def occupied(self) -> int:
+        """Returns the mask of tiles holding a worker of any color."""
+        return self._occupied
+
+    @property
+    def zobrist(self) -> int:
+        """Returns the Zobrist hash of the full state, including the per-turn markers."""
+        return self._hash ^ self._marker_hash
+
+    @property
+    def position_hash(self) -> int:
+        """Returns the Zobrist hash of the pieces and side to move, ignoring the per-turn markers."""
+        return self._hash
+
+    @property
+    def moved_from(self) -> Optional[int]:
+        """Returns the index the last move this turn started from, or None."""
+        return self._moved_from
+
+    @property
+    def built_at(self) -> Optional[int]:
+        """Returns the index of the last build this turn, or None."""
+        return self._built_at
+
+    def index(self, x: int, y: int) -> int:
+        """Returns the bit index of the tile at (x, y)."""
+        return x * self._height + y
+
+    def coordinates(self, index: int) -> tuple[int, int]:
+        """Returns the (x, y) coordinates of the tile at a bit index."""
+        return divmod(index, self._height)
+
+    def neighbours(self, index: int) -> int:
+        """Returns the mask of tiles adjacent (including diagonals) to a bit index."""
+        return self._neighbours[index]
+
+    def neighbour_indices(self, index: int) -> tuple[int, ...]:
+        """Returns the indices of the tiles adjacent to a bit index, in board order."""
+        return self._adjacency.indices[index]
+
+    def level_mask(self, level: int) -> int:
+        """Returns the mask of tiles whose building is exactly at *level*."""
+        return self._levels[level]
+
+    def level(self, index: int) -> int:
+        """Returns the building level of the tile at a bit index (0 when empty)."""
+        return self._heights[index]
+
+    def has_dome(self, index: int) -> bool:
+        """Returns True if the tile at a bit index holds a dome."""
+        return (self._domes >> index) & 1 == 1
+
+    def worker_mask(self, color: Color) -> int:
+        """Returns the mask of tiles holding a worker of the given color."""
+        return self._workers.get(color, 0)
+
+    def threat_mask(self, color: Color) -> int:
+        """Returns the mask of tiles a worker of *color* can win on by moving there next."""
+        return self._threats.get(color, 0)
+
+    def threats_against(self, color: Color) -> int:
+        """Returns the mask of tiles any other color can win on next; *color* must block them all."""
+        mask = 0
+        for other, threats in self._threats.items():
+            if other != color:
+                mask |= threats
+        return mask
+
+    def set_building(self, index: int, level: int, dome: bool) -> None:
+        """
+        Record the building on the tile at a bit index.
+
+        Domes are stored on top of the highest block level they can sit on,
+        so a Dome at level 4 is a complete tower (level 3 plus dome).
+        """
+        bit = 1 << index
+        level = min(level, self.MAX_LEVEL)
+        old_level = self._heights[index]
+        if old_level != level:
+            level_keys = self._keys.levels[index]
+            self._hash ^= level_keys[old_level] ^ level_keys[level]
+            self._levels[old_level] ^= bit
+            self._levels[level] |= bit
+            self._heights[index] = level
+
+        if bool(self._domes & bit) != dome:
+            self._hash ^= self._keys.domes[index]
+            self._domes ^= bit
+
+        if self._neighbours[index] & self._occupied & self._levels[2]:
+            self._refresh_threats()
+
+    def set_worker(self, index: int, color: Optional[Color]) -> None:
+        """Record the worker of *color* on the tile at a bit index (None clears it)."""
+        bit = 1 << index
+        worker_keys = self._keys.workers
+        if self._occupied & bit:
+            for worker_color, mask in self._workers.items():
+                if mask & bit:
+                    self._workers[worker_color] = mask ^ bit
+                    self._hash ^= worker_keys[worker_color][index]
+                    break
+            self._occupied ^= bit
+
+        if color is not None:
+            self._workers[color] = self._workers.get(color, 0) | bit
+            self._hash ^= worker_keys[color][index]
+            self._occupied |= bit
+
+        if (self._levels[2] & bit) or self._neighbours[index] & self._occupied & self._levels[2]:
+            self._refresh_threats()
+
+    def set_moved_from(self, index: Optional[int]) -> Optional[int]:
+        """Record where the last move this turn started from; returns the previous marker."""
+        previous = self._moved_from
+        keys = self._keys.moved_from
+        if previous is not None:
+            self._marker_hash ^= keys[previous]
+        if index is not None:
+            self._marker_hash ^= keys[index]
+        self._moved_from = index
+        return previous
+
+    def set_built_at(self, index: Optional[int]) -> Optional[int]:
+        """Record where the last build this turn happened; returns the previous marker."""
+        previous = self._built_at
+        keys = self._keys.built_at
+        if previous is not None:
+            self._marker_hash ^= keys[previous]
+        if index is not None:
+            self._marker_hash ^= keys[index]
+        self._built_at = index
+        return previous
+
+    def end_turn(self) -> tuple[Optional[int], Optional[int]]:
+        """
+        Pass the move to the other side and clear the per-turn markers.
+
+        Returns the cleared markers, to be given back to undo_end_turn().
+        """
+        markers = (self._moved_from, self._built_at)
+        self.set_moved_from(None)
+        self.set_built_at(None)
+        self._hash ^= self._keys.side
+        return markers
+
+    def undo_end_turn(self, markers: tuple[Optional[int], Optional[int]]) -> None:
+        """Give the move back to the previous side and restore its per-turn markers."""
+        self._hash ^= self._keys.side
+        self.set_moved_from(markers[0])
+        self.set_built_at(markers[1])
+
+    def climbable_mask(self, level: int) -> int:
+        """Returns the mask of tiles a worker standing on *level* can step onto by height."""
+        levels = self._levels
+        mask = levels[0] | levels[1]
+        if level >= 1:
+            mask |= levels[2]
+        if level >= 2:
+            mask |= levels[3]
+        return mask
+
+    def move_mask(self, index: int) -> int:
+        """
+        Returns the mask of tiles a worker at *index* can legally move to.
+
+        Destination must be adjacent, unoccupied, dome-free and at most one
+        level higher than the worker's current tile.
+        """
+        return (self._neighbours[index]
+                & ~self._occupied
+                & ~self._domes
+                & self.climbable_mask(self._heights[index]))
+
+    def build_mask(self, index: int) -> int:
+        """
+        Returns the mask of tiles a worker at *index* can legally build on.
+
+        Target must be adjacent, unoccupied and dome-free.
+        """
+        return self._neighbours[index] & ~self._occupied & ~self._domes
+
+    def empty_mask(self) -> int:
+        """Returns the mask of tiles with no worker and no building."""
+        return self._levels[0] & ~self._occupied & ~self._domes
+
+    def copy(self) -> 'BitBoard':
+        """Returns an independent copy of this bitboard."""
+        clone = BitBoard.__new__(BitBoard)
+        clone._width = self._width
+        clone._height = self._height
+        clone._size = self._size
+        clone._full = self._full
+        clone._levels = list(self._levels)
+        clone._heights = list(self._heights)
+        clone._domes = self._domes
+        clone._occupied = self._occupied
+        clone._workers = dict(self._workers)
+        clone._threats = dict(self._threats)
+        clone._adjacency = self._adjacency
+        clone._neighbours = self._neighbours
+        clone._keys = self._keys
+        clone._hash = self._hash
+        clone._marker_hash = self._marker_hash
+        clone._moved_from = self._moved_from
+        clone._built_at = self._built_at
+        return clone
+
+    def _refresh_threats(self) -> None:
+        """Recompute the threat index of every color."""
+        open_level_3 = self._levels[3] & ~self._occupied & ~self._domes
+        level_2 = self._levels[2]
+        neighbours = self._neighbours
+        for color, workers in self._workers.items():
+            reach = 0
+            for index in BitBoard.iter_indices(workers & level_2):
+                reach |= neighbours[index]
+            self._threats[color] = reach & open_level_3
+
+    @staticmethod
+    def iter_indices(mask: int) -> Iterator[int]:
+        """Yields the bit indices set in *mask*, lowest first."""
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
@@ -1,5 +1,6 @@
 from core.tile import Tile
 from core.position import Position
+from core.bit_board import BitBoard
 
 class Board:
     """ Represents a Santorini game board """
@@ -8,16 +9,20 @@ class Board:
         """ 
         Initializes a board (HashMap/Dict) with the given width and height.
         
-        Each tile on the board is represented by a Tile object.
+        Each tile on the board is represented by a Tile object. The tiles are
+        a view over a BitBoard, which holds the same state as integer masks
+        for fast rule queries.
         
         """
         self._width = width
         self._height = height
-        self._tiles: dict[tuple[int, int], Tile] = {
-            (x, y): Tile(Position(x, y))
+        self._state = BitBoard(width, height)
+        self._tiles: dict[Position, Tile] = {
+            Position(x, y): Tile(Position(x, y), self._state)
             for x in range(width)
             for y in range(height)
         }
+        self._tiles_by_index: list[Tile] = list(self._tiles.values())
 
     @property
     def height(self) -> int:
@@ -39,6 +44,16 @@ class Board:
         """
         return self._width
 
+    @property
+    def state(self) -> BitBoard:
+        """
+        Returns the bitboard backing this board.
+
+        Returns:
+            BitBoard: The bitboard kept in sync with every tile on the board.
+        """
+        return self._state
+
     def in_bounds(self, pos: Position) -> bool:
         """
         Checks if a given position is within the bounds of the board.
@@ -49,7 +64,7 @@ class Board:
         Returns:
             bool: True if the position is within bounds, False otherwise.
         """
-        return (pos.x, pos.y) in self._tiles
+        return pos in self._tiles
 
     def get_tile(self, pos: Position) -> Tile | None:
         """
@@ -61,7 +76,32 @@ class Board:
         Returns:
             Tile | None: The Tile object at the specified position, or None if out-of-bounds.
         """
-        return self._tiles.get((pos.x, pos.y))
+        return self._tiles.get(pos)
+
+    def get_tile_at_index(self, index: int) -> Tile:
+        """
+        Retrieves the tile at a bitboard index.
+
+        Args:
+            index (int): The bit index of the tile in the board's bitboard.
+
+        Returns:
+            Tile: The Tile object at the specified index.
+        """
+        return self._tiles_by_index[index]
+
+    def get_tiles_in_mask(self, mask: int) -> list[Tile]:
+        """
+        Retrieves the tiles whose bits are set in a bitboard mask.
+
+        Args:
+            mask (int): A mask over the board's bitboard indices.
+
+        Returns:
+            list[Tile]: The matching Tile objects, in board order.
+        """
+        tiles = self._tiles_by_index
+        return [tiles[i] for i in BitBoard.iter_indices(mask)]
 
     def get_all_empty_tiles(self) -> list[Tile]:
         """
@@ -70,7 +110,4 @@ class Board:
         Returns:
             list[Tile]: A list of all empty Tile objects on the board.
         """
-        return [
-            tile for tile in self._tiles.values()
-            if tile.worker is None and tile.building is None
-        ]
+        return self.get_tiles_in_mask(self._state.empty_mask())
@@ -1,8 +1,10 @@
 from typing import List
+from concurrent.futures import Future
 import random
 
 from core.player import Player
 from core.board import Board
+from game_management.turn import Turn
 from game_management.turn_manager import TurnManager
 from god_cards.god_card_deck import GodCardDeck
 from core.position import Position
@@ -16,14 +18,24 @@ from win_conditions.win_condition_checker import StandardWinCondition
 from win_conditions.timer_win_condition import TimerWinCondition
 from win_conditions.composite_win_condition import CompositeWinCondition
 from utils.timer_manager import TimerManager
+from records.game_recorder import GameRecorder
 
 from typing import Optional
 
 class Game:
     """Represents a Santorini game instance."""
     
-    def __init__(self, players: List[Player], width: int = 5, height: int = 5, game_mode: Optional[GameMode] = None, win_condition: Optional[WinConditionStrategy] = None) -> None:
-        """Initializes a game with the given players and board dimensions."""
+    def __init__(self, players: List[Player], width: int = 5, height: int = 5, game_mode: Optional[GameMode] = None, win_condition: Optional[WinConditionStrategy] = None, seed: Optional[int | str] = None, recorder: Optional[GameRecorder] = None) -> None:
+        """
+        Initializes a game with the given players and board dimensions.
+
+        *seed* seeds the game's random number generator, which draws the god
+        cards, places the workers and seeds the computer players, so the same
+        seed and the same turns replay a game exactly. Without a seed every
+        game is different. A *recorder* is given the setup and then every
+        turn played through the game.
+        """
+        self._rng = random.Random(seed)
         self._board = Board(width, height)
         self._players = players            
         
@@ -39,21 +51,35 @@ class Game:
             composite_condition = CompositeWinCondition([standard_condition, timer_condition])
             self._win_condition = composite_condition
         
-        self._game_mode.initialize_game(self._players, self._board)
+        self._game_mode.initialize_game(self._players, self._board, self._rng)
         
         if not self._is_tutorial_mode():
             available_cards = GodCardFactory.get_available_card_names()
-            self._god_deck = GodCardDeck(available_cards)
+            self._god_deck = GodCardDeck(available_cards, self._rng)
             for p in self._players:
-                self._pick_random_god(p)
+                # Keep god cards that were assigned up front (e.g. by a headless engine)
+                if p.god_card is None:
+                    self._pick_random_god(p)
         else:
             from god_cards.standard_god_card import StandardGodCard
             for p in self._players:
                 p._player_god = StandardGodCard()
+
+        for p in self._players:
+            p.seed(self._rng.getrandbits(64))
             
         # Initialize the turn manager with the players and board.     
         self.turn_manager = TurnManager(self._players, self._board, self._timer_manager, self._win_condition)
-        self._input_handler = GameInputHandler(self.turn_manager)
+        self._recorder = recorder
+        if recorder is not None:
+            recorder.start(seed, self._board, self._players)
+        self._input_handler = GameInputHandler(self.turn_manager, recorder)
+        
+        # Background search of a computer player (see request_computer_turn)
+        self._pending_turn: Optional[Future] = None
+        self._pending_player: Optional[Player] = None
+        # A computer player whose search found no legal turn; it has lost
+        self._stuck_player: Optional[Player] = None
     
     @property
     def board(self) -> Board:
@@ -70,6 +96,16 @@ class Game:
         """Returns the name of the current player."""
         return self.turn_manager.current_player.player_name
     
+    @property
+    def recorder(self) -> Optional[GameRecorder]:
+        """Returns the recorder of the game's turns, if it has one."""
+        return self._recorder
+
+    @property
+    def rng(self) -> random.Random:
+        """Returns the game's random number generator; draw seeds from it for anything else that is random."""
+        return self._rng
+
     @property
     def game_mode(self) -> GameMode:
         """Returns the current game mode."""
@@ -93,6 +129,8 @@ class Game:
     
     def skip_phase(self) -> None:
         """Skip the current phase. Only valid if the phase is optional."""
+        if self._recorder is not None and self.turn_manager.current_phase_optional():
+            self._recorder.record_skip()
         return self.turn_manager.skip_phase()
 
     def _pick_random_god(self, player: Player) -> None:
@@ -110,6 +148,10 @@ class Game:
         p = w.position
         return p.x, p.y
     
+    def danger_mask(self) -> int:
+        """Returns the bitboard mask of tiles an opponent can win on next; the current player must block them."""
+        return self._board.state.threats_against(self.turn_manager.current_player.player_color)
+
     def click_cell(self, bx: int, by: int) -> bool:
         """Handles a click on the board and returns feedback message."""
         
@@ -136,6 +178,76 @@ class Game:
         
         return result
     
+    def is_computer_turn(self) -> bool:
+        """Returns True if the current player is controlled by the computer."""
+        return self.turn_manager.current_player.is_computer
+
+    def play_computer_turn(self) -> None:
+        """Let the computer player to move choose and play its turn."""
+        current_player = self.turn_manager.current_player
+        turn = current_player.choose_turn(self._players, self._board)
+        if turn is not None:
+            self._play_computer_turn(turn)
+        else:
+            self._stuck_player = current_player
+    
+    def request_computer_turn(self) -> None:
+        """Start the computer player's search in the background, unless one is already running or it is stuck."""
+        if self._pending_turn is None and self._stuck_player is None:
+            self._pending_player = self.turn_manager.current_player
+            self._pending_turn = self._pending_player.request_turn(self._players, self._board)
+    
+    def poll_computer_turn(self) -> bool:
+        """
+        Play the computer's turn if its background search has finished; returns True if it did.
+
+        A search that found no legal turn plays nothing and returns False;
+        the computer player has then lost (see no_turn_winner).
+        """
+        if self._pending_turn is None or not self._pending_turn.done():
+            return False
+        
+        future = self._pending_turn
+        player = self._pending_player
+        self._pending_turn = None
+        self._pending_player = None
+        turn = future.result().turn
+        if turn is None:
+            self._stuck_player = player
+            return False
+        self._play_computer_turn(turn)
+        return True
+
+    def no_turn_winner(self) -> Optional[Player]:
+        """Returns the winner if a computer player could not complete any turn and so lost, otherwise None."""
+        if self._stuck_player is None:
+            return None
+        return self._players[(self._players.index(self._stuck_player) + 1) % len(self._players)]
+    
+    def _play_computer_turn(self, turn: Turn) -> None:
+        """Play a turn chosen by a computer player and record it."""
+        if self._recorder is not None:
+            self._recorder.record_turn(turn)
+        self.turn_manager.play_turn(turn)
+
+    def is_computer_thinking(self) -> bool:
+        """Returns True while a computer player's background search is running."""
+        return self._pending_turn is not None
+    
+    def cancel_computer_turn(self) -> None:
+        """Cancel a running background search (e.g. when the player leaves the game)."""
+        if self._pending_turn is not None:
+            self._pending_player.cancel_turn_request()
+            self._pending_turn.cancel()
+            self._pending_turn = None
+            self._pending_player = None
+    
+    def stop_computer_players(self) -> None:
+        """Stop any background work of computer players (e.g. pondering) when the game is left."""
+        for player in self._players:
+            if player.is_computer:
+                player.close()
+    
     def get_current_player_timer_info(self) -> Optional[dict]:
         """Get timer information for the current player."""
         return self._timer_manager.get_current_player_timer_info()
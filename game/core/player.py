@@ -9,6 +9,8 @@ from utils.player_timer import PlayerTimer
 class Player:
     """Represents a player in the Santorini game."""
     
+    __slots__ = ("_player_name", "_player_age", "_player_god", "_player_color", "_timer", "workers")
+    
     def __init__(self, name: str, age: int, color: Color, workers: List[Worker] | None = None, god_card = None, timer_seconds: float = 300) -> None:
         """Initializes a player with a name, age, color, workers and it's god card."""
         self._player_name = name
@@ -42,6 +44,19 @@ class Player:
     @property
     def god_card(self):
         return self._player_god
+
+    @property
+    def is_computer(self) -> bool:
+        """Returns True if the player's turns are chosen by the computer."""
+        return False
+
+    def seed(self, seed: int) -> None:
+        """Seed the random choices of the player; a human player makes none."""
+        pass
+
+    def handle_turn_end(self, current_player: 'Player', players: List['Player'], board) -> None:
+        """Called after every turn, once *current_player* is to move. Players may react (e.g. start pondering)."""
+        pass
     
     def add_worker(self, worker: Worker) -> None:
         """Adds a worker to the player."""
@@ -1,19 +1,69 @@
+from typing import Dict, Tuple
+
 
 class Position:
-    """Positions are represented by a tuple of (x, y) coordinates."""
-    
-    def __init__(self, x: int, y: int) -> None:
-        """Initialize a position with x and y coordinates."""
-        self._x = x
-        self._y = y
+    """
+    Positions are represented by a tuple of (x, y) coordinates.
+
+    Positions are immutable, interned values: constructing a position for
+    coordinates that were seen before returns the shared instance, so the
+    board, the rules and the UI can look tiles up without allocating.
+    """
+
+    __slots__ = ("_x", "_y", "_hash")
+
+    _instances: Dict[Tuple[int, int], 'Position'] = {}
+
+    def __new__(cls, x: int, y: int) -> 'Position':
+        """Return the shared position for the x and y coordinates."""
+        key = (x, y)
+        position = cls._instances.get(key)
+        if position is None:
+            position = super().__new__(cls)
+            object.__setattr__(position, "_x", x)
+            object.__setattr__(position, "_y", y)
+            object.__setattr__(position, "_hash", hash(key))
+            cls._instances[key] = position
+        return position
 
     @property
     def x(self) -> int:
         """Returns the x-coordinate of the position."""
         return self._x
-    
+
     @property
     def y(self) -> int:
         """Returns the y-coordinate of the position."""
         return self._y
-    
\ No newline at end of file
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Positions are shared between tiles and workers, so they cannot be changed."""
+        raise AttributeError("Position is immutable")
+
+    def __eq__(self, other: object) -> bool:
+        """Two positions are equal when their coordinates are equal."""
+        if self is other:
+            return True
+        if not isinstance(other, Position):
+            return NotImplemented
+        return self._x == other._x and self._y == other._y
+
+    def __hash__(self) -> int:
+        """Returns the hash of the (x, y) coordinates."""
+        return self._hash
+
+    def __repr__(self) -> str:
+        """Returns a readable representation of the position."""
+        return f"Position({self._x}, {self._y})"
+
+    def __reduce__(self) -> tuple:
+        """Re-intern the position when it is unpickled (e.g. in a worker process)."""
+        return (Position, (self._x, self._y))
+
+    def __copy__(self) -> 'Position':
+        """Positions are immutable, so a copy is the same instance."""
+        return self
+
+    def __deepcopy__(self, memo: dict) -> 'Position':
+        """Positions are immutable, so a deep copy is the same instance."""
+        return self
@@ -1,21 +1,33 @@
 from core.position import Position
 from buildings.building import Building
 from core.worker import Worker
+from core.bit_board import BitBoard
 
 
 class Tile:
     """Represents a single tile on the Santorini game board."""
     
-    def __init__(self, position: Position | None) -> None:
+    __slots__ = ("_position", "_worker", "_building", "_state", "_index")
+    
+    def __init__(self, position: Position | None, state: BitBoard | None = None) -> None:
         """ 
         Initialize a tile at *position*.
         
         A tile may later hold a worker and/or a building.
+        If a bitboard *state* is given, every change to the tile is written
+        through to it so the tile acts as a view over the bitboard.
         
         """
         self._position: Position = position
         self._worker = None
         self._building = None
+        self._state = state
+        self._index = state.index(position.x, position.y) if state is not None else None
+    
+    @property
+    def index(self) -> int | None:
+        """Returns the bit index of the tile in its board's bitboard."""
+        return self._index
     
     @property
     def position(self) -> Position:
@@ -31,6 +43,11 @@ class Tile:
     def building(self, building) -> None:
         """Sets a building on the tile."""
         self._building = building
+        if self._state is not None:
+            if building is None:
+                self._state.set_building(self._index, 0, False)
+            else:
+                self._state.set_building(self._index, building.level, building.has_dome())
     
     @property 
     def worker(self) -> Worker | None:
@@ -41,6 +58,8 @@ class Tile:
     def worker(self, worker) -> None:
         """Places a worker on the tile."""
         self._worker = worker
+        if self._state is not None:
+            self._state.set_worker(self._index, worker.color if worker is not None else None)
     
     def has_worker(self) -> bool:
         """ 
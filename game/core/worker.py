@@ -4,6 +4,8 @@ from colors.color import Color
 class Worker:
     """ Represents a worker in the Santorini game. """
 
+    __slots__ = ("_position", "_color", "_previous_position", "_previous_build_pos")
+
     def __init__(self, initial_position: Position, color: Color) -> None:
         """Initializes a worker with a given position and color."""
         self._position = initial_position
@@ -22,6 +24,11 @@ class Worker:
         self._previous_position = self._position
         self._position = new_position
 
+    def restore_position(self, position: Position, previous_position: Position | None) -> None:
+        """Restores the current and previous position, e.g. when a move is undone."""
+        self._position = position
+        self._previous_position = previous_position
+
     @property
     def previous_position(self) -> Position | None:
         """Returns the previous position of the worker."""
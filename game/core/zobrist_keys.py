@@ -0,0 +1,76 @@
+import random
+from typing import Dict, Tuple
+
+from colors.color import Color
+
+
+class ZobristKeys:
+    """
+    Random 64-bit keys used to hash a board state (Zobrist hashing).
+
+    Keys are generated once per (width, height) from a fixed seed, so every
+    process computes identical hashes for identical states. Empty tiles
+    (level 0, no dome, no worker) contribute no key, so an empty board
+    hashes to 0 with the first player to move.
+    """
+
+    SEED = 0x5A4E7031
+
+    _cache: Dict[Tuple[int, int], 'ZobristKeys'] = {}
+
+    def __init__(self, width: int, height: int) -> None:
+        """Generate the key tables for a board of the given size."""
+        rng = random.Random(f"{self.SEED}:{width}x{height}")
+        size = width * height
+
+        def keys() -> Tuple[int, ...]:
+            return tuple(rng.getrandbits(64) for _ in range(size))
+
+        self._levels: Tuple[Tuple[int, ...], ...] = tuple(
+            (0,) + tuple(rng.getrandbits(64) for _ in range(3)) for _ in range(size)
+        )
+        self._domes = keys()
+        self._workers: Dict[Color, Tuple[int, ...]] = {color: keys() for color in Color}
+        self._moved_from = keys()
+        self._built_at = keys()
+        self._side = rng.getrandbits(64)
+
+    @classmethod
+    def for_size(cls, width: int, height: int) -> 'ZobristKeys':
+        """Returns the shared key tables for a board size, generating them on first use."""
+        key = (width, height)
+        keys = cls._cache.get(key)
+        if keys is None:
+            keys = cls(width, height)
+            cls._cache[key] = keys
+        return keys
+
+    @property
+    def levels(self) -> Tuple[Tuple[int, ...], ...]:
+        """Returns, per tile index, the key of each building level (level 0 has key 0)."""
+        return self._levels
+
+    @property
+    def domes(self) -> Tuple[int, ...]:
+        """Returns, per tile index, the key of a dome."""
+        return self._domes
+
+    @property
+    def workers(self) -> Dict[Color, Tuple[int, ...]]:
+        """Returns, per color, the key of a worker on each tile index."""
+        return self._workers
+
+    @property
+    def moved_from(self) -> Tuple[int, ...]:
+        """Returns, per tile index, the key of the tile the last move this turn started from."""
+        return self._moved_from
+
+    @property
+    def built_at(self) -> Tuple[int, ...]:
+        """Returns, per tile index, the key of the tile the last build this turn was on."""
+        return self._built_at
+
+    @property
+    def side(self) -> int:
+        """Returns the key toggled every time the side to move changes."""
+        return self._side
@@ -0,0 +1,145 @@
+from typing import Iterator, List, Optional
+
+from ai.endgame_solver import EndgameSolver, SolveResult
+from colors.color import Color
+from core.board import Board
+from core.game import Game
+from core.player import Player
+from game_management.turn import Turn
+from game_management.turn_generator import TurnGenerator
+from god_cards.god_card_factory import GodCardFactory
+from records.game_recorder import GameRecorder
+from win_conditions.standard_win_condition import StandardWinCondition
+
+
+class SantoriniEngine:
+    """
+    Headless Santorini rules engine.
+
+    Wraps a standard two-player Game behind a small API: create a game,
+    list legal turns, apply a turn, query the result and solve for a
+    forced win. It only imports the rules packages (core, actions,
+    buildings, god_cards, win_conditions, game_management, game_modes) and
+    the endgame solver, never pygame, so it can run in worker processes
+    and on machines without a display. Run it with the game directory on
+    the import path, e.g. PYTHONPATH=game.
+    """
+
+    PLAYER_COLORS = (Color.RED, Color.BLUE)
+
+    def __init__(self, card_names: Optional[List[str]] = None, width: int = 5, height: int = 5,
+                 seed: Optional[int | str] = None, recorder: Optional[GameRecorder] = None) -> None:
+        """
+        Create a new standard game with random worker placement.
+
+        *card_names* gives each player's god card in seat order; when omitted
+        the cards are drawn from the god card deck like a normal game. A
+        *seed* makes the placement and the card draw reproducible (see Game)
+        and a *recorder* records the game. No player timers are used.
+        """
+        players = []
+        for seat, color in enumerate(self.PLAYER_COLORS):
+            god_card = GodCardFactory.create_card(card_names[seat]) if card_names else None
+            players.append(Player(f"Player {seat + 1}", 0, color, god_card=god_card, timer_seconds=None))
+
+        self._win_condition = StandardWinCondition()
+        self._game = Game(players, width, height, win_condition=self._win_condition, seed=seed,
+                          recorder=recorder)
+        self._generator = TurnGenerator(self._win_condition)
+        self._winner: Optional[Player] = None
+        self._turn_count = 0
+
+        # A player who cannot complete a turn at the start of the game loses.
+        self._check_stalemate()
+
+    @property
+    def game(self) -> Game:
+        """Returns the underlying game."""
+        return self._game
+
+    @property
+    def board(self) -> Board:
+        """Returns the game board."""
+        return self._game.board
+
+    @property
+    def players(self) -> List[Player]:
+        """Returns the players in seat order."""
+        return self._game.players
+
+    @property
+    def current_player(self) -> Player:
+        """Returns the player to move."""
+        return self._game.turn_manager.current_player
+
+    @property
+    def turn_generator(self) -> TurnGenerator:
+        """Returns the turn generator used by the engine."""
+        return self._generator
+
+    @property
+    def turn_count(self) -> int:
+        """Returns the number of turns applied so far."""
+        return self._turn_count
+
+    def iter_legal_turns(self) -> Iterator[Turn]:
+        """Lazily yield the legal turns of the player to move (see TurnGenerator.generate)."""
+        if self._winner is not None:
+            return iter(())
+        return self._generator.generate(self.current_player, self.board)
+
+    def legal_turns(self) -> List[Turn]:
+        """Returns every legal turn of the player to move (empty once the game is over)."""
+        return list(self.iter_legal_turns())
+
+    def apply_turn(self, turn: Turn) -> Optional[Player]:
+        """
+        Play *turn* for the player to move and pass the move on.
+
+        Returns the winner if the turn ended the game, otherwise None.
+        """
+        if self._winner is not None:
+            raise ValueError("The game is already over.")
+
+        player = self.current_player
+        self._generator.apply_turn(turn, player, self.board)
+        self._turn_count += 1
+        if self._game.recorder is not None:
+            self._game.recorder.record_turn(turn)
+
+        if turn.is_win:
+            self._winner = player
+            return self._winner
+
+        self._game.turn_manager.end_turn()
+        self._check_stalemate()
+        return self._winner
+
+    def solve(self, max_plies: int, time_limit: Optional[float] = None) -> SolveResult:
+        """
+        Prove whether the player to move can force a win within *max_plies* turns.
+
+        The result carries the proving line; the game itself is unchanged.
+        """
+        if self._winner is not None:
+            raise ValueError("The game is already over.")
+        side = self.players.index(self.current_player)
+        return EndgameSolver(self._generator).solve(self.players, side, self.board, max_plies, time_limit)
+
+    def is_over(self) -> bool:
+        """Returns True once a player has won."""
+        return self._winner is not None
+
+    def result(self) -> Optional[Player]:
+        """Returns the winner, or None while the game continues."""
+        return self._winner
+
+    def _check_stalemate(self) -> None:
+        """The player to move loses if they cannot complete any turn."""
+        turns = self._generator.generate(self.current_player, self.board)
+        has_turn = next(turns, None) is not None
+        turns.close()
+        if not has_turn:
+            players = self.players
+            current_index = players.index(self.current_player)
+            self._winner = players[(current_index + 1) % len(players)]
@@ -1,9 +1,12 @@
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from core.tile import Tile
 from utils.validator import Validator
 from game_management.turn_manager import TurnManager
 
+if TYPE_CHECKING:
+    from records.game_recorder import GameRecorder
+
 class GameInputHandler:
     """
     Handles game input interactions and UI logic.
@@ -11,9 +14,10 @@ class GameInputHandler:
     Separates UI concerns from core game logic.
     """
     
-    def __init__(self, turn_manager: TurnManager) -> None:
-        """Initialize with a reference to the turn manager."""
+    def __init__(self, turn_manager: TurnManager, recorder: Optional['GameRecorder'] = None) -> None:
+        """Initialize with a reference to the turn manager and an optional game recorder."""
         self._turn_manager = turn_manager
+        self._recorder = recorder
     
     def handle_tile_click(self, tile: Tile) -> Optional[str]:
         """
@@ -41,8 +45,7 @@ class GameInputHandler:
             return "You can only select your own workers."
             
         # Check if worker has valid moves (touch-move rule)
-        valid_moves = Validator.get_valid_move_tiles(tile.worker, board)
-        if not valid_moves:
+        if not Validator.has_valid_move(tile.worker, board):
             return "This worker has no valid moves."
             
         # Select the worker
@@ -53,14 +56,14 @@ class GameInputHandler:
         """Handle action execution logic and return feedback."""
         # Check if turn is complete
         if self._turn_manager._phase_manager.is_turn_complete():
-            self._turn_manager.end_turn()
+            self._end_turn()
             current_player = self._turn_manager.current_player
             return f"Turn ended. Now {current_player.player_name}'s turn."
         
         # Get current action
         current_action = self._turn_manager._phase_manager.get_current_action()
         if current_action is None:
-            self._turn_manager.end_turn()
+            self._end_turn()
             current_player = self._turn_manager.current_player
             return f"Turn ended. Now {current_player.player_name}'s turn."
         
@@ -73,7 +76,10 @@ class GameInputHandler:
             return f"Invalid {action_name.lower()}. Please try again."
         
         # Execute action
+        worker_position = current_worker.position
         result = current_action.execute(current_worker, board, tile)
+        if self._recorder is not None:
+            self._recorder.record_action(worker_position, tile.position)
         
         # Handle the ActionResult (this will add additional actions if needed)
         self._turn_manager._phase_manager.handle_action_result(result)
@@ -83,4 +89,10 @@ class GameInputHandler:
         if next_phase == "End Turn":
             return f"{current_action.get_name()} completed."
         else:
-            return f"{current_action.get_name()} completed. Next: {next_phase}" 
\ No newline at end of file
+            return f"{current_action.get_name()} completed. Next: {next_phase}" 
+
+    def _end_turn(self) -> None:
+        """End the current player's turn, completing its record."""
+        if self._recorder is not None:
+            self._recorder.end_turn()
+        self._turn_manager.end_turn()
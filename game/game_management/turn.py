@@ -0,0 +1,50 @@
+from typing import Optional, Tuple
+
+from core.position import Position
+
+
+class Turn:
+    """
+    A complete turn: the worker that acts and the target of each action.
+
+    Steps follow the player's action sequence, including actions inserted
+    while the turn is played (e.g. Triton's chained moves). A skipped
+    optional action is recorded as None.
+    """
+
+    __slots__ = ("_worker_position", "_steps", "_is_win")
+
+    def __init__(self, worker_position: Position, steps: Tuple[Optional[Position], ...], is_win: bool = False) -> None:
+        """Initialize a turn from the worker's starting position and its action targets."""
+        self._worker_position = worker_position
+        self._steps = steps
+        self._is_win = is_win
+
+    @property
+    def worker_position(self) -> Position:
+        """Returns the position of the acting worker at the start of the turn."""
+        return self._worker_position
+
+    @property
+    def steps(self) -> Tuple[Optional[Position], ...]:
+        """Returns the target of each action in order (None = skipped optional action)."""
+        return self._steps
+
+    @property
+    def is_win(self) -> bool:
+        """Returns True if the turn ends with a winning move."""
+        return self._is_win
+
+    def __eq__(self, other: object) -> bool:
+        """Two turns are equal when they select the same worker and targets."""
+        if not isinstance(other, Turn):
+            return NotImplemented
+        return self._worker_position == other._worker_position and self._steps == other._steps
+
+    def __hash__(self) -> int:
+        """Returns the hash of the worker position and targets."""
+        return hash((self._worker_position, self._steps))
+
+    def __repr__(self) -> str:
+        """Returns a readable representation of the turn."""
+        return f"Turn({self._worker_position}, {self._steps}, is_win={self._is_win})"
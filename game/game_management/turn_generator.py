@@ -0,0 +1,170 @@
+from typing import Callable, Iterator, List, Optional, Set, Tuple
+
+from actions.action import Action
+from actions.move_action import MoveAction
+from actions.undo_record import UndoRecord
+from colors.color import Color
+from core.bit_board import BitBoard
+from core.board import Board
+from core.player import Player
+from core.position import Position
+from core.worker import Worker
+from game_management.turn import Turn
+from win_conditions.standard_win_condition import StandardWinCondition
+from win_conditions.win_condition_strategy import WinConditionStrategy
+
+
+class TurnGenerator:
+    """
+    Enumerates every complete legal turn for a player's god card.
+
+    Turns are explored depth-first by executing the player's action
+    sequence on the board and undoing it again, so no state is copied.
+    Optional actions are explored both taken and skipped, actions inserted
+    by an ActionResult (Triton's chained moves) are followed, and a move
+    that wins ends the turn. Turns that reach the same final state (e.g.
+    Demeter builds in either order, Triton chains that revisit a tile) are
+    yielded only once.
+
+    generate_ordered() yields the same turns best-first for alpha-beta
+    search: wins, then turns that block an opponent's climb threat, then
+    climbs, then the rest.
+    """
+
+    BLOCK = 0
+    CLIMB = 1
+    QUIET = 2
+
+    def __init__(self, win_condition: Optional[WinConditionStrategy] = None) -> None:
+        """Initialize the generator with the win condition that ends a turn early."""
+        self._win_condition = win_condition or StandardWinCondition()
+
+    def generate(self, player: Player, board: Board) -> Iterator[Turn]:
+        """
+        Lazily yield every distinct complete turn for *player*.
+
+        While a turn is being yielded the board is left in that turn's final
+        state, so callers can inspect it; anything they change must be undone
+        before asking for the next turn. The board is restored once the
+        generator is exhausted or closed.
+        """
+        actions = tuple(player.god_card.get_action_sequence())
+        finals: Set[int] = set()
+        partials: Set[tuple] = set()
+        for worker in list(player.workers):
+            yield from self._expand(player, worker, board, actions, worker.position, [], finals, partials)
+
+    def generate_ordered(self, player: Player, board: Board,
+                         rank: Optional[Callable[[Turn], int]] = None) -> Iterator[Turn]:
+        """
+        Yield every distinct complete turn for *player*, most promising first.
+
+        Winning turns are yielded as soon as they are found. The others are
+        collected and sorted into turns that leave the opponent fewer tiles
+        to win on (by the bitboard's threat index),
+        turns that raise the player's workers, and the rest; within each
+        group a higher *rank* goes first, ties keep generation order. As
+        with generate(), the board is in each turn's final state while the
+        turn is yielded.
+        """
+        state = board.state
+        color = player.player_color
+        threats = state.threats_against(color).bit_count()
+        height = self._worker_height(state, color)
+        ordered: List[Tuple[int, int, int, Turn]] = []
+        turns = self.generate(player, board)
+        try:
+            for turn in turns:
+                if turn.is_win:
+                    yield turn
+                    continue
+                if state.threats_against(color).bit_count() < threats:
+                    group = self.BLOCK
+                elif self._worker_height(state, color) > height:
+                    group = self.CLIMB
+                else:
+                    group = self.QUIET
+                ordered.append((group, -rank(turn) if rank is not None else 0, len(ordered), turn))
+        finally:
+            turns.close()
+
+        ordered.sort()
+        for _, _, _, turn in ordered:
+            history = self.apply_turn(turn, player, board)
+            try:
+                yield turn
+            finally:
+                self.undo_turn(history, board)
+
+    def apply_turn(self, turn: Turn, player: Player, board: Board) -> List[Tuple[Action, UndoRecord]]:
+        """
+        Play a turn produced by generate() on the board.
+
+        Returns the executed actions with their undo records, to be given
+        back to undo_turn().
+        """
+        worker = board.get_tile(turn.worker_position).worker
+        remaining = list(player.god_card.get_action_sequence())
+        history: List[Tuple[Action, UndoRecord]] = []
+        for target in turn.steps:
+            action = remaining.pop(0)
+            if target is None:
+                continue
+            result = action.execute(worker, board, board.get_tile(target))
+            remaining[0:0] = result.additional_actions
+            history.append((action, result.undo_record))
+        return history
+
+    def undo_turn(self, history: List[Tuple[Action, UndoRecord]], board: Board) -> None:
+        """Undo a turn played by apply_turn(), restoring the exact prior state."""
+        for action, record in reversed(history):
+            action.undo(record.worker, board, record)
+
+    def _expand(self, player: Player, worker: Worker, board: Board, remaining: Tuple[Action, ...],
+                start: Position, steps: List[Optional[Position]], finals: Set[int], partials: Set[tuple]) -> Iterator[Turn]:
+        """Yield the turns that complete the *remaining* actions from the current board state."""
+        state = board.state
+
+        # Turn complete - yield it unless another path reached the same state
+        if not remaining:
+            key = state.position_hash
+            if key not in finals:
+                finals.add(key)
+                yield Turn(start, tuple(steps))
+            return
+
+        # Same state with the same actions left was already explored
+        partial_key = (state.zobrist, worker.position, tuple((type(a), a.optional) for a in remaining))
+        if partial_key in partials:
+            return
+        partials.add(partial_key)
+
+        action = remaining[0]
+        rest = remaining[1:]
+
+        if action.optional:
+            steps.append(None)
+            yield from self._expand(player, worker, board, rest, start, steps, finals, partials)
+            steps.pop()
+
+        for index in BitBoard.iter_indices(action.get_valid_mask(worker, board)):
+            tile = board.get_tile_at_index(index)
+            result = action.execute(worker, board, tile)
+            steps.append(tile.position)
+            try:
+                if isinstance(action, MoveAction) and self._win_condition.check_win(player, worker, board):
+                    key = state.position_hash
+                    if key not in finals:
+                        finals.add(key)
+                        yield Turn(start, tuple(steps), is_win=True)
+                else:
+                    yield from self._expand(player, worker, board, tuple(result.additional_actions) + rest,
+                                            start, steps, finals, partials)
+            finally:
+                steps.pop()
+                action.undo(worker, board, result.undo_record)
+
+    @staticmethod
+    def _worker_height(state: BitBoard, color: Color) -> int:
+        """Returns the summed building level under the workers of *color*."""
+        return sum(state.level(index) for index in BitBoard.iter_indices(state.worker_mask(color)))
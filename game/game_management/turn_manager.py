@@ -4,6 +4,7 @@ from core.board import Board
 from core.player import Player
 from core.worker import Worker
 from game_management.sequence import Sequence
+from game_management.turn import Turn
 from win_conditions.win_condition_strategy import WinConditionStrategy
 from game_management.game_phase_manager import GamePhaseManager
 from win_conditions.win_condition_checker import WinConditionChecker
@@ -62,6 +63,9 @@ class TurnManager:
         
         if self._timer_manager:
             self._timer_manager.pause_current_timer()
+        
+        # Pass the move in the board's hash and clear this turn's markers.
+        self._board.state.end_turn()
             
         # Advance to the next player in the sequence.
         self._players.advance()
@@ -71,7 +75,32 @@ class TurnManager:
 
         # Start the next player's turn.
         self.start_turn()
+
+        # Let every player react to the new position (e.g. computer players cancel stale pondering).
+        for player in self._players.items:
+            player.handle_turn_end(self.current_player, self._players.items, self._board)
         
+    def play_turn(self, turn: Turn) -> None:
+        """
+        Play a complete turn (e.g. one chosen by a computer player) for the current player.
+
+        The turn passes to the next player afterwards unless it was a win, so
+        the result can still be checked with get_game_result().
+        """
+        worker = self._board.get_tile(turn.worker_position).worker
+        self._phase_manager.current_worker = worker
+        for target in turn.steps:
+            # A skipped optional action
+            if target is None:
+                self._phase_manager.advance_phase()
+                continue
+            action = self._phase_manager.get_current_action()
+            result = action.execute(worker, self._board, self._board.get_tile(target))
+            self._phase_manager.handle_action_result(result)
+
+        if not turn.is_win:
+            self.end_turn()
+
     def set_win_condition_strategy(self, strategy: WinConditionStrategy) -> None:
         """Set the win condition strategy."""
         self._win_checker.strategy = strategy
@@ -1,3 +1,4 @@
+import random
 from abc import ABC, abstractmethod
 from typing import List, Optional, TYPE_CHECKING
 
@@ -15,8 +16,9 @@ class GameMode(ABC):
     """
     
     @abstractmethod
-    def initialize_game(self, players: List['Player'], board: 'Board') -> None:
-        """Initialize the game mode with players and board."""
+    def initialize_game(self, players: List['Player'], board: 'Board',
+                        rng: Optional[random.Random] = None) -> None:
+        """Initialize the game mode with players and board; *rng* makes any random setup reproducible."""
         pass
     
     @abstractmethod
@@ -0,0 +1,41 @@
+import random
+from typing import List, Optional, Tuple
+
+from buildings.block import Block
+from buildings.dome import Dome
+from core.board import Board
+from core.player import Player
+from core.position import Position
+from core.worker import Worker
+from game_modes.standard_game_mode import StandardGameMode
+
+
+class ReplayGameMode(StandardGameMode):
+    """
+    Game mode that sets up a recorded game instead of placing workers randomly.
+
+    Play then follows the standard rules, so the recorded turns can be
+    played through the turn manager.
+    """
+
+    def __init__(self, workers: Tuple[Tuple[Position, ...], ...],
+                 buildings: Tuple[Tuple[Position, int, bool], ...] = ()) -> None:
+        """Initialize the mode with each seat's worker positions and the (position, level, dome) buildings."""
+        self._workers = workers
+        self._buildings = buildings
+
+    def initialize_game(self, players: List[Player], board: Board,
+                        rng: Optional[random.Random] = None) -> None:
+        """Place the recorded buildings and workers (nothing is random, so *rng* is unused)."""
+        for position, level, dome in self._buildings:
+            # A dome on a level-3 tower is a Dome at level 4, as built by Block.increase_level
+            board.get_tile(position).building = Dome(4 if level == 3 else level) if dome else Block(level)
+        for player, positions in zip(players, self._workers):
+            for position in positions:
+                worker = Worker(position, player.player_color)
+                player.add_worker(worker)
+                board.get_tile(position).worker = worker
+
+    def get_mode_name(self) -> str:
+        """Get the mode name."""
+        return "Replay"
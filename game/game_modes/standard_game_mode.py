@@ -14,11 +14,13 @@ class StandardGameMode(GameMode):
     Provides default behavior for normal Santorini gameplay.
     """
     
-    def initialize_game(self, players: List[Player], board: Board) -> None:
+    def initialize_game(self, players: List[Player], board: Board,
+                        rng: Optional[random.Random] = None) -> None:
         """Initialize standard game with random worker placement and god cards."""
+        rng = rng or random.Random()
         # Place workers randomly for each player
         for player in players:
-            self._place_random_workers(player, board)
+            self._place_random_workers(player, board, rng)
     
     def is_valid_tile_click(self, tile: Tile, current_player: Player, 
                            current_worker: Optional[Worker], phase: str) -> bool:
@@ -50,11 +52,11 @@ class StandardGameMode(GameMode):
         """Standard mode doesn't need post-action updates."""
         pass  # No special handling needed for standard mode
     
-    def _place_random_workers(self, player: Player, board: Board) -> None:
+    def _place_random_workers(self, player: Player, board: Board, rng: random.Random) -> None:
         """Places two workers randomly on the board for a player."""
         # Get all empty tiles on the board and shuffle them.
         tiles = board.get_all_empty_tiles()
-        random.shuffle(tiles)
+        rng.shuffle(tiles)
         
         # Place two workers on the first two shuffled tiles.
         for tile in tiles[:2]:
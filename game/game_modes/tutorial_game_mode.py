@@ -1,3 +1,4 @@
+import random
 from typing import List, Optional
 
 from game_modes.game_mode import GameMode
@@ -8,6 +9,7 @@ from core.worker import Worker
 from core.position import Position
 from tutorial.tutorial_manager import TutorialManager
 from buildings.block import Block
+from buildings.dome import Dome
 
 class TutorialGameMode(GameMode):
     """
@@ -25,8 +27,9 @@ class TutorialGameMode(GameMode):
         """Get the tutorial manager."""
         return self._tutorial_manager
     
-    def initialize_game(self, players: List[Player], board: Board) -> None:
-        """Initialize tutorial with predefined setup."""
+    def initialize_game(self, players: List[Player], board: Board,
+                        rng: Optional[random.Random] = None) -> None:
+        """Initialize tutorial with predefined setup (nothing is random, so *rng* is unused)."""
         if len(players) < 1:
             raise ValueError("Tutorial mode requires at least one player")
         
@@ -182,8 +185,6 @@ class TutorialGameMode(GameMode):
             
             # Create the height trap around (1,1)
             # Domes at (1,0) and (0,1) - can't move to these
-            from buildings.dome import Dome
-            
             dome_tile_1 = board.get_tile(Position(1, 0))
             dome_tile_1.building = Dome()  # Dome at level 4
             
@@ -1,5 +1,5 @@
 import random
-from typing import List
+from typing import List, Optional
 
 from god_cards.god_card import GodCard
 from god_cards.god_card_factory import GodCardFactory
@@ -12,8 +12,9 @@ class GodCardDeck:
     Adding new god cards only requires registering them with the factory.
     """
     
-    def __init__(self, card_names: List[str]) -> None:
-        """Initializes the deck with available cards."""
+    def __init__(self, card_names: List[str], rng: Optional[random.Random] = None) -> None:
+        """Initializes the deck with available cards; *rng* decides the draws."""
+        self._rng = rng or random.Random()
         # Create instances of all specified cards
         self._cards = []
         for card_name in card_names:
@@ -35,7 +36,7 @@ class GodCardDeck:
             raise ValueError("No more god cards available!")
         
         # Randomly select a card
-        card = random.choice(self._cards) 
+        card = self._rng.choice(self._cards)
         # Remove the drawn card from the deck
         self._cards.remove(card) 
         
@@ -0,0 +1,172 @@
+import struct
+from typing import Dict, List, Optional, Tuple
+
+from core.position import Position
+from game_management.turn import Turn
+
+
+class RecordedGame:
+    """
+    A finished game as stored in a game record file.
+
+    Holds everything needed to replay the game: the seed it was created
+    with, the board size, each seat's god card and starting workers, the
+    buildings on the board before the first turn (none in a standard
+    game), every turn and the winning seat.
+    """
+
+    __slots__ = ("_seed", "_width", "_height", "_cards", "_workers", "_buildings", "_turns", "_winner")
+
+    def __init__(self, seed: str, width: int, height: int, cards: Tuple[str, ...],
+                 workers: Tuple[Tuple[Position, ...], ...], buildings: Tuple[Tuple[Position, int, bool], ...],
+                 turns: List[Turn], winner: Optional[int]) -> None:
+        """Initialize a recorded game."""
+        self._seed = seed
+        self._width = width
+        self._height = height
+        self._cards = cards
+        self._workers = workers
+        self._buildings = buildings
+        self._turns = turns
+        self._winner = winner
+
+    @property
+    def seed(self) -> str:
+        """Returns the seed the game was created with ("" if it was unseeded)."""
+        return self._seed
+
+    @property
+    def width(self) -> int:
+        """Returns the board width."""
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """Returns the board height."""
+        return self._height
+
+    @property
+    def cards(self) -> Tuple[str, ...]:
+        """Returns the god card of each seat."""
+        return self._cards
+
+    @property
+    def workers(self) -> Tuple[Tuple[Position, ...], ...]:
+        """Returns the starting worker positions of each seat."""
+        return self._workers
+
+    @property
+    def buildings(self) -> Tuple[Tuple[Position, int, bool], ...]:
+        """Returns the (position, level, dome) of every tile built on before the first turn."""
+        return self._buildings
+
+    @property
+    def turns(self) -> List[Turn]:
+        """Returns the turns in the order they were played, starting with the first seat."""
+        return self._turns
+
+    @property
+    def winner(self) -> Optional[int]:
+        """Returns the winning seat, or None if the game was not decided."""
+        return self._winner
+
+    def __eq__(self, other: object) -> bool:
+        """Two recorded games are equal when every stored field is."""
+        if not isinstance(other, RecordedGame):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        """Returns a short summary of the game."""
+        return (f"RecordedGame(seed={self._seed!r}, cards={self._cards}, turns={len(self._turns)}, "
+                f"winner={self._winner})")
+
+
+# A record file starts with FILE_MAGIC; each record follows as its length (RECORD_LENGTH) and its bytes.
+FILE_MAGIC = b"SANTREC1"
+RECORD_LENGTH = struct.Struct("<I")
+
+# Record layout, little-endian. Squares are bitboard indexes (x * height + y) in one byte.
+#   header   width, height, seats, winner (0xFF = none), turn count (u16), seed length
+#   seed     UTF-8 bytes
+#   per seat card name length, card name (ASCII), worker count, worker squares
+#   setup    building count, then (square, level | DOME_FLAG) pairs
+#   per turn worker square, step count | WIN_FLAG, step squares (NO_SQUARE = skipped action)
+_HEADER = struct.Struct("<BBBBHB")
+NO_SQUARE = 0xFF
+WIN_FLAG = 0x80
+DOME_FLAG = 0x80
+
+# Positions by square, per (width, height)
+_positions: Dict[Tuple[int, int], Tuple[Position, ...]] = {}
+
+
+def encode_game(game: RecordedGame) -> bytes:
+    """Returns the compact binary encoding of a recorded game (about 4 bytes per turn)."""
+    height = game.height
+    seed = game.seed.encode("utf-8")
+    if game.width * height > NO_SQUARE or len(seed) > 0xFF or len(game.turns) > 0xFFFF:
+        raise ValueError(f"{game!r} is too large for the record format.")
+
+    def square(position: Optional[Position]) -> int:
+        return NO_SQUARE if position is None else position.x * height + position.y
+
+    winner = NO_SQUARE if game.winner is None else game.winner
+    data = bytearray(_HEADER.pack(game.width, height, len(game.cards), winner, len(game.turns), len(seed)))
+    data += seed
+    for card, workers in zip(game.cards, game.workers):
+        name = card.encode("ascii")
+        data.append(len(name))
+        data += name
+        data.append(len(workers))
+        data.extend(square(position) for position in workers)
+    data.append(len(game.buildings))
+    for position, level, dome in game.buildings:
+        data.append(square(position))
+        data.append(level | (DOME_FLAG if dome else 0))
+    for turn in game.turns:
+        data.append(square(turn.worker_position))
+        data.append(len(turn.steps) | (WIN_FLAG if turn.is_win else 0))
+        data.extend(square(step) for step in turn.steps)
+    return bytes(data)
+
+
+def decode_game(data: bytes) -> RecordedGame:
+    """Returns the recorded game of an encoding made by encode_game()."""
+    width, height, seats, winner, turn_count, seed_length = _HEADER.unpack_from(data)
+    positions = _positions.get((width, height))
+    if positions is None:
+        positions = _positions[width, height] = tuple(Position(index // height, index % height)
+                                                      for index in range(width * height))
+    offset = _HEADER.size
+    seed = bytes(data[offset:offset + seed_length]).decode("utf-8")
+    offset += seed_length
+
+    cards = []
+    workers = []
+    for _ in range(seats):
+        length = data[offset]
+        cards.append(bytes(data[offset + 1:offset + 1 + length]).decode("ascii"))
+        offset += 1 + length
+        count = data[offset]
+        workers.append(tuple(positions[index] for index in data[offset + 1:offset + 1 + count]))
+        offset += 1 + count
+
+    buildings = []
+    for _ in range(data[offset]):
+        index, value = data[offset + 1], data[offset + 2]
+        buildings.append((positions[index], value & ~DOME_FLAG, bool(value & DOME_FLAG)))
+        offset += 2
+    offset += 1
+
+    turns = []
+    for _ in range(turn_count):
+        worker, count = data[offset], data[offset + 1]
+        length = count & ~WIN_FLAG
+        steps = tuple([None if index == NO_SQUARE else positions[index]
+                       for index in data[offset + 2:offset + 2 + length]])
+        turns.append(Turn(positions[worker], steps, bool(count & WIN_FLAG)))
+        offset += 2 + length
+
+    return RecordedGame(seed, width, height, tuple(cards), tuple(workers), tuple(buildings), turns,
+                        None if winner == NO_SQUARE else winner)
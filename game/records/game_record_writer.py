@@ -0,0 +1,132 @@
+import multiprocessing
+import os
+from typing import Optional
+
+from records.game_record import FILE_MAGIC, RECORD_LENGTH
+from records.record_index import INDEX_ENTRY, index_path, update_index
+
+
+class GameRecordWriter:
+    """
+    Append-only writer of encoded game records.
+
+    The file starts with FILE_MAGIC; each record follows as its length
+    (u32, little-endian) and the bytes from encode_game(). Records are
+    collected in a buffer and written in chunks of about *flush_size*
+    bytes, so millions of games cost few system calls. The offset index
+    next to the file (see record_index) is kept up to date as well.
+    Appending to an existing record file continues it, dropping a record
+    left half-written by an interrupted run.
+    """
+
+    FLUSH_SIZE = 1 << 20
+
+    def __init__(self, path: str, flush_size: int = FLUSH_SIZE) -> None:
+        """Open the record file at *path* for appending, creating it if needed."""
+        self._flush_size = flush_size
+        self._buffer = bytearray()
+        self._index_buffer = bytearray()
+        self._count = 0
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            with open(path, "wb") as file:
+                file.write(FILE_MAGIC)
+        _, self._offset = update_index(path)
+        self._file = open(path, "r+b")
+        self._file.truncate(self._offset)
+        self._file.seek(self._offset)
+        self._index = open(index_path(path), "ab")
+
+    @property
+    def count(self) -> int:
+        """Returns the number of records written by this writer."""
+        return self._count
+
+    def write(self, record: bytes) -> None:
+        """Append one encoded game record."""
+        self._index_buffer += INDEX_ENTRY.pack(self._offset)
+        self._buffer += RECORD_LENGTH.pack(len(record))
+        self._buffer += record
+        self._offset += RECORD_LENGTH.size + len(record)
+        self._count += 1
+        if len(self._buffer) >= self._flush_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered records to the file, then their index entries."""
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+        self._file.flush()
+        if self._index_buffer:
+            self._index.write(self._index_buffer)
+            self._index_buffer.clear()
+        self._index.flush()
+
+    def close(self) -> None:
+        """Flush and close the file and its index."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+            self._index.close()
+
+    def __enter__(self) -> 'GameRecordWriter':
+        """Use the writer as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the writer when leaving the context."""
+        self.close()
+
+
+def _write_records(path: str, queue: multiprocessing.Queue, flush_size: int) -> None:
+    """Writer process: append every record from the queue until the None sentinel arrives."""
+    with GameRecordWriter(path, flush_size) as writer:
+        while (record := queue.get()) is not None:
+            writer.write(record)
+
+
+class RecordWriterProcess:
+    """
+    A single process that writes the game records of many producers.
+
+    Producers (e.g. self-play pool workers) put encoded records on
+    queue; the queue holds at most *queue_size* records, so producers
+    wait while the writer catches up and memory stays flat however many
+    games are played. close() writes everything still queued and stops
+    the process.
+    """
+
+    QUEUE_SIZE = 4096
+
+    def __init__(self, path: str, queue_size: int = QUEUE_SIZE,
+                 flush_size: int = GameRecordWriter.FLUSH_SIZE) -> None:
+        """Start the writer process for the record file at *path*."""
+        self._path = os.path.abspath(path)
+        self._queue: multiprocessing.Queue = multiprocessing.Queue(queue_size)
+        self._process: Optional[multiprocessing.Process] = multiprocessing.Process(
+            target=_write_records, args=(self._path, self._queue, flush_size), daemon=True)
+        self._process.start()
+
+    @property
+    def queue(self) -> multiprocessing.Queue:
+        """Returns the queue to put encoded records on (it can be passed to pool workers)."""
+        return self._queue
+
+    def put(self, record: bytes) -> None:
+        """Queue one encoded record, waiting while the queue is full."""
+        self._queue.put(record)
+
+    def close(self) -> None:
+        """Write the remaining records and stop the writer process."""
+        if self._process is not None:
+            self._queue.put(None)
+            self._process.join()
+            self._process = None
+
+    def __enter__(self) -> 'RecordWriterProcess':
+        """Use the writer process as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Stop the writer process when leaving the context."""
+        self.close()
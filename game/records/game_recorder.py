@@ -0,0 +1,77 @@
+from typing import List, Optional
+
+from core.board import Board
+from core.player import Player
+from core.position import Position
+from game_management.turn import Turn
+from records.game_record import RecordedGame
+
+
+class GameRecorder:
+    """
+    Collects the record of one game while it is played.
+
+    start() captures the setup once the workers are placed. Turns arrive
+    either whole (record_turn, for computer and headless turns) or one
+    action at a time as the input handler applies them (record_action,
+    record_skip and end_turn). finish() returns the RecordedGame.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a recorder for a game that has not started yet."""
+        self._seed = ""
+        self._width = 0
+        self._height = 0
+        self._cards: tuple = ()
+        self._workers: tuple = ()
+        self._buildings: tuple = ()
+        self._turns: List[Turn] = []
+        self._worker_position: Optional[Position] = None
+        self._steps: List[Optional[Position]] = []
+
+    def start(self, seed: Optional[int | str], board: Board, players: List[Player]) -> None:
+        """Capture the seed, board size, god cards, workers and buildings before the first turn."""
+        state = board.state
+        self._seed = "" if seed is None else str(seed)
+        self._width = board.width
+        self._height = board.height
+        self._cards = tuple(player.god_card.name for player in players)
+        self._workers = tuple(tuple(worker.position for worker in player.workers) for player in players)
+        self._buildings = tuple((Position(*state.coordinates(index)), state.level(index), state.has_dome(index))
+                                for index in range(state.size)
+                                if state.level(index) or state.has_dome(index))
+        self._turns = []
+        self._worker_position = None
+        self._steps = []
+
+    def record_turn(self, turn: Turn) -> None:
+        """Record a complete turn."""
+        self._turns.append(turn)
+
+    def record_action(self, worker_position: Position, target: Position) -> None:
+        """Record one applied action of the turn in progress; *worker_position* is where the worker stood."""
+        if self._worker_position is None:
+            self._worker_position = worker_position
+        self._steps.append(target)
+
+    def record_skip(self) -> None:
+        """Record a skipped optional action of the turn in progress."""
+        self._steps.append(None)
+
+    def end_turn(self, is_win: bool = False) -> None:
+        """Complete the turn in progress (if any action was recorded)."""
+        if self._worker_position is not None:
+            self._turns.append(Turn(self._worker_position, tuple(self._steps), is_win))
+        self._worker_position = None
+        self._steps = []
+
+    def finish(self, winner: Optional[int]) -> RecordedGame:
+        """
+        Returns the record of the game, won by seat *winner* (None if undecided).
+
+        A turn still in progress is the one that ended the game, so it is
+        stored as a win when there is a winner.
+        """
+        self.end_turn(is_win=winner is not None)
+        return RecordedGame(self._seed, self._width, self._height, self._cards, self._workers, self._buildings,
+                            list(self._turns), winner)
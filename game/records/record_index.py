@@ -0,0 +1,104 @@
+import mmap
+import os
+import struct
+from typing import Tuple
+
+from records.game_record import FILE_MAGIC, RECORD_LENGTH
+
+# The index file starts with INDEX_MAGIC; entry i is the offset of record i in the data file.
+INDEX_MAGIC = b"SANTIDX1"
+INDEX_ENTRY = struct.Struct("<Q")
+
+
+def index_path(path: str) -> str:
+    """Returns the path of the offset index of the record file at *path*."""
+    return path + ".idx"
+
+
+def check_index(path: str, data: bytes) -> Tuple[int, int, bool]:
+    """
+    Read the offset index of the record file *path* with contents *data*, without writing to it.
+
+    Returns (valid entries, offset where their records end, whether the
+    index holds exactly those entries). A torn last entry and an entry
+    whose record is incomplete are not counted; an index pointing past
+    the data (e.g. a data file replaced by a shorter one) or a missing
+    or damaged index has no valid entries.
+    """
+    size = len(data)
+    try:
+        index = open(index_path(path), "rb")
+    except FileNotFoundError:
+        return 0, len(FILE_MAGIC), False
+    with index:
+        index_size = os.fstat(index.fileno()).st_size
+        if index.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+            return 0, len(FILE_MAGIC), False
+        entries = (index_size - len(INDEX_MAGIC)) // INDEX_ENTRY.size
+        exact = index_size == len(INDEX_MAGIC) + entries * INDEX_ENTRY.size
+        if not entries:
+            return 0, len(FILE_MAGIC), exact
+        index.seek(len(INDEX_MAGIC) + (entries - 1) * INDEX_ENTRY.size)
+        (last,) = INDEX_ENTRY.unpack(index.read(INDEX_ENTRY.size))
+    if last + RECORD_LENGTH.size > size:
+        return 0, len(FILE_MAGIC), False
+    end = last + RECORD_LENGTH.size + RECORD_LENGTH.unpack_from(data, last)[0]
+    if end > size:
+        # The last indexed record is incomplete; the one before it ends where it starts
+        return entries - 1, last, False
+    return entries, end, exact
+
+
+def scan_records(data: bytes, offset: int) -> Tuple[bytearray, int]:
+    """
+    Returns the index entries of the complete records in *data* from *offset* on, and where they end.
+
+    Only the length prefixes are read; a half-written record at the end
+    of the data is left out.
+    """
+    size = len(data)
+    entries = bytearray()
+    unpack_length = RECORD_LENGTH.unpack_from
+    header = RECORD_LENGTH.size
+    while offset + header <= size:
+        end = offset + header + unpack_length(data, offset)[0]
+        if end > size:
+            break
+        entries += INDEX_ENTRY.pack(offset)
+        offset = end
+    return entries, offset
+
+
+def update_index(path: str) -> Tuple[int, int]:
+    """
+    Bring the offset index of a record file up to date and return (records, end offset).
+
+    Only the records after the last indexed one are scanned, and the
+    index is only written when it does not already cover them: new
+    entries are appended, and a damaged index (or one with entries to
+    drop) is rewritten to a temporary file that replaces it. The end
+    offset is where the complete records stop.
+    """
+    with open(path, "rb") as file:
+        if file.read(len(FILE_MAGIC)) != FILE_MAGIC:
+            raise ValueError(f"{path} is not a game record file.")
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            entries, offset, exact = check_index(path, data)
+            new_entries, end = scan_records(data, offset)
+
+    index_file = index_path(path)
+    if exact:
+        if new_entries:
+            with open(index_file, "ab") as index:
+                index.write(new_entries)
+    else:
+        kept = b""
+        if entries:
+            with open(index_file, "rb") as index:
+                index.seek(len(INDEX_MAGIC))
+                kept = index.read(entries * INDEX_ENTRY.size)
+        temporary = index_file + ".tmp"
+        with open(temporary, "wb") as index:
+            index.write(INDEX_MAGIC + kept + new_entries)
+        os.replace(temporary, index_file)
+    return entries + len(new_entries) // INDEX_ENTRY.size, end
@@ -0,0 +1,144 @@
+import mmap
+from typing import Iterator, Optional
+
+from colors.color import Color
+from core.game import Game
+from core.player import Player
+from game_modes.replay_game_mode import ReplayGameMode
+from god_cards.god_card_factory import GodCardFactory
+from records.game_record import FILE_MAGIC, RECORD_LENGTH, RecordedGame, decode_game
+from records.record_index import INDEX_ENTRY, INDEX_MAGIC, check_index, index_path, scan_records
+from win_conditions.standard_win_condition import StandardWinCondition
+
+
+PLAYER_COLORS = (Color.RED, Color.BLUE)
+
+
+def replay_game(record: RecordedGame, turn: Optional[int] = None) -> Game:
+    """
+    Rebuild a recorded game after its first *turn* turns (all of them by default).
+
+    The recorded setup is placed by a ReplayGameMode and the stored turns
+    are played through the game's turn manager, so the returned Game and
+    its board are exactly as they were at that point, with the next
+    player to move.
+    """
+    turns = record.turns if turn is None else record.turns[:turn]
+    if turn is not None and not 0 <= turn <= len(record.turns):
+        raise IndexError(f"Turn {turn} is outside the game's {len(record.turns)} turns.")
+
+    players = [Player(f"Player {seat + 1}", 0, color, god_card=GodCardFactory.create_card(card), timer_seconds=None)
+               for seat, (card, color) in enumerate(zip(record.cards, PLAYER_COLORS))]
+    game = Game(players, record.width, record.height, game_mode=ReplayGameMode(record.workers, record.buildings),
+                win_condition=StandardWinCondition(), seed=record.seed or None)
+    for played in turns:
+        game.turn_manager.play_turn(played)
+    return game
+
+
+class ReplayArchive:
+    """
+    Read-only archive of recorded games over a record file and its offset index.
+
+    Both files are memory-mapped: game i is found with one lookup in the
+    fixed-width index and decoded straight from the mapped data, so any
+    game is fetched in O(1) whatever the size of the archive. Iteration
+    walks the data file in order without the index. The archive never
+    writes: records the index does not cover yet (appended since the
+    writer last flushed, or every record of a file without an index) are
+    indexed in memory when it is opened, so an archive can be opened on
+    read-only files and while a writer is still appending.
+
+    record_bytes() and iter_record_bytes() return views into the mapped
+    file rather than copies. A view stays readable after close(), which
+    then leaves the mapping to be released once the last view is
+    dropped; copy a record with bytes() to keep it independent of the
+    archive.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open the record file at *path* and its index."""
+        self._data_file = open(path, "rb")
+        if self._data_file.read(len(FILE_MAGIC)) != FILE_MAGIC:
+            self._data_file.close()
+            raise ValueError(f"{path} is not a game record file.")
+        self._data = mmap.mmap(self._data_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._data)
+        self._indexed, offset, _ = check_index(path, self._data)
+        self._tail, self._end = scan_records(self._data, offset)
+        self._count = self._indexed + len(self._tail) // INDEX_ENTRY.size
+        self._index_file = None
+        self._index = None
+        if self._indexed:
+            self._index_file = open(index_path(path), "rb")
+            self._index = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        """Returns the number of games in the archive."""
+        return self._count
+
+    def record_bytes(self, game_id: int) -> memoryview:
+        """Returns the encoded record of game *game_id* as a view into the mapped file (no copy, see close())."""
+        if not 0 <= game_id < self._count:
+            raise IndexError(f"Game {game_id} is not in the archive of {self._count} games.")
+        if game_id < self._indexed:
+            (offset,) = INDEX_ENTRY.unpack_from(self._index, len(INDEX_MAGIC) + game_id * INDEX_ENTRY.size)
+        else:
+            (offset,) = INDEX_ENTRY.unpack_from(self._tail, (game_id - self._indexed) * INDEX_ENTRY.size)
+        (length,) = RECORD_LENGTH.unpack_from(self._data, offset)
+        start = offset + RECORD_LENGTH.size
+        return self._view[start:start + length]
+
+    def __getitem__(self, game_id: int) -> RecordedGame:
+        """Returns game *game_id*."""
+        return decode_game(self.record_bytes(game_id))
+
+    def iter_record_bytes(self) -> Iterator[memoryview]:
+        """Yield the encoded record of every game in order, as views into the mapped file."""
+        data = self._data
+        view = self._view
+        unpack_length = RECORD_LENGTH.unpack_from
+        header = RECORD_LENGTH.size
+        offset = len(FILE_MAGIC)
+        while offset < self._end:
+            start = offset + header
+            offset = start + unpack_length(data, offset)[0]
+            yield view[start:offset]
+
+    def __iter__(self) -> Iterator[RecordedGame]:
+        """Yield every game in order."""
+        for record in self.iter_record_bytes():
+            yield decode_game(record)
+
+    def replay(self, game_id: int, turn: Optional[int] = None) -> Game:
+        """Returns game *game_id* rebuilt after its first *turn* turns (see replay_game)."""
+        return replay_game(self[game_id], turn)
+
+    def close(self) -> None:
+        """
+        Close the archive's files and unmap them.
+
+        A record view still held by the caller keeps the data mapping
+        alive; it is unmapped when the last such view is dropped.
+        """
+        if self._data_file.closed:
+            return
+        self._view.release()
+        self._data_file.close()
+        if self._index is not None:
+            self._index.close()
+            self._index_file.close()
+        try:
+            self._data.close()
+        except BufferError:
+            # The views handed out hold the mapping; drop ours so it goes with them
+            pass
+        self._data = None
+
+    def __enter__(self) -> 'ReplayArchive':
+        """Use the archive as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the archive when leaving the context."""
+        self.close()
@@ -0,0 +1,149 @@
+import random
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from ai.alpha_beta_search import AlphaBetaSearch
+from ai.evaluator import Evaluator
+from ai.mcts_search import MCTSSearch
+from engine.santorini_engine import SantoriniEngine
+from game_management.turn import Turn
+
+
+class Agent(ABC):
+    """A headless player that picks the turn of the player to move in a SantoriniEngine game."""
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Returns the agent's name as written on the command line."""
+        pass
+
+    @abstractmethod
+    def choose_turn(self, engine: SantoriniEngine) -> Turn:
+        """Returns the turn to play for engine.current_player; the game is not over."""
+        pass
+
+    @staticmethod
+    def _side(engine: SantoriniEngine) -> int:
+        """Returns the seat index of the player to move."""
+        return engine.players.index(engine.current_player)
+
+
+class RandomAgent(Agent):
+    """Plays a uniformly random legal turn."""
+
+    def __init__(self, rng: random.Random) -> None:
+        """Initialize the agent with its random source."""
+        self._rng = rng
+
+    @property
+    def name(self) -> str:
+        """Returns the agent's name."""
+        return "random"
+
+    def choose_turn(self, engine: SantoriniEngine) -> Turn:
+        """Returns a random legal turn."""
+        return self._rng.choice(engine.legal_turns())
+
+
+class GreedyAgent(Agent):
+    """Plays a winning turn if there is one, otherwise the turn whose position scores best (one turn deep)."""
+
+    def __init__(self, rng: random.Random, evaluator: Optional[Evaluator] = None) -> None:
+        """Initialize the agent; *rng* breaks ties between equally scored turns."""
+        self._rng = rng
+        self._evaluator = evaluator or Evaluator()
+
+    @property
+    def name(self) -> str:
+        """Returns the agent's name."""
+        return "greedy"
+
+    def choose_turn(self, engine: SantoriniEngine) -> Turn:
+        """Returns the best turn by static evaluation."""
+        side = self._side(engine)
+        color = engine.players[side].player_color
+        opponent = engine.players[1 - side].player_color
+        state = engine.board.state
+        best: List[Turn] = []
+        best_score = None
+        for turn in engine.iter_legal_turns():
+            if turn.is_win:
+                return turn
+            if state.threats_against(color):
+                # Leaving the opponent a climb onto level 3 loses at once
+                score = -AlphaBetaSearch.WIN_SCORE
+            else:
+                score = self._evaluator.evaluate(state, color, opponent)
+            if best_score is None or score > best_score:
+                best, best_score = [turn], score
+            elif score == best_score:
+                best.append(turn)
+        return self._rng.choice(best)
+
+
+class AlphaBetaAgent(Agent):
+    """Plays the turn chosen by an alpha-beta search to a fixed depth."""
+
+    DEFAULT_DEPTH = 2
+
+    def __init__(self, depth: int = DEFAULT_DEPTH) -> None:
+        """Initialize the agent with its search depth in turns."""
+        self._depth = depth
+        self._search = AlphaBetaSearch()
+
+    @property
+    def name(self) -> str:
+        """Returns the agent's name."""
+        return f"alphabeta:{self._depth}"
+
+    def choose_turn(self, engine: SantoriniEngine) -> Turn:
+        """Returns the best turn found by the search."""
+        result = self._search.search(engine.players, self._side(engine), engine.board, max_depth=self._depth)
+        return result.turn
+
+
+class MCTSAgent(Agent):
+    """Plays the turn chosen by Monte Carlo tree search with a fixed playout budget."""
+
+    DEFAULT_PLAYOUTS = 500
+
+    def __init__(self, rng: random.Random, playouts: int = DEFAULT_PLAYOUTS) -> None:
+        """Initialize the agent with its playout budget; *rng* seeds the playouts."""
+        self._playouts = playouts
+        self._search = MCTSSearch(seed=rng.getrandbits(32))
+
+    @property
+    def name(self) -> str:
+        """Returns the agent's name."""
+        return f"mcts:{self._playouts}"
+
+    def choose_turn(self, engine: SantoriniEngine) -> Turn:
+        """Returns the most visited turn of the search."""
+        result = self._search.search(engine.players, self._side(engine), engine.board, playouts=self._playouts)
+        return result.turn
+
+
+AGENT_TYPES = ("random", "greedy", "alphabeta", "mcts")
+
+
+def create_agent(spec: str, rng: random.Random) -> Agent:
+    """
+    Create an agent from a command-line spec.
+
+    The spec is a type from AGENT_TYPES with an optional strength after a
+    colon: the search depth for alphabeta, the playouts per turn for mcts
+    (e.g. "alphabeta:3", "mcts:2000").
+    """
+    kind, _, strength = spec.partition(":")
+    if kind not in AGENT_TYPES or (strength and kind in ("random", "greedy")):
+        raise ValueError(f"Unknown agent: {spec} (expected one of {', '.join(AGENT_TYPES)}, e.g. alphabeta:3)")
+    if strength and not strength.isdigit():
+        raise ValueError(f"Agent strength must be a whole number: {spec}")
+    if kind == "random":
+        return RandomAgent(rng)
+    if kind == "greedy":
+        return GreedyAgent(rng)
+    if kind == "alphabeta":
+        return AlphaBetaAgent(int(strength) if strength else AlphaBetaAgent.DEFAULT_DEPTH)
+    return MCTSAgent(rng, int(strength) if strength else MCTSAgent.DEFAULT_PLAYOUTS)
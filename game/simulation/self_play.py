@@ -0,0 +1,219 @@
+import argparse
+import multiprocessing
+import random
+import time
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+from engine.santorini_engine import SantoriniEngine
+from records.game_record import encode_game
+from records.game_record_writer import RecordWriterProcess
+from records.game_recorder import GameRecorder
+from simulation.agents import AGENT_TYPES, create_agent
+
+
+# Queue of the record writer process, set in each pool worker when games are recorded
+_record_queue: Optional[multiprocessing.Queue] = None
+
+
+class SelfPlayResult:
+    """Outcome of one headless game."""
+
+    __slots__ = ("_index", "_agents", "_cards", "_winner", "_turns", "_adjudicated", "_elapsed")
+
+    def __init__(self, index: int, agents: Tuple[int, int], cards: Tuple[str, str], winner: Optional[int],
+                 turns: int, adjudicated: bool, elapsed: float) -> None:
+        """Initialize the result of a finished game."""
+        self._index = index
+        self._agents = agents
+        self._cards = cards
+        self._winner = winner
+        self._turns = turns
+        self._adjudicated = adjudicated
+        self._elapsed = elapsed
+
+    @property
+    def index(self) -> int:
+        """Returns the game's number within its run."""
+        return self._index
+
+    @property
+    def agents(self) -> Tuple[int, int]:
+        """Returns which agent (0 or 1) sat in each seat."""
+        return self._agents
+
+    @property
+    def cards(self) -> Tuple[str, str]:
+        """Returns the god card of each seat."""
+        return self._cards
+
+    @property
+    def winner(self) -> Optional[int]:
+        """Returns the winning seat, or None if the game hit the turn limit."""
+        return self._winner
+
+    @property
+    def winning_agent(self) -> Optional[int]:
+        """Returns the winning agent (0 or 1), or None."""
+        return None if self._winner is None else self._agents[self._winner]
+
+    @property
+    def turns(self) -> int:
+        """Returns the number of turns played."""
+        return self._turns
+
+    @property
+    def adjudicated(self) -> bool:
+        """Returns True if the endgame solver decided the game before it was played out."""
+        return self._adjudicated
+
+    @property
+    def elapsed(self) -> float:
+        """Returns the time the game took in seconds."""
+        return self._elapsed
+
+
+def play_game(index: int, agent_specs: Sequence[str], seed: str, card_names: Optional[Sequence[str]] = None,
+              max_turns: int = 200, adjudicate: int = 0, recorder: Optional[GameRecorder] = None) -> SelfPlayResult:
+    """
+    Play one complete game between two agents; agent 0 takes the first seat in even games.
+
+    The game is created with *seed*, which fixes the worker placement, the
+    god card draw (without *card_names*) and the agents' random choices, so
+    every game can be replayed. With *adjudicate* > 0 the
+    endgame solver is asked before every turn whether the player to move
+    forces a win within that many turns, and a proven win ends the game.
+    A *recorder* records the game's setup and turns.
+    """
+    start = time.perf_counter()
+    seats = (0, 1) if index % 2 == 0 else (1, 0)
+    engine = SantoriniEngine(list(card_names) if card_names else None, seed=seed, recorder=recorder)
+    rng = random.Random(engine.game.rng.getrandbits(64))
+    agents = [create_agent(agent_specs[agent], rng) for agent in seats]
+
+    winner: Optional[int] = None
+    adjudicated = False
+    while not engine.is_over() and engine.turn_count < max_turns:
+        side = engine.players.index(engine.current_player)
+        if adjudicate and engine.solve(adjudicate).is_win:
+            winner, adjudicated = side, True
+            break
+        engine.apply_turn(agents[side].choose_turn(engine))
+    if engine.is_over():
+        winner = engine.players.index(engine.result())
+
+    cards = tuple(player.god_card.name for player in engine.players)
+    return SelfPlayResult(index, seats, cards, winner, engine.turn_count, adjudicated, time.perf_counter() - start)
+
+
+def _init_worker(record_queue: Optional[multiprocessing.Queue]) -> None:
+    """Pool initializer: remember the record writer's queue, if games are recorded."""
+    global _record_queue
+    _record_queue = record_queue
+
+
+def _play_task(task: tuple) -> SelfPlayResult:
+    """Pool worker: play one game described by a task tuple, handing its record to the writer."""
+    recorder = GameRecorder() if _record_queue is not None else None
+    result = play_game(*task, recorder=recorder)
+    if recorder is not None:
+        _record_queue.put(encode_game(recorder.finish(result.winner)))
+    return result
+
+
+def run_games(tasks: Iterable[tuple], processes: Optional[int] = None,
+              record_queue: Optional[multiprocessing.Queue] = None) -> Iterator[SelfPlayResult]:
+    """
+    Play games across a process pool, yielding each result as soon as its game ends.
+
+    Each task holds the play_game() arguments. Games finish out of order.
+    With a *record_queue* (see RecordWriterProcess) every worker puts the
+    encoded record of each game on it.
+    """
+    with multiprocessing.Pool(processes or multiprocessing.cpu_count(), initializer=_init_worker,
+                              initargs=(record_queue,)) as pool:
+        yield from pool.imap_unordered(_play_task, tasks)
+
+
+class SelfPlaySummary:
+    """Running totals of a self-play run, so results need not be kept however many games are played."""
+
+    def __init__(self, agent_specs: Sequence[str]) -> None:
+        """Initialize empty totals for the two agents."""
+        self._agent_specs = agent_specs
+        self._games = 0
+        self._turns = 0
+        self._min_turns: Optional[int] = None
+        self._max_turns = 0
+        self._unfinished = 0
+        self._adjudicated = 0
+        self._first_seat = 0
+        self._agent_wins = [0] * len(agent_specs)
+
+    def add(self, result: SelfPlayResult) -> None:
+        """Count one finished game."""
+        self._games += 1
+        self._turns += result.turns
+        self._min_turns = result.turns if self._min_turns is None else min(self._min_turns, result.turns)
+        self._max_turns = max(self._max_turns, result.turns)
+        self._unfinished += result.winner is None
+        self._adjudicated += result.adjudicated
+        self._first_seat += result.winner == 0
+        if result.winning_agent is not None:
+            self._agent_wins[result.winning_agent] += 1
+
+    def report(self, elapsed: float, processes: int) -> str:
+        """Returns the report of the run."""
+        games = self._games
+        labels = [f"agent {i + 1} ({spec})" for i, spec in enumerate(self._agent_specs)]
+        width = max(len(label) for label in labels)
+        lines = [
+            f"Played {games} games in {elapsed:.1f}s ({games / elapsed:.2f} games/s on {processes} processes)",
+            f"Average length: {self._turns / games:.1f} turns (min {self._min_turns}, max {self._max_turns}); "
+            f"{self._unfinished} hit the turn limit, {self._adjudicated} adjudicated by the solver",
+        ]
+        for wins, label in zip(self._agent_wins, labels):
+            lines.append(f"{label:<{width}}: {wins:6d} wins ({wins / games:6.1%})")
+        lines.append(f"{'first seat':<{width}}: {self._first_seat:6d} wins ({self._first_seat / games:6.1%})")
+        return "\n".join(lines)
+
+
+def main() -> None:
+    """Entry point for the self-play simulator."""
+    parser = argparse.ArgumentParser(description="Play headless games between computer agents across all cores.")
+    parser.add_argument("--games", type=int, default=100, help="number of games to play")
+    parser.add_argument("--agents", nargs=2, default=["random", "random"], metavar="AGENT",
+                        help=f"the two agents: {', '.join(AGENT_TYPES)}, with an optional strength "
+                             f"(alphabeta:DEPTH, mcts:PLAYOUTS); they swap seats every game")
+    parser.add_argument("--cards", nargs=2, metavar="CARD",
+                        help="god card of each seat (default: drawn from the deck every game)")
+    parser.add_argument("--processes", type=int, default=multiprocessing.cpu_count(), help="worker processes")
+    parser.add_argument("--max-turns", type=int, default=200, help="turns after which a game is abandoned")
+    parser.add_argument("--adjudicate", type=int, default=0, metavar="PLIES",
+                        help="end a game once the solver proves a forced win within PLIES turns (0 = off)")
+    parser.add_argument("--seed", type=int, default=1, help="seed for placement, card draws and agents")
+    parser.add_argument("--record", metavar="PATH", help="append a binary record of every game to this file")
+    args = parser.parse_args()
+
+    for spec in args.agents:
+        try:
+            create_agent(spec, random.Random())
+        except ValueError as error:
+            parser.error(str(error))
+
+    # A generator, so the pool takes tasks as workers free up rather than all at once
+    tasks = ((index, args.agents, f"{args.seed}:{index}", args.cards, args.max_turns, args.adjudicate)
+             for index in range(args.games))
+    summary = SelfPlaySummary(args.agents)
+    writer = RecordWriterProcess(args.record) if args.record else None
+    start = time.perf_counter()
+    try:
+        for result in run_games(tasks, args.processes, writer.queue if writer else None):
+            summary.add(result)
+    finally:
+        if writer is not None:
+            writer.close()
+    print(summary.report(time.perf_counter() - start, args.processes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+import argparse
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import random
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from god_cards.god_card_factory import GodCardFactory
+from simulation.agents import AGENT_TYPES, create_agent
+from simulation.self_play import SelfPlayResult, run_games
+
+
+def wilson_interval(wins: int, games: int, z: float = 1.96) -> Tuple[float, float]:
+    """Returns the Wilson score interval of a win rate (95% for the default z)."""
+    if games == 0:
+        return 0.0, 1.0
+    rate = wins / games
+    denominator = 1 + z * z / games
+    centre = (rate + z * z / (2 * games)) / denominator
+    margin = z * math.sqrt(rate * (1 - rate) / games + z * z / (4 * games * games)) / denominator
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+class MatchupTable:
+    """
+    Win counts of every god card against every other one.
+
+    Games are counted per card, whichever seat it played from; a game
+    that hit the turn limit counts for neither card.
+    """
+
+    def __init__(self, cards: List[str]) -> None:
+        """Initialize an empty table for the given cards."""
+        self._cards = cards
+        self._wins: Dict[Tuple[str, str], int] = {}
+        self._games: Dict[Tuple[str, str], int] = {}
+        self._total = 0
+
+    @property
+    def total(self) -> int:
+        """Returns the number of games added."""
+        return self._total
+
+    def add(self, cards: Tuple[str, str], winner: Optional[int]) -> None:
+        """Count one game between the seats' *cards* won by seat *winner* (None = undecided)."""
+        self._total += 1
+        if winner is None:
+            return
+        for card, opponent in (cards, cards[::-1]):
+            self._games[card, opponent] = self._games.get((card, opponent), 0) + 1
+        self._wins[cards[winner], cards[1 - winner]] = self._wins.get((cards[winner], cards[1 - winner]), 0) + 1
+
+    def win_rate(self, card: str, opponent: str) -> Tuple[float, float, float, int]:
+        """Returns (win rate, interval low, interval high, decided games) of *card* against *opponent*."""
+        games = self._games.get((card, opponent), 0)
+        wins = self._wins.get((card, opponent), 0)
+        low, high = wilson_interval(wins, games)
+        return (wins / games if games else 0.0), low, high, games
+
+    def format(self) -> str:
+        """Returns the win-rate matrix: row card against column card, with 95% intervals."""
+        cell = 22
+        name_width = max(len(card) for card in self._cards)
+        lines = [" " * name_width + "".join(f"{card:>{cell}}" for card in self._cards)]
+        for card in self._cards:
+            row = f"{card:<{name_width}}"
+            for opponent in self._cards:
+                rate, low, high, games = self.win_rate(card, opponent)
+                if card == opponent or games == 0:
+                    row += f"{'-':>{cell}}"
+                else:
+                    row += f"{f'{rate:5.1%} [{low:4.0%}-{high:4.0%}]':>{cell}}"
+            lines.append(row)
+        return "\n".join(lines)
+
+
+class TournamentCheckpoint:
+    """
+    Append-only JSON-lines file of finished tournament games.
+
+    The first line records the tournament settings; each further line is
+    one game, written and flushed as soon as the game ends, so an
+    interrupted run loses at most the games still being played. A
+    half-written last line (from a crash mid-write) is ignored on resume.
+    """
+
+    def __init__(self, path: str, settings: dict) -> None:
+        """Open (or create) the checkpoint at *path* for a tournament with these settings."""
+        self._path = path
+        self._settings = settings
+        self._file = None
+
+    def load(self) -> List[dict]:
+        """
+        Returns the games already recorded.
+
+        Raises ValueError if the file belongs to a tournament with other
+        settings, since mixing the two would skew the matrix.
+        """
+        if not os.path.exists(self._path):
+            return []
+        games = []
+        with open(self._path, encoding="utf-8") as file:
+            lines = file.read().splitlines()
+        for number, line in enumerate(lines):
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                if number == len(lines) - 1:
+                    break
+                raise ValueError(f"{self._path}: line {number + 1} is not valid JSON")
+            if number == 0:
+                if entry.get("settings") != self._settings:
+                    raise ValueError(f"{self._path} was written by a tournament with other settings: "
+                                     f"{entry.get('settings')}")
+            else:
+                games.append(entry)
+        return games
+
+    def open(self) -> None:
+        """Open the file for appending, writing the settings line to a new file."""
+        if os.path.exists(self._path):
+            # Drop a half-written last line so the next game starts on a line of its own
+            with open(self._path, "rb+") as file:
+                data = file.read()
+                if data and not data.endswith(b"\n"):
+                    file.truncate(data.rfind(b"\n") + 1)
+        is_new = not os.path.exists(self._path) or os.path.getsize(self._path) == 0
+        self._file = open(self._path, "a", encoding="utf-8")
+        if is_new:
+            self._write({"settings": self._settings})
+
+    def append(self, game: dict) -> None:
+        """Record one finished game."""
+        self._write(game)
+
+    def close(self) -> None:
+        """Close the file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _write(self, entry: dict) -> None:
+        """Write one line and push it to disk."""
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+
+
+def pairings(cards: List[str]) -> List[Tuple[str, str]]:
+    """Returns every pairing of two different cards, each once."""
+    return list(itertools.combinations(cards, 2))
+
+
+def game_entry(result: SelfPlayResult) -> dict:
+    """Returns the checkpoint line of a finished tournament game, with cards by factory name."""
+    cards = [card.lower() for card in result.cards]
+    return {"pairing": sorted(cards), "game": result.index, "cards": cards,
+            "winner": result.winner, "turns": result.turns}
+
+
+def main() -> None:
+    """Entry point for the god card tournament."""
+    parser = argparse.ArgumentParser(description="Round-robin god card tournament with a win-rate matrix.")
+    parser.add_argument("--games", type=int, default=100, help="games per card pairing (seats alternate)")
+    parser.add_argument("--agent", default="greedy",
+                        help=f"agent playing every seat: {', '.join(AGENT_TYPES)} (alphabeta:DEPTH, mcts:PLAYOUTS)")
+    parser.add_argument("--processes", type=int, default=multiprocessing.cpu_count(), help="worker processes")
+    parser.add_argument("--max-turns", type=int, default=200, help="turns after which a game is abandoned")
+    parser.add_argument("--seed", type=int, default=1, help="seed for placement and agents")
+    parser.add_argument("--checkpoint", default="tournament.jsonl",
+                        help="results file; an existing one is resumed")
+    parser.add_argument("--report-every", type=int, default=100, help="print the matrix after this many games")
+    args = parser.parse_args()
+
+    try:
+        create_agent(args.agent, random.Random())
+    except ValueError as error:
+        parser.error(str(error))
+    if args.report_every < 1:
+        parser.error("--report-every must be at least 1")
+
+    cards = GodCardFactory.get_available_card_names()
+    settings = {"cards": cards, "games": args.games, "agent": args.agent,
+                "max_turns": args.max_turns, "seed": args.seed}
+    checkpoint = TournamentCheckpoint(args.checkpoint, settings)
+    try:
+        finished = checkpoint.load()
+    except ValueError as error:
+        parser.error(str(error))
+
+    table = MatchupTable(cards)
+    done: Set[Tuple[Tuple[str, ...], int]] = set()
+    for entry in finished:
+        table.add(tuple(entry["cards"]), entry["winner"])
+        done.add((tuple(entry["pairing"]), entry["game"]))
+
+    # Every game has a fixed seed and seating, so a resumed run plays exactly the missing games
+    tasks = [(game, (args.agent, args.agent), f"{args.seed}:{first}:{second}:{game}",
+              (first, second) if game % 2 == 0 else (second, first), args.max_turns)
+             for first, second in pairings(cards) for game in range(args.games)
+             if (tuple(sorted((first, second))), game) not in done]
+    total = len(done) + len(tasks)
+    print(f"{len(cards)} cards, {len(pairings(cards))} pairings, {total} games "
+          f"({len(done)} already in {args.checkpoint})", flush=True)
+
+    start = time.perf_counter()
+    played = 0
+    checkpoint.open()
+    try:
+        for result in run_games(tasks, args.processes):
+            entry = game_entry(result)
+            checkpoint.append(entry)
+            table.add(tuple(entry["cards"]), entry["winner"])
+            played += 1
+            if played % args.report_every == 0 and played < len(tasks):
+                rate = played / (time.perf_counter() - start)
+                print(f"\n{table.total}/{total} games ({rate:.2f} games/s)\n{table.format()}", flush=True)
+    except KeyboardInterrupt:
+        print(f"\nInterrupted after {table.total}/{total} games; run again to resume.")
+    finally:
+        checkpoint.close()
+    print(f"\nFinal: {table.total}/{total} games\n{table.format()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -82,7 +82,7 @@ class GameScreen(BaseScreen):
         # Skip button - always shown on bottom left
         game = self.app.get_game()
         skip_rect = pygame.Rect(50, self.app.WINDOW_HEIGHT - 60, 120, 50)
-        if skip_rect.collidepoint(pos) and game and game.current_phase_optional():
+        if skip_rect.collidepoint(pos) and game and game.current_phase_optional() and not game.is_computer_turn():
             game.skip_phase()
             return True
         
@@ -133,6 +133,10 @@ class GameScreen(BaseScreen):
         if not game:
             return
         
+        # The board belongs to the computer while it is thinking
+        if not self.app.is_tutorial_mode() and game.is_computer_turn():
+            return
+        
         feedback = game.click_cell(board_x, board_y)
         
         if feedback:
@@ -157,6 +161,30 @@ class GameScreen(BaseScreen):
         game = self.app.get_game()
         if game and not self.app.is_tutorial_mode():
             self._check_timer_expiration()
+            if self.app.screen_manager.get_current_screen_type() == ScreenType.GAME and game.is_computer_turn():
+                self._update_computer_turn()
+
+    def _update_computer_turn(self) -> None:
+        """Start the computer's search in the background, and play its turn once the search is done."""
+        game = self.app.get_game()
+        game.request_computer_turn()
+        if not game.poll_computer_turn():
+            # A computer player without any legal turn loses
+            winner = game.no_turn_winner()
+            if winner:
+                self.app.handle_game_over(f"{winner.player_name} wins!")
+            return
+        
+        game_result = game.turn_manager.get_game_result()
+        if game_result:
+            self.app.handle_game_over(f"{game_result.player_name} wins!")
+    
+    def on_exit(self) -> None:
+        """Cancel the computer's search and stop its background work when leaving the game (ESC or menu)."""
+        game = self.app.get_game()
+        if game and not self.app.is_tutorial_mode():
+            game.cancel_computer_turn()
+            game.stop_computer_players()
     
     def _check_timer_expiration(self) -> None:
         """Check for timer expiration in standard games."""
@@ -259,12 +287,18 @@ class GameScreen(BaseScreen):
         board_offset_x = int(0.3 * self.app.WINDOW_WIDTH - (self.app.BOARD_W * self.app.TILE_SIZE) // 2)
         board_offset_y = (self.app.WINDOW_HEIGHT - (self.app.BOARD_H * self.app.TILE_SIZE)) // 2
         
+        danger = game.danger_mask()
         for y in range(self.app.BOARD_H):
             for x in range(self.app.BOARD_W):
                 tile_x = board_offset_x + x * self.app.TILE_SIZE
                 tile_y = board_offset_y + y * self.app.TILE_SIZE
                 
                 self._render_tile(surface, board, x, y, tile_x, tile_y)
+                
+                # Danger square: an opponent wins by moving here next turn
+                if (danger >> board.state.index(x, y)) & 1:
+                    tile_rect = pygame.Rect(tile_x, tile_y, self.app.TILE_SIZE, self.app.TILE_SIZE)
+                    pygame.draw.rect(surface, self.app.RED, tile_rect.inflate(-6, -6), 4)
     
     def _render_tile(self, surface: pygame.Surface, board, x: int, y: int, tile_x: int, tile_y: int) -> None:
         """Render a single tile on the game board using grass images."""
@@ -426,6 +460,13 @@ class GameScreen(BaseScreen):
         
         phase_surface = self.app.medium_font.render(phase_text, True, self.app.BLACK)
         surface.blit(phase_surface, (50, 150))
+        
+        # Thinking indicator with animated dots while the computer searches
+        if game.is_computer_thinking():
+            dots = "." * (pygame.time.get_ticks() // 400 % 4)
+            thinking_text = f"{game.current_player_name} is thinking{dots}"
+            thinking_surface = self.app.medium_font.render(thinking_text, True, self.app.NAVY)
+            surface.blit(thinking_surface, (50, 185))
     
     def _render_god_cards(self, surface: pygame.Surface) -> None:
         """Render current player's god card large on the right side of the screen."""
@@ -4,6 +4,7 @@ from ui.base_screen import BaseScreen
 from ui.screen_enums import ScreenType
 from colors.color import Color
 from core.player import Player
+from ai.ai_player import AIPlayer
 from core.game import Game
 from game_modes.standard_game_mode import StandardGameMode
 from game_modes.tutorial_game_mode import TutorialGameMode
@@ -74,6 +75,7 @@ class SetupScreen(BaseScreen):
         self._handle_timer_selection_click(pos)
         self._handle_name_input_click(pos)
         self._handle_color_selection_click(pos)
+        self._handle_computer_toggle_click(pos)
     
     def _handle_timer_selection_click(self, pos: Tuple[int, int]) -> None:
         """Handle timer duration selection clicks."""
@@ -120,6 +122,12 @@ class SetupScreen(BaseScreen):
         elif p2_blue_rect.collidepoint(pos):
             self.app.set_player_color(2, Color.BLUE)
     
+    def _handle_computer_toggle_click(self, pos: Tuple[int, int]) -> None:
+        """Handle the Human/Computer toggle for player 2 (y_offset=630 + 75 = 705)."""
+        toggle_rect = pygame.Rect(self.app.WINDOW_WIDTH//2 + 60, 705, 110, 28)
+        if toggle_rect.collidepoint(pos):
+            self.app.set_player_computer(2, not self.app.is_player_computer(2))
+    
     def _handle_start_button_click(self, pos: Tuple[int, int]) -> bool:
         """Handle start game button click."""
         start_rect = pygame.Rect(self.app.WINDOW_WIDTH//2 - 100, 800, 200, 50)
@@ -310,6 +318,23 @@ class SetupScreen(BaseScreen):
         
         # Color buttons
         self._render_color_buttons(surface, player_num, y_offset + 110)
+        
+        # Player 2 can be played by the computer
+        if player_num == 2:
+            self._render_computer_toggle(surface, y_offset + 75)
+    
+    def _render_computer_toggle(self, surface: pygame.Surface, y_pos: int) -> None:
+        """Render the Human/Computer toggle button for player 2."""
+        toggle_rect = pygame.Rect(self.app.WINDOW_WIDTH//2 + 60, y_pos, 110, 28)
+        is_computer = self.app.is_player_computer(2)
+        toggle_color = self.app.NAVY if is_computer else self.app.LIGHT_GRAY
+        pygame.draw.rect(surface, toggle_color, toggle_rect, border_radius=8)
+        pygame.draw.rect(surface, self.app.BLACK, toggle_rect, 2, border_radius=8)
+        
+        label = "Computer" if is_computer else "Human"
+        toggle_text = self.app.small_font.render(label, True, self.app.WHITE if is_computer else self.app.BLACK)
+        toggle_text_rect = toggle_text.get_rect(center=toggle_rect.center)
+        surface.blit(toggle_text, toggle_text_rect)
     
     def _render_color_buttons(self, surface: pygame.Surface, player_num: int, y_pos: int) -> None:
         """Render color selection buttons for a player with modern styling."""
@@ -464,12 +489,21 @@ class SetupScreen(BaseScreen):
             self.app.get_player_color(1), 
             timer_seconds=timer_seconds
         )
-        player2 = Player(
-            self.app.get_player_name(2).strip(), 
-            0, 
-            self.app.get_player_color(2), 
-            timer_seconds=timer_seconds
-        )
+        if self.app.is_player_computer(2):
+            player2 = AIPlayer(
+                self.app.get_player_name(2).strip(), 
+                0, 
+                self.app.get_player_color(2), 
+                timer_seconds=timer_seconds,
+                ponder=True
+            )
+        else:
+            player2 = Player(
+                self.app.get_player_name(2).strip(), 
+                0, 
+                self.app.get_player_color(2), 
+                timer_seconds=timer_seconds
+            )
         
         # Create game
         game_mode = StandardGameMode()
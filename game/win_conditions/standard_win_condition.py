@@ -16,23 +16,20 @@ class StandardWinCondition(WinConditionStrategy):
         if not worker:
             return False
             
-        # Get current tile and building level
-        current_tile = board.get_tile(worker.position)
-        building = current_tile.building
+        # Get current building level from the board's bitboard
+        state = board.state
+        position = worker.position
         
         # Must be on level 3 to potentially win
-        if not building or building.level != 3:
+        if state.level(state.index(position.x, position.y)) != 3:
             return False
             
         # Check previous position and level
         prev_pos = worker.previous_position
-        if not prev_pos:
+        if not prev_pos or not board.in_bounds(prev_pos):
             return False
             
-        prev_tile = board.get_tile(prev_pos)
-        prev_level = (prev_tile.building.level 
-                     if prev_tile and prev_tile.building 
-                     else 0)
+        prev_level = state.level(state.index(prev_pos.x, prev_pos.y))
         
         # Win if moved from level 2 to level 3
         return prev_level == 2
@@ -44,8 +41,7 @@ class StandardWinCondition(WinConditionStrategy):
         """
         # Check if any worker can move
         for worker in player.all_workers:
-            valid_moves = Validator.get_valid_move_tiles(worker, board)
-            if valid_moves:
+            if Validator.has_valid_move(worker, board):
                 return False  # At least one worker can move
                 
         return True  # No workers can move 
\ No newline at end of file